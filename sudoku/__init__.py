@@ -1,3 +1,5 @@
+from .frozen import FrozenPuzzle
 from .puzzle import Puzzle
+from .topology import Topology
 
-__all__ = ("Puzzle",)
+__all__ = ("FrozenPuzzle", "Puzzle", "Topology")
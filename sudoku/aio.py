@@ -0,0 +1,337 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+)
+
+from .puzzle import Puzzle
+from .solvers import Solver, StrategySolver
+
+if TYPE_CHECKING:
+    from .puzzle import T
+
+
+class SolveResult(NamedTuple):
+    """
+    The outcome of solving a single board
+
+    Attributes:
+        board (Sequence[T]): The board as it was submitted
+        solved (bool): Whether the board could be solved
+        solution (Optional[List[T]]): The solved board as a 1-dimensional list, or None if it could not be solved
+    """
+
+    board: Sequence[Any]
+    solved: bool
+    solution: Optional[List[Any]]
+
+
+def _solve_batch(boards: List[Sequence[T]], blank: T, solver: Type[Solver]) -> List[Union[SolveResult, Exception]]:
+    # The error of a board is returned in its place, so that it only fails the request of that board
+    results: List[Union[SolveResult, Exception]] = []
+    for board in boards:
+        try:
+            puzzle = Puzzle(board, blank)
+            solved = puzzle.solve(solver)
+            results.append(SolveResult(board, solved, puzzle.to_1D() if solved else None))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+class _Job:
+    __slots__ = "board", "future", "dispatched"
+
+    def __init__(self, board: Sequence[Any], future: asyncio.Future):
+        self.board = board
+        self.future = future
+        self.dispatched = False
+
+
+class SolveService:
+    """
+    Solve puzzles from asyncio code without blocking the event loop.
+
+    Boards are queued and dispatched to an executor in batches of up to `batch_size`, waiting at most `batch_delay`
+    seconds for a batch to fill, so that many small requests share the cost of a dispatch. At most `max_in_flight`
+    boards are queued or being solved at once, and further requests wait for a free slot, which applies
+    backpressure to callers. A request that times out or is cancelled before its batch is dispatched is dropped
+    from the batch; once dispatched, its result is discarded but the work itself cannot be interrupted.
+
+    ```python
+    async with SolveService(max_in_flight=128) as service:
+        result = await service.solve(board, timeout=1.0)
+        async for result in service.stream(boards):
+            ...
+    ```
+
+    Attributes:
+        blank (T): The value used to represent a blank cell in submitted boards
+        solver (Type[Solver]): The solver used for every board
+        max_in_flight (int): The maximum number of boards queued or being solved at once
+        batch_size (int): The maximum number of boards dispatched to the executor together
+        batch_delay (float): The longest time in seconds a board waits for its batch to fill
+    """
+
+    blank: Any
+    solver: Type[Solver]
+    max_in_flight: int
+    batch_size: int
+    batch_delay: float
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        *,
+        blank: Any = ".",
+        solver: Type[Solver] = StrategySolver,
+        max_in_flight: int = 64,
+        batch_size: int = 8,
+        batch_delay: float = 0.001,
+    ):
+        """
+        Args:
+            executor (Optional[Executor], optional): The thread or process pool used to solve boards.
+                Defaults to a process pool owned and shut down by the service.
+            blank (T, optional): The value used to represent a blank cell. Defaults to ".".
+            solver (Type[Solver], optional): The solver used for every board. Defaults to StrategySolver.
+            max_in_flight (int, optional): The maximum number of boards queued or being solved at once.
+                Defaults to 64.
+            batch_size (int, optional): The maximum number of boards dispatched together. Defaults to 8.
+            batch_delay (float, optional): The longest time in seconds a board waits for its batch to fill.
+                Defaults to 0.001.
+        """
+        self.blank = blank
+        self.solver = solver
+        self.max_in_flight = max_in_flight
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._pending: List[_Job] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """The number of boards currently queued or being solved"""
+        return self._in_flight
+
+    async def __aenter__(self) -> SolveService:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Cancel boards that have not been dispatched and shut down the executor if the service created it
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        for job in self._pending:
+            job.future.cancel()
+        self._pending.clear()
+        if self._owns_executor and self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
+
+    def _abandon(self) -> None:
+        # The event loop of the service is closed, so its executor is shut down without waiting on the loop
+        if self._owns_executor and self._executor is not None:
+            executor, self._executor = self._executor, None
+            executor.shutdown(wait=False)
+
+    async def solve(self, board: Sequence[T], timeout: Optional[float] = None) -> SolveResult:
+        """
+        Solve a single board
+
+        Args:
+            board (Sequence[T]): A sequence representing a Sudoku puzzle
+            timeout (Optional[float], optional): The longest time in seconds to wait for the result, including
+                the time spent waiting for a free slot. Defaults to no limit.
+
+        Raises:
+            asyncio.TimeoutError: If the result is not ready within the timeout
+            ValueError: If the board is not a valid puzzle, which fails no other board of its batch
+
+        Returns:
+            SolveResult: The outcome of solving the board
+        """
+        return await asyncio.wait_for(self._solve(board), timeout)
+
+    async def _solve(self, board: Sequence[T]) -> SolveResult:
+        loop = asyncio.get_running_loop()
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+        await self._slots.acquire()
+        self._in_flight += 1
+
+        job = _Job(board, loop.create_future())
+        job.future.add_done_callback(lambda _: self._release(job))
+        self._pending.append(job)
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_delay, self._flush)
+
+        return await job.future
+
+    def _release(self, job: _Job) -> None:
+        if not job.dispatched:
+            self._finish()
+
+    def _finish(self) -> None:
+        self._in_flight -= 1
+        assert self._slots is not None
+        self._slots.release()
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        while self._pending:
+            batch = [job for job in self._pending[: self.batch_size] if not job.future.done()]
+            del self._pending[: self.batch_size]
+            if batch:
+                self._dispatch(batch)
+
+    def _dispatch(self, batch: List[_Job]) -> None:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor()
+        for job in batch:
+            job.dispatched = True
+
+        loop = asyncio.get_running_loop()
+        work = loop.run_in_executor(
+            self._executor, _solve_batch, [job.board for job in batch], self.blank, self.solver
+        )
+
+        def deliver(work: asyncio.Future) -> None:
+            for i, job in enumerate(batch):
+                self._finish()
+                if job.future.done():
+                    continue
+                if work.cancelled():
+                    job.future.cancel()
+                    continue
+                error = work.exception()
+                if error is not None:
+                    job.future.set_exception(error)
+                    continue
+                result = work.result()[i]
+                if isinstance(result, Exception):
+                    job.future.set_exception(result)
+                else:
+                    job.future.set_result(result)
+
+        work.add_done_callback(deliver)
+
+    async def stream(
+        self, boards: Union[Iterable[Sequence[T]], AsyncIterable[Sequence[T]]], timeout: Optional[float] = None
+    ) -> AsyncIterator[SolveResult]:
+        """
+        Solve many boards concurrently, yielding the results in the order of the boards
+
+        Boards are only read from the iterable as slots free up, so at most `max_in_flight` boards are held in
+        memory at once. Closing the iterator cancels the boards that are still outstanding.
+
+        Args:
+            boards (Union[Iterable[Sequence[T]], AsyncIterable[Sequence[T]]]): The boards to solve
+            timeout (Optional[float], optional): The longest time in seconds to wait for each result.
+                Defaults to no limit.
+
+        Yields:
+            SolveResult: The outcome of solving each board
+        """
+        outstanding: Deque[asyncio.Future] = deque()
+        try:
+            async for board in _aiter(boards):
+                outstanding.append(asyncio.ensure_future(self.solve(board, timeout)))
+                if len(outstanding) >= self.max_in_flight:
+                    yield await outstanding.popleft()
+            while outstanding:
+                yield await outstanding.popleft()
+        finally:
+            for task in outstanding:
+                task.cancel()
+
+
+async def _aiter(boards: Union[Iterable[Sequence[T]], AsyncIterable[Sequence[T]]]) -> AsyncIterator[Sequence[T]]:
+    if isinstance(boards, AsyncIterable):
+        async for board in boards:
+            yield board
+    else:
+        for board in boards:
+            yield board
+
+
+_services: Dict[asyncio.AbstractEventLoop, SolveService] = {}
+_services_lock = threading.Lock()
+
+
+def _default_service() -> SolveService:
+    # Event loops may run on several threads, which share the registry of default services
+    loop = asyncio.get_running_loop()
+    with _services_lock:
+        for other in [other for other in _services if other.is_closed()]:
+            _services.pop(other)._abandon()
+        if loop not in _services:
+            _services[loop] = SolveService()
+        return _services[loop]
+
+
+async def solve_async(board: Sequence[T], timeout: Optional[float] = None) -> SolveResult:
+    """
+    Solve a board on the default service of the running event loop
+
+    Args:
+        board (Sequence[T]): A sequence representing a Sudoku puzzle, using "." for blank cells
+        timeout (Optional[float], optional): The longest time in seconds to wait for the result.
+            Defaults to no limit.
+
+    Returns:
+        SolveResult: The outcome of solving the board
+    """
+    return await _default_service().solve(board, timeout)
+
+
+def solve_stream(
+    boards: Union[Iterable[Sequence[T]], AsyncIterable[Sequence[T]]], timeout: Optional[float] = None
+) -> AsyncIterator[SolveResult]:
+    """
+    Solve many boards on the default service of the running event loop, yielding results in order
+
+    Args:
+        boards (Union[Iterable[Sequence[T]], AsyncIterable[Sequence[T]]]): The boards to solve, using "." for
+            blank cells
+        timeout (Optional[float], optional): The longest time in seconds to wait for each result.
+            Defaults to no limit.
+
+    Returns:
+        AsyncIterator[SolveResult]: The outcome of solving each board
+    """
+    return _default_service().stream(boards, timeout)
+
+
+__all__ = ("SolveResult", "SolveService", "solve_async", "solve_stream")
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from typing import Callable, Iterable, Iterator, List, Sequence, Tuple
+
+
+def _popcount(mask: int) -> int:
+    return bin(mask).count("1")
+
+
+popcount: Callable[[int], int] = getattr(int, "bit_count", _popcount)
+"""Count the set bits of a mask"""
+
+
+def bit(digit: int) -> int:
+    """
+    The mask of a single digit
+
+    Args:
+        digit (int): The integer alias of a token, starting at 1
+
+    Returns:
+        int: The mask with only the digit's bit set
+    """
+    return 1 << (digit - 1)
+
+
+def mask_of(digits: Iterable[int]) -> int:
+    """
+    The mask of a collection of digits
+
+    Args:
+        digits (Iterable[int]): The integer aliases of tokens, starting at 1
+
+    Returns:
+        int: The mask with the bits of all of the digits set
+    """
+    mask = 0
+    for d in digits:
+        mask |= 1 << (d - 1)
+    return mask
+
+
+def digits(mask: int) -> Iterator[int]:
+    """
+    Iterate over the digits of a mask in increasing order
+
+    Args:
+        mask (int): A candidate mask of arbitrary width
+
+    Yields:
+        int: The integer aliases of the set bits, starting at 1
+    """
+    while mask:
+        low = mask & -mask
+        yield low.bit_length()
+        mask ^= low
+
+
+def single(mask: int) -> int:
+    """
+    The digit of a mask with exactly one bit set
+
+    Args:
+        mask (int): A candidate mask
+
+    Returns:
+        int: The digit if exactly one bit is set, otherwise 0
+    """
+    if mask and not mask & (mask - 1):
+        return mask.bit_length()
+    return 0
+
+
+def subsets(masks: Sequence[int], size: int) -> Iterator[Tuple[Tuple[int, ...], int]]:
+    """
+    Find groups of masks whose union has exactly as many bits as there are masks in the group.
+
+    The search extends groups one mask at a time and abandons a branch as soon as the union grows past `size`
+    bits, so the cost depends on how many masks are small rather than on all combinations of the input.
+
+    Args:
+        masks (Sequence[int]): The masks to choose from
+        size (int): The number of masks in each group
+
+    Yields:
+        Tuple[Tuple[int, ...], int]: The positions of the chosen masks and their union
+    """
+    chosen: List[int] = []
+
+    def extend(start: int, union: int) -> Iterator[Tuple[Tuple[int, ...], int]]:
+        if len(chosen) == size:
+            if popcount(union) == size:
+                yield tuple(chosen), union
+            return
+        for k in range(start, len(masks) - (size - len(chosen)) + 1):
+            extended = union | masks[k]
+            if popcount(extended) <= size:
+                chosen.append(k)
+                yield from extend(k + 1, extended)
+                chosen.pop()
+
+    yield from extend(0, 0)
+
+
+__all__ = ("popcount", "bit", "mask_of", "digits", "single", "subsets")
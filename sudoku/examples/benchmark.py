@@ -0,0 +1,43 @@
+import random
+import subprocess
+import sys
+from math import isqrt
+from time import perf_counter
+
+from .. import Puzzle
+from ..solvers import AutoSolver, BacktrackingSolver, StrategySolver
+from .boards import boards
+
+
+def large_board(order: int, blanks: float, seed: int = 0):
+    width = isqrt(order)
+    tokens = [str(t) for t in range(1, order + 1)]
+    board = [tokens[(width * (r % width) + r // width + c) % order] for r in range(order) for c in range(order)]
+    for i in random.Random(seed).sample(range(order ** 2), int(blanks * order ** 2)):
+        board[i] = "."
+    return board
+
+
+IMPORT_BUDGET = 0.1
+"""The most seconds importing the package may take, about four times the time measured without NumPy"""
+
+
+def import_time(module: str = "sudoku", repeat: int = 5) -> float:
+    script = f"from time import perf_counter; start = perf_counter(); import {module}; print(perf_counter() - start)"
+    return min(float(subprocess.check_output([sys.executable, "-c", script])) for _ in range(repeat))
+
+
+if __name__ == "__main__":
+    print(f"import sudoku: {import_time() * 1000:.1f}ms (budget {IMPORT_BUDGET * 1000:.0f}ms)")
+
+    for solver in (StrategySolver, BacktrackingSolver, AutoSolver):
+        start = perf_counter()
+        solved = sum(Puzzle(board, ".").solve(solver) for board in boards)
+        print(f"{solver.__name__}: solved {solved}/{len(boards)} boards in {perf_counter() - start:.4f}s")
+
+    for order in (16, 25):
+        board = large_board(order, 0.6)
+        start = perf_counter()
+        puzzle = Puzzle(board, ".")
+        solved = puzzle.solve(BacktrackingSolver)
+        print(f"Order {order}: solved={solved} in {perf_counter() - start:.4f}s")
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from math import isqrt
+from typing import Generic, Iterator, List, Optional, Sequence, Tuple
+
+from .puzzle import Puzzle, T
+from .topology import Topology
+
+
+@lru_cache(maxsize=64)
+def _shared(tokens: Tuple[T, ...]) -> Tuple[T, ...]:
+    # Equal token tuples are shared between snapshots, for a bounded number of distinct alphabets
+    return tokens
+
+
+@lru_cache(maxsize=256)
+def _canonical(tokens: Tuple[T, ...]) -> Tuple[Tuple[T, ...], bytes]:
+    # The tokens sorted by their representation after the blank, so a grid has one snapshot whatever order its
+    # aliases were assigned in, and the table that maps the aliases onto that order
+    order = sorted(range(1, len(tokens)), key=lambda a: repr(tokens[a]))
+    table = bytearray(range(256))
+    for alias, a in enumerate(order, 1):
+        table[a] = alias
+    return _shared((tokens[0], *(tokens[a] for a in order))), bytes(table)
+
+
+def _is_default(topology: Topology) -> bool:
+    try:
+        return topology is Topology.standard(topology.order)
+    except ValueError:
+        return False
+
+
+class FrozenPuzzle(Generic[T]):
+    """
+    An immutable, hashable snapshot of the values of a sudoku puzzle.
+
+    The integer alias of every cell is stored as a single byte, after remapping the aliases to the tokens in sorted
+    order, so equality and hashing only depend on the visible grid and not on the order in which tokens first
+    appeared. Equal token lists are shared between snapshots, so a frozen puzzle costs little more than its cells and
+    can be used as a dict key or set member. Candidates
+    are not kept: thawing a frozen puzzle gives a fresh puzzle with every blank cell open to all tokens.
+
+    ```python
+    seen = {puzzle.freeze() for puzzle in puzzles}
+    puzzle = next(iter(seen)).thaw()
+    ```
+
+    Attributes:
+        data (bytes): The integer alias of every cell, or 0 if it is blank
+        tokens (Tuple[T, ...]): The tokens of the puzzle as identified by their integer aliases, sorted by their
+            representation after the blank token
+        order (int): The number of unique tokens in use in the puzzle
+        topology (Topology): The units of the puzzle
+    """
+
+    __slots__ = "_data", "_tokens", "_topology", "_hash"
+
+    _data: bytes
+    _tokens: Tuple[T, ...]
+    _topology: Optional[Topology]
+    _hash: int
+
+    def __init__(self, data: bytes, tokens: Sequence[T], topology: Optional[Topology] = None):
+        """
+        Args:
+            data (bytes): The integer alias of every cell, or 0 if it is blank
+            tokens (Sequence[T]): The tokens of the puzzle, starting with the blank token
+            topology (Optional[Topology], optional): The units of the puzzle. Defaults to the standard layout.
+
+        Raises:
+            ValueError: If the data is not square or does not fit the topology
+        """
+        size = len(data)
+        order = isqrt(size)
+        if order ** 2 != size or size == 0:
+            raise ValueError(f"A puzzle of {size} cells is not square")
+        if topology is not None and topology.order != order:
+            raise ValueError(f"A puzzle of order {order} does not fit {topology}")
+
+        self._tokens, table = _canonical(tuple(tokens))
+        self._data = bytes(data).translate(table)
+        self._topology = None if topology is None or _is_default(topology) else topology
+        self._hash = hash((self._data, self._tokens, self._topology))
+
+    @classmethod
+    def from_puzzle(cls, puzzle: Puzzle[T]) -> FrozenPuzzle[T]:
+        """
+        Take a snapshot of the values of a puzzle
+
+        Args:
+            puzzle (Puzzle[T]): The puzzle to freeze
+
+        Raises:
+            ValueError: If the order of the puzzle is too large to store each alias in a byte
+
+        Returns:
+            FrozenPuzzle[T]: The snapshot
+        """
+        if puzzle.order > 255:
+            raise ValueError(f"A puzzle of order {puzzle.order} cannot be frozen")
+        return cls(bytes(puzzle._values), puzzle.tokens, puzzle.topology)
+
+    def thaw(self) -> Puzzle[T]:
+        """
+        A new mutable puzzle with the values of the snapshot
+
+        Returns:
+            Puzzle[T]: The puzzle
+        """
+        return Puzzle._from_values(self._data, self._tokens, self._topology)
+
+    @property
+    def data(self) -> bytes:
+        return self._data
+
+    @property
+    def tokens(self) -> Tuple[T, ...]:
+        return self._tokens
+
+    @property
+    def order(self) -> int:
+        return isqrt(len(self._data))
+
+    @property
+    def topology(self) -> Topology:
+        return self._topology if self._topology is not None else Topology.standard(self.order)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FrozenPuzzle):
+            return NotImplemented
+        return self is other or (
+            self._hash == other._hash
+            and self._data == other._data
+            and self._tokens == other._tokens
+            and self._topology == other._topology
+        )
+
+    def __reduce__(self):
+        return FrozenPuzzle, (self._data, self._tokens, self._topology)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, index: int) -> T:
+        return self._tokens[self._data[index]]
+
+    def __iter__(self) -> Iterator[T]:
+        return map(self._tokens.__getitem__, self._data)
+
+    def to_1D(self) -> List[T]:
+        """
+        A method for getting back the Sudoku board as a 1-dimensional list
+
+        Returns:
+            List[T]: A 1-dimensional list of the Sudoku board
+        """
+        return list(self)
+
+    def to_string(self) -> str:
+        """
+        A method for getting back the Sudoku board as a string
+
+        Returns:
+            str: A string representation in the Sudoku board
+        """
+        return "".join(map([str(t) for t in self._tokens].__getitem__, self._data))
+
+    def __str__(self) -> str:
+        return self.to_string()
+
+    def __repr__(self) -> str:
+        return f"FrozenPuzzle({self.to_string()!r})"
+
+
+__all__ = ("FrozenPuzzle",)
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Iterable, List, Optional, Sequence, Set
+
+from .solvers.backtracking_solver import search
+from .topology import Topology
+
+
+def unique_solution(values: Sequence[int], topology: Topology) -> Optional[List[int]]:
+    """
+    The solution of a grid of clues if it has exactly one
+
+    Args:
+        values (Sequence[int]): The integer alias of every cell, or 0 if it is blank
+        topology (Topology): The units of the puzzle
+
+    Returns:
+        Optional[List[int]]: The integer alias of every cell of the solution, or None if there are no solutions or
+            more than one
+    """
+    full = (1 << topology.order) - 1
+    solutions = search([1 << (v - 1) if v else full for v in values], topology)
+    first = next(solutions, None)
+    if first is None or next(solutions, None) is not None:
+        return None
+    return [m.bit_length() for m in first]
+
+
+class _Clues:
+    # The candidates left by eliminating the value of every clue from its peers, shared by the searches for all of
+    # the clues. Each peer also counts the clues that rule out each of its values, so that a clue can be taken back
+    # out without eliminating from scratch.
+
+    __slots__ = "topology", "solution", "clues", "masks", "_blocked"
+
+    def __init__(self, clues: Iterable[int], solution: Sequence[int], topology: Topology):
+        width = topology.order + 1
+        self.topology = topology
+        self.solution = solution
+        self.clues = set(clues)
+        self._blocked = [0] * (len(solution) * width)
+        for i in self.clues:
+            for p in topology.peers[i]:
+                self._blocked[p * width + solution[i]] += 1
+        self.masks = [1 << (solution[i] - 1) if i in self.clues else self._open(i) for i in range(len(solution))]
+
+    def _open(self, i: int) -> int:
+        width = self.topology.order + 1
+        blocked = self._blocked
+        return sum(1 << (v - 1) for v in range(1, width) if not blocked[i * width + v])
+
+    def _released(self, clue: int) -> List[int]:
+        # The peers of a clue that no other clue keeps from holding its value
+        width = self.topology.order + 1
+        v = self.solution[clue]
+        return [p for p in self.topology.peers[clue] if p not in self.clues and self._blocked[p * width + v] == 1]
+
+    def is_necessary(self, clue: int) -> bool:
+        b = 1 << (self.solution[clue] - 1)
+        masks = self.masks[:]
+        for p in self._released(clue):
+            masks[p] |= b
+        masks[clue] = self._open(clue) & ~b
+        return next(search(masks, self.topology), None) is not None
+
+    def remove(self, clue: int) -> None:
+        b = 1 << (self.solution[clue] - 1)
+        for p in self._released(clue):
+            self.masks[p] |= b
+        width = self.topology.order + 1
+        for p in self.topology.peers[clue]:
+            self._blocked[p * width + self.solution[clue]] -= 1
+        self.clues.discard(clue)
+        self.masks[clue] = self._open(clue)
+
+
+def is_necessary(clue: int, clues: Iterable[int], solution: Sequence[int], topology: Topology) -> bool:
+    """
+    Check whether a clue is needed for a set of clues to have a unique solution
+
+    The clue is necessary exactly when the other clues allow a solution with a different value in its cell, so a
+    single search with that value excluded answers the question without counting solutions.
+
+    Args:
+        clue (int): The index of the clue to check
+        clues (Iterable[int]): The indices of all of the clues, including `clue`
+        solution (Sequence[int]): The integer alias of every cell of the unique solution of the clues
+        topology (Topology): The units of the puzzle
+
+    Returns:
+        bool: Whether removing the clue would allow another solution
+    """
+    return _Clues(clues, solution, topology).is_necessary(clue)
+
+
+_shared: Any = None
+
+
+def _start_worker(shared: _Clues) -> None:
+    global _shared
+    _shared = shared
+
+
+def _is_necessary(clue: int) -> bool:
+    return _shared.is_necessary(clue)
+
+
+def _pool(workers: int, shared: _Clues) -> ProcessPoolExecutor:
+    # The shared eliminations are sent to every worker once, so that each task is a single clue
+    return ProcessPoolExecutor(workers, initializer=_start_worker, initargs=(shared,))
+
+
+def necessary_clues(
+    clues: Sequence[int], solution: Sequence[int], topology: Topology, workers: Optional[int] = None
+) -> Set[int]:
+    """
+    Find the clues that are needed for a set of clues to have a unique solution
+
+    Args:
+        clues (Sequence[int]): The indices of the clues
+        solution (Sequence[int]): The integer alias of every cell of the unique solution of the clues
+        topology (Topology): The units of the puzzle
+        workers (Optional[int], optional): The number of worker processes checking clues at once.
+            Defaults to checking them one at a time in this process.
+
+    Returns:
+        Set[int]: The indices of the necessary clues
+    """
+    shared = _Clues(clues, solution, topology)
+    if workers is None:
+        return {clue for clue in clues if shared.is_necessary(clue)}
+
+    with _pool(workers, shared) as executor:
+        verdicts = executor.map(_is_necessary, clues, chunksize=max(1, len(clues) // (4 * workers)))
+        return {clue for clue, necessary in zip(clues, verdicts) if necessary}
+
+
+def all_necessary(
+    clues: Sequence[int], solution: Sequence[int], topology: Topology, workers: Optional[int] = None
+) -> bool:
+    """
+    Check whether every clue is needed for a set of clues to have a unique solution
+
+    The checks stop at the first clue that can be removed, and any checks still queued in the pool are cancelled.
+
+    Args:
+        clues (Sequence[int]): The indices of the clues
+        solution (Sequence[int]): The integer alias of every cell of the unique solution of the clues
+        topology (Topology): The units of the puzzle
+        workers (Optional[int], optional): The number of worker processes checking clues at once.
+            Defaults to checking them one at a time in this process.
+
+    Returns:
+        bool: Whether no clue can be removed without losing uniqueness
+    """
+    shared = _Clues(clues, solution, topology)
+    if workers is None:
+        return all(shared.is_necessary(clue) for clue in clues)
+
+    with _pool(workers, shared) as executor:
+        futures = [executor.submit(_is_necessary, clue) for clue in clues]
+        for future in as_completed(futures):
+            if not future.result():
+                executor.shutdown(wait=False, cancel_futures=True)
+                return False
+    return True
+
+
+def minimal_clues(
+    clues: Sequence[int], solution: Sequence[int], topology: Topology, workers: Optional[int] = None
+) -> List[int]:
+    """
+    Remove clues one at a time, in order, for as long as the remaining clues keep the solution unique
+
+    Removing clues only ever allows more solutions, so a clue that is necessary at some point stays necessary and
+    is checked once. When `workers` is given, the clues that are already necessary among all of the clues are found
+    in parallel first, which leaves only the remaining clues to be checked one after another.
+
+    Args:
+        clues (Sequence[int]): The indices of the clues
+        solution (Sequence[int]): The integer alias of every cell of the unique solution of the clues
+        topology (Topology): The units of the puzzle
+        workers (Optional[int], optional): The number of worker processes for the first pass.
+            Defaults to checking every clue one at a time in this process.
+
+    Returns:
+        List[int]: The indices of the clues of a minimal puzzle with the same solution
+    """
+    known = necessary_clues(clues, solution, topology, workers) if workers is not None else set()
+    kept = _Clues(clues, solution, topology)
+    for clue in clues:
+        if clue not in known and not kept.is_necessary(clue):
+            kept.remove(clue)
+    return sorted(kept.clues)
+
+
+__all__ = ("unique_solution", "is_necessary", "necessary_clues", "all_necessary", "minimal_clues")
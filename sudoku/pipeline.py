@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Type
+
+from .puzzle import Puzzle
+from .solvers import Solver, StrategySolver
+
+
+def _write_atomic(path: str, text: str) -> None:
+    # Write to a temporary file beside the target and move it into place, so a crash never leaves a partial file
+    temporary = f"{path}.tmp"
+    with open(temporary, "w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary, path)
+
+
+def process_shard(boards: List[str], blank: str, solver: Type[Solver], rate: bool) -> List[Dict[str, Any]]:
+    """
+    Solve, and optionally rate, every board of a shard
+
+    Args:
+        boards (List[str]): The boards of the shard as strings of tokens
+        blank (str): The token used to represent a blank cell
+        solver (Type[Solver]): The solver used for every board
+        rate (bool): Whether to rate every board
+
+    Returns:
+        List[Dict[str, Any]]: A record for every board with its solution, or None if it could not be solved, its
+            rating when requested, and an error instead for boards that are not valid puzzles or fail to be rated or
+            solved
+    """
+    records = []
+    for board in boards:
+        record: Dict[str, Any] = {"board": board}
+        try:
+            puzzle = Puzzle(board, blank)
+            if rate:
+                record["rating"] = puzzle.rate()
+            solved = puzzle.solve(solver)
+            record["solution"] = puzzle.to_string() if solved else None
+        except Exception as e:
+            # A board that fails for any reason gets an error record rather than aborting the shard and the run
+            record = {"board": board, "error": str(e) if isinstance(e, ValueError) else f"{type(e).__name__}: {e}"}
+        records.append(record)
+    return records
+
+
+class Pipeline:
+    """
+    Process a corpus of boards, one per line of a text file, in shards spread over worker processes.
+
+    Each shard is written to its own JSON lines file in the output directory, through a temporary file that is
+    moved into place once complete, and the finished shards are recorded in a checkpoint after each one. Running
+    the pipeline again with the same settings resumes from the checkpoint and skips the finished shards. At most
+    two shards per worker are read ahead, so memory stays bounded by the shard size rather than the corpus.
+
+    ```python
+    Pipeline("boards.txt", "out", shard_size=10_000, rate=True).run()
+    ```
+
+    Attributes:
+        source (str): The path of the text file of boards
+        output (str): The directory of the shard files and the checkpoint
+        shard_size (int): The number of boards in each shard
+        workers (int): The number of worker processes
+        blank (str): The token used to represent a blank cell
+        solver (Type[Solver]): The solver used for every board
+        rate (bool): Whether to rate every board
+    """
+
+    CHECKPOINT = "progress.json"
+    """The name of the checkpoint file in the output directory"""
+
+    source: str
+    output: str
+    shard_size: int
+    workers: int
+    blank: str
+    solver: Type[Solver]
+    rate: bool
+
+    def __init__(
+        self,
+        source: str,
+        output: str,
+        shard_size: int = 10000,
+        workers: Optional[int] = None,
+        *,
+        blank: str = ".",
+        solver: Type[Solver] = StrategySolver,
+        rate: bool = False,
+    ):
+        """
+        Args:
+            source (str): The path of the text file of boards
+            output (str): The directory of the shard files and the checkpoint, created if needed
+            shard_size (int, optional): The number of boards in each shard. Defaults to 10000.
+            workers (Optional[int], optional): The number of worker processes. Defaults to the number of CPUs.
+            blank (str, optional): The token used to represent a blank cell. Defaults to ".".
+            solver (Type[Solver], optional): The solver used for every board. Defaults to StrategySolver.
+            rate (bool, optional): Whether to rate every board. Defaults to False.
+        """
+        self.source = source
+        self.output = output
+        self.shard_size = shard_size
+        self.workers = workers or os.cpu_count() or 1
+        self.blank = blank
+        self.solver = solver
+        self.rate = rate
+
+    def _settings(self) -> Dict[str, Any]:
+        return {
+            "source": os.path.abspath(self.source),
+            "size": os.path.getsize(self.source),
+            "shard_size": self.shard_size,
+            "blank": self.blank,
+            "solver": f"{self.solver.__module__}.{self.solver.__qualname__}",
+            "rate": self.rate,
+        }
+
+    def shard_path(self, index: int) -> str:
+        """
+        The path of the output file of a shard
+
+        Args:
+            index (int): The position of the shard in the corpus
+
+        Returns:
+            str: The path in the output directory
+        """
+        return os.path.join(self.output, f"shard-{index:06d}.jsonl")
+
+    def completed(self) -> Set[int]:
+        """
+        The shards recorded as finished by the checkpoint, if it was written with the same settings
+
+        Raises:
+            ValueError: If the checkpoint was written with different settings or for a different source
+
+        Returns:
+            Set[int]: The indices of the finished shards
+        """
+        path = os.path.join(self.output, self.CHECKPOINT)
+        if not os.path.exists(path):
+            return set()
+        with open(path, encoding="utf-8") as f:
+            checkpoint = json.load(f)
+        if checkpoint["settings"] != self._settings():
+            raise ValueError(f"The checkpoint in {self.output} was written by a pipeline with other settings")
+        return {index for index in checkpoint["completed"] if os.path.exists(self.shard_path(index))}
+
+    def _checkpoint(self, completed: Set[int]) -> None:
+        checkpoint = {"settings": self._settings(), "completed": sorted(completed)}
+        _write_atomic(os.path.join(self.output, self.CHECKPOINT), json.dumps(checkpoint))
+
+    def _shards(self, skip: Set[int]) -> Iterator[Tuple[int, List[str]]]:
+        with open(self.source, encoding="utf-8") as f:
+            lines = (line.strip() for line in f)
+            boards = (line for line in lines if line)
+            index = 0
+            while True:
+                shard = list(islice(boards, self.shard_size))
+                if not shard:
+                    return
+                if index not in skip:
+                    yield index, shard
+                index += 1
+
+    def run(self) -> int:
+        """
+        Process every shard that has not been finished yet
+
+        Returns:
+            int: The number of shards processed by this run
+        """
+        os.makedirs(self.output, exist_ok=True)
+        completed = self.completed()
+        shards = self._shards(completed)
+        processed = 0
+
+        with ProcessPoolExecutor(self.workers) as executor:
+            pending: Dict[Future, int] = {}
+
+            def submit() -> None:
+                for index, boards in islice(shards, 2 * self.workers - len(pending)):
+                    pending[executor.submit(process_shard, boards, self.blank, self.solver, self.rate)] = index
+
+            submit()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    records = future.result()
+                    _write_atomic(self.shard_path(index), "".join(json.dumps(r) + "\n" for r in records))
+                    completed.add(index)
+                    self._checkpoint(completed)
+                    processed += 1
+                submit()
+
+        return processed
+
+
+__all__ = ("Pipeline", "process_shard")
@@ -2,16 +2,50 @@ from __future__ import annotations
 
 import random
 from collections import defaultdict
-from copy import deepcopy
-from typing import Any, DefaultDict, Generic, List, Sequence, Set, Type, TypeVar
-
-import numpy as np
-
+from functools import lru_cache
+from math import isqrt
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from .bitset import bit, digits, mask_of, single
 from .solvers import Solver
 from .solvers.strategy_solver import StrategySolver, essential_strategies
+from .strategies import Contradiction, Step
+from .topology import Topology
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .frozen import FrozenPuzzle
 
 T = TypeVar("T", bound=Any)
 
+Seed = Union[None, int, random.Random]
+"""A seed for a new random number generator, or a generator to draw from"""
+
+
+def _generator(seed: Seed) -> random.Random:
+    # A generator private to the call, so shuffling never touches or depends on the state of the random module
+    return seed if isinstance(seed, random.Random) else random.Random(seed)
+
 
 class Puzzle(Generic[T]):
     """
@@ -27,13 +61,38 @@ class Puzzle(Generic[T]):
         order (int): The number of unique tokens in use in the puzzle. For the common 9x9 sudoku puzzle,
             this value is 9.
         cells (List[Cell]): A list of all the cells in the sudoku puzzle.
+        topology (Topology): The units of the puzzle and the peers of every cell
     """
 
-    __slots__ = "order", "tokens", "cells"
+    __slots__ = (
+        "order",
+        "tokens",
+        "_cells",
+        "_full",
+        "_masks",
+        "_values",
+        "topology",
+        "_counts",
+        "_conflicting",
+        "_blanks",
+        "_exports",
+        "_exports_tokens",
+        "_failure",
+    )
 
     order: int
     tokens: Tokens
-    cells: List[Cell]
+    topology: Topology
+    _cells: Optional[List[Cell]]
+    _full: int
+    _masks: List[int]
+    _values: List[int]
+    _counts: List[int]
+    _conflicting: Set[int]
+    _blanks: int
+    _exports: Dict[Hashable, Any]
+    _exports_tokens: List[T]
+    _failure: Optional[Tuple[List[int], Contradiction]]
 
     class Tokens(List[T]):
         """
@@ -51,46 +110,84 @@ class Puzzle(Generic[T]):
             """
             self[i], self[j] = self[j], self[i]
 
-        def shuffle(self):
+        def shuffle(self, seed: Seed = None):
             """
             Randomly swap the tokens in the puzzle by randomizing their integer aliases.
+
+            Args:
+                seed (Seed, optional): A seed for a new generator, or a generator to draw from.
+                    Defaults to None, which seeds a new generator from the operating system.
             """
             tokens = self[1:]
-            random.shuffle(tokens)
+            _generator(seed).shuffle(tokens)
             self[1:] = tokens
 
     class Cell:
         """
         The class for an individual cell in the sudoku puzzle
 
+        The candidates of every cell are stored by the puzzle as an integer bitmask in which bit `d - 1` stands for
+        the integer alias `d`, so the width of the mask grows with the order of the puzzle. A cell is a view onto
+        its position, and candidates must be changed through the `mask`, `candidates` or `value` setters or
+        `remove_candidate` so that the puzzle can keep track of placements. The `candidates` property is a frozen
+        snapshot, so mutating it in place fails rather than being silently lost.
+
         Attributes:
             puzzle (Puzzle): The corresponding sudoku puzzle
-            candidates (Set[int]): A set of the cell's remaining candidates
+            index (int): The position of the cell in the puzzle
+            mask (int): The bitmask of the cell's remaining candidates
+            candidates (FrozenSet[int]): The cell's remaining candidates, assigned to change them
             value (int): The value of the sudoku cell or 0 if it is blank.
         """
 
-        __slots__ = "puzzle", "candidates"
+        __slots__ = "puzzle", "index"
 
         puzzle: Puzzle
-        candidates: Set[int]
+        index: int
 
-        def __init__(self, puzzle: Puzzle[T], value: int):
+        def __init__(self, puzzle: Puzzle[T], index: int):
             self.puzzle = puzzle
-            self.candidates = {i + 1 for i in range(self.puzzle.order)}
-            self.value = value
+            self.index = index
+
+        @property
+        def mask(self) -> int:
+            return self.puzzle._masks[self.index]
+
+        @mask.setter
+        def mask(self, mask: int):
+            self.puzzle._set_mask(self.index, mask)
+
+        @property
+        def candidates(self) -> FrozenSet[int]:
+            return frozenset(digits(self.puzzle._masks[self.index]))
+
+        @candidates.setter
+        def candidates(self, candidates: Iterable[int]):
+            self.puzzle._set_mask(self.index, mask_of(candidates))
 
         @property
         def value(self) -> int:
-            if len(self.candidates) > 1:
-                return 0
-            return next(iter(self.candidates))
+            return self.puzzle._values[self.index]
 
         @value.setter
         def value(self, value: int):
-            if value == 0:
-                self.candidates = {i + 1 for i in range(self.puzzle.order)}
-            else:
-                self.candidates = {value}
+            self.puzzle._set_mask(self.index, self.puzzle._full if value == 0 else bit(value))
+
+        def remove_candidate(self, candidate: int) -> bool:
+            """
+            Remove a candidate from the cell if it is present.
+
+            Args:
+                candidate (int): The integer alias of the candidate to remove
+
+            Returns:
+                bool: True if the candidate was removed, False if it was not present
+            """
+            mask = self.puzzle._masks[self.index]
+            if not mask & bit(candidate):
+                return False
+            self.puzzle._set_mask(self.index, mask & ~bit(candidate))
+            return True
 
         def is_blank(self) -> bool:
             """
@@ -99,75 +196,93 @@ class Puzzle(Generic[T]):
             Returns:
                 bool: A boolean value for whether the cell is blank.
             """
-            return len(self.candidates) > 1
+            return self.puzzle._values[self.index] == 0
 
-    def _box(self, index: int):
-        boxWidth = int(self.order ** 0.5)
-        row = index // self.order
-        col = index % self.order
-        edgeRow = boxWidth * (row // boxWidth)
-        edgeCol = boxWidth * (col // boxWidth)
-
-        for i in range(self.order):
-            r = edgeRow + i // boxWidth
-            c = edgeCol + (i % boxWidth)
-            if not (r == row and c == col):
-                p = int(self.order * r + c)
+    @property
+    def cells(self) -> List[Cell]:
+        if self._cells is None:
+            self._cells = [self.Cell(self, i) for i in range(len(self._masks))]
+        return self._cells
+
+    def _house(self, index: int, kind: str):
+        u = self.topology.unit(index, kind)
+        if u is None:
+            return
+        for p in self.topology.units[u]:
+            if p != index:
                 yield p, self.cells[p]
 
-    def _row(self, index: int):
-        row = index // self.order
-        col = index % self.order
+    def _box(self, index: int):
+        return self._house(index, Topology.BOX)
 
-        for i in range(self.order):
-            if i != col:
-                p = int(self.order * row + i)
-                yield p, self.cells[p]
+    def _row(self, index: int):
+        return self._house(index, Topology.ROW)
 
     def _col(self, index: int):
-        row = index // self.order
-        col = index % self.order
-
-        for i in range(self.order):
-            if i != row:
-                p = int(self.order * i + col)
-                yield p, self.cells[p]
+        return self._house(index, Topology.COLUMN)
 
     def _peers(self, index: int):
-        boxWidth = int(self.order ** 0.5)
-        row = index // self.order
-        col = index % self.order
-        edgeM = boxWidth * (row // boxWidth)
-        edgeN = boxWidth * (col // boxWidth)
-
-        peers = set()
-
-        for i in range(self.order):
-            r = edgeM + i // boxWidth
-            c = edgeN + i % boxWidth
-            if i != col:
-                p = int(self.order * row + i)
-                if p not in peers:
-                    yield p, self.cells[p]
-                    peers.add(p)
-            if i != row:
-                p = int(self.order * i + col)
-                if p not in peers:
-                    yield p, self.cells[p]
-                    peers.add(p)
-            if not (r == row and c == col):
-                p = int(self.order * r + c)
-                if p not in peers:
-                    yield p, self.cells[p]
-                    peers.add(p)
+        for p in self.topology.peers[index]:
+            yield p, self.cells[p]
 
     def _blank(self, indices=None):
         if indices is None:
-            indices = range(self.order ** 2)
+            indices = range(len(self.cells))
         for i in indices:
-            cell = self.cells[i]
-            if cell.is_blank():
-                yield i, cell
+            if self._values[i] == 0:
+                yield i, self.cells[i]
+
+    def _set_mask(self, index: int, mask: int) -> None:
+        self._masks[index] = mask
+        value = single(mask)
+        old = self._values[index]
+        if value != old:
+            self._values[index] = value
+            self._place(index, old, value)
+            if self._exports:
+                self._exports.clear()
+
+    def _place(self, index: int, old: int, new: int) -> None:
+        width = self.order + 1
+        counts = self._counts
+        for u in self.topology.cell_units[index]:
+            if old:
+                k = u * width + old
+                counts[k] -= 1
+                if counts[k] == 1:
+                    self._conflicting.discard(k)
+            if new:
+                k = u * width + new
+                counts[k] += 1
+                if counts[k] == 2:
+                    self._conflicting.add(k)
+        if not old:
+            self._blanks -= 1
+        if not new:
+            self._blanks += 1
+
+    def _track(self) -> None:
+        width = self.order + 1
+        cell_units = self.topology.cell_units
+        counts = [0] * (len(self.topology.units) * width)
+        conflicting: Set[int] = set()
+        for i, value in enumerate(self._values):
+            if value:
+                for u in cell_units[i]:
+                    k = u * width + value
+                    counts[k] += 1
+                    if counts[k] == 2:
+                        conflicting.add(k)
+        self._counts = counts
+        self._conflicting = conflicting
+        self._blanks = self._values.count(0)
+
+    def _permute(self, indices: Sequence[int], swap_axes: bool = False) -> None:
+        self.topology = self.topology._transformed(indices, swap_axes)
+        self._masks = [self._masks[i] for i in indices]
+        self._values = [self._values[i] for i in indices]
+        self._exports.clear()
+        self._track()
 
     def has_conflicts(self) -> bool:
         """
@@ -176,14 +291,60 @@ class Puzzle(Generic[T]):
         Returns:
             bool: True if the board has conflicts, False otherwise
         """
-        for i, cell in enumerate(self.cells):
-            if not cell.is_blank():
-                for _, peer in self._peers(i):
-                    if not peer.is_blank() and cell.value == peer.value:
-                        return True
-        return False
+        return bool(self._conflicting)
 
-    def __init__(self, puzzle: Sequence[T], blank: T):
+    def contradiction(self) -> Optional[Contradiction]:
+        """
+        Look for a sign that the puzzle has no solution: a digit placed twice in a unit, a cell without candidates,
+        or a digit with no possible position in a unit
+
+        A contradiction that only a strategy can find, such as a digit that no template fits, is remembered when a
+        solve meets it and reported for as long as the candidates stay the same.
+
+        Returns:
+            Optional[Contradiction]: The first contradiction found, or None if there is none
+        """
+        width = self.order + 1
+        if self._conflicting:
+            u, value = divmod(min(self._conflicting), width)
+            return Contradiction(Contradiction.DUPLICATE, u, value)
+
+        masks = self._masks
+        if 0 in masks:
+            return Contradiction(Contradiction.EMPTY, masks.index(0))
+
+        full = self._full
+        for u, unit in enumerate(self.topology.units):
+            seen = 0
+            for i in unit:
+                seen |= masks[i]
+            if seen != full:
+                missing = full & ~seen
+                return Contradiction(Contradiction.MISSING, u, (missing & -missing).bit_length())
+
+        if self._failure is not None and self._failure[0] == masks:
+            return self._failure[1]
+        return None
+
+    def _fail(self, contradiction: Contradiction) -> None:
+        # Remember a contradiction met by a strategy along with the candidates it was met in
+        self._failure = (self._masks[:], contradiction)
+
+    def conflicts(self) -> List[int]:
+        """
+        A method to list the cells that share a value with one of their peers
+
+        Returns:
+            List[int]: The sorted indices of the conflicting cells
+        """
+        width = self.order + 1
+        indices: Set[int] = set()
+        for k in self._conflicting:
+            u, value = divmod(k, width)
+            indices.update(i for i in self.topology.units[u] if self._values[i] == value)
+        return sorted(indices)
+
+    def __init__(self, puzzle: Sequence[T], blank: T, topology: Optional[Topology] = None):
         """
         The object can be constructed with any 1-dimensional iterable:
         ```python
@@ -191,27 +352,76 @@ class Puzzle(Generic[T]):
         puzzle = Puzzle(arr_1d, 0)
         ```
 
+        Tokens may be of any type, so puzzles with more than nine tokens can use multi-character tokens such as
+        `["1", "2", ..., "25"]` for a 25x25 board. Puzzles with rectangular boxes or extra units are described by a
+        topology:
+        ```python
+        puzzle = Puzzle(arr_1d_6x6, 0, Topology.standard(6, (2, 3)))
+        x_sudoku = Puzzle(arr_1d_9x9, 0, Topology.diagonal(9))
+        ```
+
         Args:
             puzzle (Sequence[T]): A sequence representing a Sudoku puzzle
             blank (T): The value used to represent a blank cell
+            topology (Optional[Topology], optional): The units of the puzzle. Defaults to rows, columns and the
+                most square boxes that fit the order.
+
+        Raises:
+            ValueError: If the puzzle is not square, does not fit the topology or uses more tokens than its order
         """
-        self.order = int(len(puzzle) ** 0.5)
-        self.tokens = self.Tokens([blank])
-        self.cells = np.empty(len(puzzle), dtype=object).tolist()
+        size = len(puzzle)
+        order = isqrt(size)
+        if order ** 2 != size or size == 0:
+            raise ValueError(f"A puzzle of {size} cells is not square")
 
-        for i, token in enumerate(puzzle):
+        tokens = self.Tokens([blank])
+        values = []
+        for token in puzzle:
             try:
-                v = self.tokens.index(token)
+                v = tokens.index(token)
             except ValueError:
-                self.tokens.append(token)
-                v = len(self.tokens) - 1
-            self.cells[i] = self.Cell(self, v)
+                tokens.append(token)
+                v = len(tokens) - 1
+                if v > order:
+                    raise ValueError(f"A puzzle of order {order} cannot have {v} tokens")
+            values.append(v)
+
+        self._load(order, tokens, values, topology)
+
+    def _load(self, order: int, tokens: Tokens, values: Sequence[int], topology: Optional[Topology]) -> None:
+        self.order = order
+        self.topology = topology if topology is not None else Topology.standard(order)
+        if self.topology.order != order:
+            raise ValueError(f"A puzzle of order {order} does not fit {self.topology}")
+
+        self.tokens = tokens
+        self._exports = {}
+        self._exports_tokens = []
+        self._failure = None
+        self._full = (1 << order) - 1
+        self._masks = [1 << (v - 1) if v else self._full for v in values]
+        self._values = list(values)
+        self._track()
+        self._cells = None
+
+    @classmethod
+    def _from_values(
+        cls, values: Sequence[int], tokens: Sequence[T], topology: Optional[Topology] = None
+    ) -> Puzzle[T]:
+        puzzle = object.__new__(cls)
+        puzzle._load(isqrt(len(values)), cls.Tokens(tokens), values, topology)
+        return puzzle
+
+    def freeze(self) -> FrozenPuzzle[T]:
+        """
+        Take an immutable, hashable snapshot of the values of the puzzle
 
-    def _shift_indices(self, *indices: int) -> None:
-        tmp = self.cells[indices[0]]
-        for i in range(1, len(indices)):
-            self.cells[indices[i - 1]] = self.cells[indices[i]]
-        self.cells[indices[-1]] = tmp
+        Returns:
+            FrozenPuzzle[T]: The values, tokens and topology of the puzzle without its candidates
+        """
+        from .frozen import FrozenPuzzle
+
+        return FrozenPuzzle.from_puzzle(self)
 
     def reflect(self, direction: str = "horizontal") -> None:
         """
@@ -221,16 +431,11 @@ class Puzzle(Generic[T]):
             direction (str): The direction over which to reflect. Defaults to "horizontal".
         """
         n = self.order
-        x = n // 2
         y = n - 1
         if direction == "horizontal":
-            for i in range(n):
-                for j in range(x):
-                    self._shift_indices(n * i + j, n * i + (y - j))
+            self._permute([n * i + (y - j) for i in range(n) for j in range(n)])
         else:
-            for i in range(x):
-                for j in range(n):
-                    self._shift_indices(n * i + j, n * (y - i) + j)
+            self._permute([n * (y - i) + j for i in range(n) for j in range(n)])
 
     def rotate(self, rotations=1) -> None:
         """
@@ -243,40 +448,48 @@ class Puzzle(Generic[T]):
         """
         if not isinstance(rotations, int):
             rotations = round(rotations)
-        if rotations % 4 == 0:
-            return
-        elif rotations % 2 == 0:
-            self.cells = np.flip(self.cells)
-            return
-        elif rotations < 0:
-            self.rotate(-1 * rotations + 2)
-        else:
-            n = self.order
-            x = n // 2
-            y = n - 1
-            for i in range(x):
-                for j in range(i, y - i):
-                    self._shift_indices(n * i + j, n * (y - j) + i, n * (y - i) + y - j, n * j + y - i)
-
-            self.rotate(rotations - 1)
+        n = self.order
+        y = n - 1
+        rotations %= 4
+        if rotations == 1:
+            self._permute([n * (y - j) + i for i in range(n) for j in range(n)], swap_axes=True)
+        elif rotations == 2:
+            self._permute(range(n * n - 1, -1, -1))
+        elif rotations == 3:
+            self._permute([n * j + (y - i) for i in range(n) for j in range(n)], swap_axes=True)
 
     def transpose(self) -> None:
         """
         Switch the rows and columns in the Sudoku board
         """
         n = self.order
-        for i in range(n):
-            for j in range(i + 1, n):
-                self._shift_indices(n * i + j, n * j + i)
+        self._permute([n * j + i for i in range(n) for j in range(n)], swap_axes=True)
 
-    def shuffle(self) -> None:
+    def shuffle(self, seed: Seed = None) -> None:
         """
         Shuffle the board using rotations, reflections, and token-swapping
+
+        The same seed always gives the same shuffle, and concurrent shuffles never share a generator.
+
+        Args:
+            seed (Seed, optional): A seed for a new generator, or a generator to draw from.
+                Defaults to None, which seeds a new generator from the operating system.
         """
-        self.tokens.shuffle()
+        generator = _generator(seed)
+        self.tokens.shuffle(generator)
         for _ in range(self.order // 2):
-            self.reflect(random.choice(("horizontal", "vertical")))
-            self.rotate(random.choice(range(4)))
+            self.reflect(generator.choice(("horizontal", "vertical")))
+            self.rotate(generator.choice(range(4)))
+
+    def _cached(self, key: Hashable, render: Callable[[], Any]) -> Any:
+        if self._exports_tokens != self.tokens:
+            self._exports.clear()
+            self._exports_tokens = list(self.tokens)
+        try:
+            return self._exports[key]
+        except KeyError:
+            rendered = self._exports[key] = render()
+            return rendered
 
     def to_1D(self) -> List[T]:
         """
@@ -285,7 +498,7 @@ class Puzzle(Generic[T]):
         Returns:
             List[T]: A 1D array of the Sudoku board in the board's original type
         """
-        return [self.tokens[c.value] for c in self.cells]
+        return list(map(self.tokens.__getitem__, self._values))
 
     def to_2D(self) -> List[List[T]]:
         """
@@ -294,7 +507,63 @@ class Puzzle(Generic[T]):
         Returns:
             List[T]: A 2D array of the Sudoku board in the board's original type
         """
-        return np.reshape(self.to_1D(), (self.order, self.order)).tolist()
+        cells = self.to_1D()
+        n = self.order
+        return [cells[i : i + n] for i in range(0, n * n, n)]
+
+    def to_array(self, aliases: bool = False) -> np.ndarray:
+        """
+        A method for getting back the Sudoku board as a 2-dimensional NumPy array
+
+        NumPy is an optional dependency, installed with the `numpy` extra, and is only imported by this method.
+
+        Args:
+            aliases (bool, optional): Whether to export the integer aliases of the tokens, with 0 for blank cells,
+                instead of the tokens themselves. Defaults to False.
+
+        Returns:
+            np.ndarray: An array of shape (order, order)
+        """
+        import numpy as np
+
+        if aliases:
+            dtype = np.uint8 if self.order < 256 else np.uint16
+            return np.array(self._values, dtype=dtype).reshape(self.order, self.order)
+        return np.array(self.to_1D()).reshape(self.order, self.order)
+
+    def to_candidates(self, packed: bool = False) -> np.ndarray:
+        """
+        A method for getting back the candidates of every cell as a NumPy tensor
+
+        Candidate `d` of a cell is found at position `d - 1` of the last axis. See `sudoku.tensors` to export many
+        puzzles at once.
+
+        Args:
+            packed (bool, optional): Whether to export the bitmask of every cell as a uint64 instead of one boolean
+                per candidate. Defaults to False.
+
+        Returns:
+            np.ndarray: A boolean tensor of shape (order, order, order), or an array of masks of shape
+                (order, order) when packed
+        """
+        from .tensors import to_candidates
+
+        return to_candidates([self], packed)[0]
+
+    def load_candidates(self, candidates: np.ndarray) -> None:
+        """
+        Replace the candidates of every cell with those of a NumPy tensor
+
+        Args:
+            candidates (np.ndarray): A boolean tensor of shape (order, order, order), or an array of masks of shape
+                (order, order)
+
+        Raises:
+            ValueError: If the tensor does not match the puzzle
+        """
+        from .tensors import load_candidates
+
+        load_candidates([self], candidates[None])
 
     def to_string(self) -> str:
         """
@@ -303,7 +572,16 @@ class Puzzle(Generic[T]):
         Returns:
             str: A string representation in the Sudoku board
         """
-        return "".join((str(c) for c in self.to_1D()))
+        return self._cached("string", self._render_string)
+
+    def _render_string(self) -> str:
+        return "".join(map([str(t) for t in self.tokens].__getitem__, self._values))
+
+    def __str__(self) -> str:
+        return self.to_string()
+
+    def __bytes__(self) -> bytes:
+        return self._cached("bytes", lambda: self.to_string().encode())
 
     def to_formatted_string(
         self,
@@ -329,53 +607,31 @@ class Puzzle(Generic[T]):
         Returns:
             str: A formatted string representing the Sudoku board
         """
-        unit = int(self.order ** 0.5)
-        token_width = max([len(str(t)) for t in self.tokens])
-
-        cell_width = token_width + 2
-        box_width = unit * (cell_width + 1) - 1
-
-        top_border = (
-            top_left_corner
-            + box_horizontal_border * (box_width)
-            + (inner_top_tower_corner + box_horizontal_border * (box_width)) * (unit - 1)
-            + top_right_corner
-        )
-        bottom_border = (
-            bottom_left_corner
-            + box_horizontal_border * (box_width)
-            + (inner_bottom_tower_corner + box_horizontal_border * (box_width)) * (unit - 1)
-            + bottom_right_corner
+        borders = (
+            cell_corner,
+            box_corner,
+            top_left_corner,
+            top_right_corner,
+            bottom_left_corner,
+            bottom_right_corner,
+            inner_top_tower_corner,
+            inner_bottom_tower_corner,
+            inner_left_floor_corner,
+            inner_right_floor_corner,
+            cell_horizontal_border,
+            box_horizontal_border,
+            cell_vertical_border,
+            box_vertical_border,
         )
-        floor_border = (
-            inner_left_floor_corner
-            + box_horizontal_border * (box_width)
-            + (box_corner + box_horizontal_border * (box_width)) * (unit - 1)
-            + inner_right_floor_corner
-        )
-        bar_border = (
-            box_vertical_border
-            + cell_horizontal_border * (cell_width)
-            + (cell_corner + cell_horizontal_border * (cell_width)) * (unit - 1)
-        ) * (unit) + box_vertical_border
-
-        formatted_str = f"{top_border}\n{box_vertical_border} "
-        for i, c in enumerate(self.cells):
-            v = c.value
-            formatted_str += f"{self.tokens[v] if not c.is_blank() else blank} "
-            if (i + 1) % (self.order * unit) == 0:
-                if i + 1 == len(self.cells):
-                    formatted_str += f"{box_vertical_border}\n{bottom_border}"
-                else:
-                    formatted_str += f"{box_vertical_border}\n{floor_border}\n{box_vertical_border} "
-            elif (i + 1) % self.order == 0:
-                formatted_str += f"{box_vertical_border}\n{bar_border}\n{box_vertical_border} "
-            elif (i + 1) % unit == 0:
-                formatted_str += f"{box_vertical_border} "
-            else:
-                formatted_str += f"{cell_vertical_border} "
 
-        return formatted_str
+        def render() -> str:
+            token_width = max([len(str(t)) for t in self.tokens])
+            template = _grid_template(self.order, self.topology.box_shape, token_width, borders)
+            padded = [f"{str(t):>{token_width}}" for t in self.tokens]
+            padded[0] = f"{blank:>{token_width}}"
+            return template.format(*map(padded.__getitem__, self._values))
+
+        return self._cached(("formatted", borders, blank), render)
 
     def is_solved(self) -> bool:
         """
@@ -384,19 +640,22 @@ class Puzzle(Generic[T]):
         Returns:
             bool: A boolean value indicating whether the puzzle is solved
         """
-        return not any(c.is_blank() for c in self.cells) and not self.has_conflicts()
+        return self._blanks == 0 and not self._conflicting
 
-    def solve(self, solver: Type[Solver] = StrategySolver) -> bool:
+    def solve(self, solver: Union[Solver, Type[Solver]] = StrategySolver) -> bool:
         """
         Solve the puzzle using one of the solvers
 
         Args:
-            solver (Solver, optional): The solver used to solve the puzzle. Defaults to StrategySolver.
+            solver (Union[Solver, Type[Solver]], optional): The solver used to solve the puzzle, either a configured
+                instance or a class to instantiate with its defaults. Defaults to StrategySolver.
 
         Returns:
             bool: A boolean value indicating whether the puzzle could be solved
         """
-        return solver().solve(self)
+        if isinstance(solver, type):
+            solver = solver()
+        return solver.solve(self)
 
     def has_solution(self) -> bool:
         """
@@ -405,7 +664,116 @@ class Puzzle(Generic[T]):
         Returns:
             bool: A boolean value indicating whether the puzzle has a solution
         """
-        return deepcopy(self).solve()
+        return self.copy().solve()
+
+    def is_minimal(self, workers: Optional[int] = None) -> bool:
+        """
+        Check whether the puzzle has a unique solution that no clue can be removed from without losing uniqueness
+
+        The solution is found once, and each clue is then checked by a single search for a solution with a different
+        value in its cell, starting from eliminations shared by every check. The checks stop at the first clue that
+        can be removed.
+
+        Args:
+            workers (Optional[int], optional): The number of worker processes checking clues at once.
+                Defaults to checking them one at a time.
+
+        Returns:
+            bool: A boolean value indicating whether the puzzle is minimal
+        """
+        from .minimal import all_necessary, unique_solution
+
+        solution = unique_solution(self._values, self.topology)
+        if solution is None:
+            return False
+        clues = [i for i, v in enumerate(self._values) if v]
+        return all_necessary(clues, solution, self.topology, workers)
+
+    def minimize(self, workers: Optional[int] = None) -> int:
+        """
+        Remove clues, in order, for as long as the puzzle keeps a unique solution, which leaves a minimal puzzle
+
+        The candidates of every blank cell are reset.
+
+        Args:
+            workers (Optional[int], optional): The number of worker processes used to find the clues that cannot
+                be removed up front. Defaults to checking every clue one at a time.
+
+        Raises:
+            ValueError: If the puzzle does not have a unique solution
+
+        Returns:
+            int: The number of clues removed
+        """
+        from .minimal import minimal_clues, unique_solution
+
+        solution = unique_solution(self._values, self.topology)
+        if solution is None:
+            raise ValueError("Only a puzzle with a unique solution can be minimized")
+        clues = [i for i, v in enumerate(self._values) if v]
+        kept = set(minimal_clues(clues, solution, self.topology, workers))
+        for i in range(len(self._values)):
+            if i not in kept:
+                self._set_mask(i, self._full)
+        return len(clues) - len(kept)
+
+    def copy(self) -> Puzzle[T]:
+        """
+        Make an independent copy of the puzzle that shares its topology
+
+        Returns:
+            Puzzle[T]: A puzzle with the same tokens and candidates
+        """
+        clone = object.__new__(type(self))
+        clone.order = self.order
+        clone.tokens = self.Tokens(self.tokens)
+        clone.topology = self.topology
+        clone._full = self._full
+        clone._masks = self._masks[:]
+        clone._values = self._values[:]
+        clone._counts = self._counts[:]
+        clone._conflicting = set(self._conflicting)
+        clone._blanks = self._blanks
+        clone._exports = {}
+        clone._exports_tokens = []
+        clone._failure = self._failure
+        clone._cells = None
+        return clone
+
+    def steps(self) -> Iterator[Step]:
+        """
+        Solve the puzzle one logical step at a time, in the same order as the StrategySolver
+
+        Each step is applied to the puzzle before it is yielded, so the trace can be consumed lazily and abandoned
+        at any point. Iteration stops once the puzzle is solved, a contradiction is met or no strategy makes progress.
+
+        Yields:
+            Step: The strategy, unit, eliminated candidates and placed values of every step
+        """
+        if self.contradiction() is not None:
+            return
+        try:
+            while not self.is_solved():
+                for strategy in essential_strategies(self.order):
+                    productive = False
+                    for step in strategy.steps(self):
+                        productive = True
+                        yield step
+                    if productive:
+                        break
+                else:
+                    return
+        except Contradiction as e:
+            self._fail(e)
+
+    def next_hint(self) -> Optional[Step]:
+        """
+        Find the next logical step without changing the puzzle
+
+        Returns:
+            Optional[Step]: The first productive step, or None if the puzzle is solved or no strategy applies
+        """
+        return next(self.copy().steps(), None)
 
     def rate(self) -> float:
         """
@@ -416,25 +784,16 @@ class Puzzle(Generic[T]):
         """
         if self.is_solved():
             return 0.0
-        if self.has_conflicts():
+        if self.contradiction() is not None:
             return 1.0
 
         strategy_eliminations: DefaultDict[str, int] = defaultdict(int)
 
-        puzzle_copy = deepcopy(self)
-
-        while not puzzle_copy.is_solved():
-            changes_made = False
-
-            for strategy in essential_strategies(puzzle_copy.order):
-                eliminations = strategy(puzzle_copy)
-                strategy_eliminations[strategy.name] += eliminations
-
-                if eliminations > 0:
-                    changes_made = True
-                    break
-            if not changes_made:
-                return 1.0
+        puzzle_copy = self.copy()
+        for step in puzzle_copy.steps():
+            strategy_eliminations[step.strategy] += len(step.eliminations)
+        if not puzzle_copy.is_solved():
+            return 1.0
 
         max_eliminations = self.order ** 3 - self.order ** 2
 
@@ -447,4 +806,60 @@ class Puzzle(Generic[T]):
         return rating
 
 
+@lru_cache(maxsize=64)
+def _grid_template(
+    order: int, box_shape: Optional[Tuple[int, int]], token_width: int, borders: Tuple[str, ...]
+) -> str:
+    (
+        cell_corner,
+        box_corner,
+        top_left_corner,
+        top_right_corner,
+        bottom_left_corner,
+        bottom_right_corner,
+        inner_top_tower_corner,
+        inner_bottom_tower_corner,
+        inner_left_floor_corner,
+        inner_right_floor_corner,
+        cell_horizontal_border,
+        box_horizontal_border,
+        cell_vertical_border,
+        box_vertical_border,
+    ) = (b.replace("{", "{{").replace("}", "}}") for b in borders)
+
+    box_rows, box_cols = box_shape or (order, order)
+    towers = order // box_cols
+    cell_width = token_width + 2
+    box_width = box_cols * (cell_width + 1) - 1
+
+    top_border = (
+        top_left_corner
+        + box_horizontal_border * (box_width)
+        + (inner_top_tower_corner + box_horizontal_border * (box_width)) * (towers - 1)
+        + top_right_corner
+    )
+    bottom_border = (
+        bottom_left_corner
+        + box_horizontal_border * (box_width)
+        + (inner_bottom_tower_corner + box_horizontal_border * (box_width)) * (towers - 1)
+        + bottom_right_corner
+    )
+    floor_border = (
+        inner_left_floor_corner
+        + box_horizontal_border * (box_width)
+        + (box_corner + box_horizontal_border * (box_width)) * (towers - 1)
+        + inner_right_floor_corner
+    )
+    bar_border = (
+        box_vertical_border
+        + cell_horizontal_border * (cell_width)
+        + (cell_corner + cell_horizontal_border * (cell_width)) * (box_cols - 1)
+    ) * (towers) + box_vertical_border
+
+    tower = (cell_vertical_border + " ").join(["{} "] * box_cols)
+    row = box_vertical_border + " " + (box_vertical_border + " ").join([tower] * towers) + box_vertical_border
+    band = f"\n{bar_border}\n".join([row] * box_rows)
+    return top_border + "\n" + f"\n{floor_border}\n".join([band] * (order // box_rows)) + "\n" + bottom_border
+
+
 __all__ = ("Puzzle",)
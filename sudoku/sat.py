@@ -0,0 +1,355 @@
+from __future__ import annotations
+
+import heapq
+import os
+from typing import Iterable, List, Optional, Sequence
+
+Clause = Sequence[int]
+"""A clause in DIMACS form, as nonzero integers where -v stands for the negation of variable v"""
+
+
+def _luby(i: int) -> int:
+    # The i-th term (from 1) of the Luby sequence 1, 1, 2, 1, 1, 2, 4, ...
+    size = 1
+    while size < i:
+        size = 2 * size + 1
+    while size != i:
+        size = (size - 1) // 2
+        if i > size:
+            i -= size
+    return (size + 1) // 2
+
+
+class CDCL:
+    """
+    A conflict-driven clause-learning SAT solver in pure Python
+
+    Clauses are watched by two literals, so that propagation only visits the clauses whose watch became false.
+    Conflicts are analysed to the first unique implication point, and the learned clauses steer the decisions
+    through decaying variable activities and saved phases. The search restarts along the Luby sequence, and the
+    learned clauses whose literals span the most decision levels are dropped once they outgrow the problem.
+
+    ```python
+    model = CDCL(3, [[1, 2], [-1, 3], [-2, -3]]).solve()
+    ```
+
+    Attributes:
+        variables (int): The number of variables, numbered from 1
+        conflicts (int): The number of conflicts met so far
+        decisions (int): The number of decisions made so far
+    """
+
+    RESTART_BASE = 64
+    """The number of conflicts in the first restart interval"""
+
+    DECAY = 0.95
+    """The factor by which variable activities decay after each conflict"""
+
+    variables: int
+    conflicts: int
+    decisions: int
+
+    def __init__(self, variables: int, clauses: Iterable[Clause]):
+        """
+        Args:
+            variables (int): The number of variables, numbered from 1
+            clauses (Iterable[Clause]): The clauses of the problem in DIMACS form
+        """
+        self.variables = variables
+        self.conflicts = 0
+        self.decisions = 0
+
+        literals = 2 * (variables + 1)
+        self._value = [0] * literals
+        self._level = [0] * (variables + 1)
+        self._reason: List[Optional[List[int]]] = [None] * (variables + 1)
+        self._activity = [0.0] * (variables + 1)
+        self._phase = [1] * (variables + 1)
+        self._increment = 1.0
+        self._watches: List[List[List[int]]] = [[] for _ in range(literals)]
+        self._trail: List[int] = []
+        self._limits: List[int] = []
+        self._head = 0
+        self._learned: List[List[int]] = []
+        self._lbd: dict = {}
+        self._heap = [(0.0, v) for v in range(1, variables + 1)]
+        self._ok = True
+
+        for clause in clauses:
+            if not self._add([2 * v if v > 0 else -2 * v + 1 for v in clause]):
+                self._ok = False
+                break
+
+    def _add(self, clause: List[int]) -> bool:
+        value = self._value
+        literals = []
+        for lit in set(clause):
+            if lit ^ 1 in literals or value[lit] == 1:
+                return True
+            if value[lit] == 0:
+                literals.append(lit)
+        if not literals:
+            return False
+        if len(literals) == 1:
+            return self._enqueue(literals[0], None) and self._propagate() is None
+        self._watches[literals[0]].append(literals)
+        self._watches[literals[1]].append(literals)
+        return True
+
+    def _enqueue(self, lit: int, reason: Optional[List[int]]) -> bool:
+        value = self._value
+        if value[lit]:
+            return value[lit] == 1
+        value[lit] = 1
+        value[lit ^ 1] = -1
+        var = lit >> 1
+        self._level[var] = len(self._limits)
+        self._reason[var] = reason
+        self._trail.append(lit)
+        return True
+
+    def _propagate(self) -> Optional[List[int]]:
+        value = self._value
+        watches = self._watches
+        trail = self._trail
+        level = self._level
+        reason = self._reason
+        depth = len(self._limits)
+        while self._head < len(trail):
+            false = trail[self._head] ^ 1
+            self._head += 1
+            watching = watches[false]
+            kept = 0
+            i = 0
+            count = len(watching)
+            while i < count:
+                clause = watching[i]
+                i += 1
+                if clause[0] == false:
+                    clause[0], clause[1] = clause[1], false
+                first = clause[0]
+                if value[first] == 1:
+                    watching[kept] = clause
+                    kept += 1
+                    continue
+                for k in range(2, len(clause)):
+                    lit = clause[k]
+                    if value[lit] != -1:
+                        clause[1], clause[k] = lit, false
+                        watches[lit].append(clause)
+                        break
+                else:
+                    watching[kept] = clause
+                    kept += 1
+                    if value[first] == -1:
+                        while i < count:
+                            watching[kept] = watching[i]
+                            kept += 1
+                            i += 1
+                        del watching[kept:]
+                        self._head = len(trail)
+                        return clause
+                    value[first] = 1
+                    value[first ^ 1] = -1
+                    level[first >> 1] = depth
+                    reason[first >> 1] = clause
+                    trail.append(first)
+            del watching[kept:]
+        return None
+
+    def _bump(self, var: int) -> None:
+        activity = self._activity
+        activity[var] += self._increment
+        if activity[var] > 1e100:
+            for v in range(1, self.variables + 1):
+                activity[v] *= 1e-100
+            self._increment *= 1e-100
+            self._heap = [(-activity[v], v) for v in range(1, self.variables + 1) if not self._value[2 * v]]
+            heapq.heapify(self._heap)
+        elif not self._value[2 * var]:
+            heapq.heappush(self._heap, (-activity[var], var))
+
+    def _analyse(self, conflict: List[int]) -> List[int]:
+        level = self._level
+        depth = len(self._limits)
+        seen = set()
+        learned = [0]
+        pending = 0
+        lit = -1
+        index = len(self._trail)
+        clause: Optional[List[int]] = conflict
+        while True:
+            assert clause is not None
+            for q in clause if lit < 0 else clause[1:]:
+                var = q >> 1
+                if var not in seen and level[var] > 0:
+                    seen.add(var)
+                    self._bump(var)
+                    if level[var] == depth:
+                        pending += 1
+                    else:
+                        learned.append(q)
+            while True:
+                index -= 1
+                lit = self._trail[index]
+                if lit >> 1 in seen:
+                    break
+            pending -= 1
+            if pending == 0:
+                break
+            # A reason clause always holds its implied literal first, which the next pass skips
+            clause = self._reason[lit >> 1]
+        learned[0] = lit ^ 1
+        self._increment /= self.DECAY
+        return learned
+
+    def _backtrack(self, depth: int) -> None:
+        if len(self._limits) <= depth:
+            return
+        start = self._limits[depth]
+        value = self._value
+        activity = self._activity
+        for lit in self._trail[start:]:
+            var = lit >> 1
+            self._phase[var] = lit & 1
+            value[lit] = value[lit ^ 1] = 0
+            self._reason[var] = None
+            heapq.heappush(self._heap, (-activity[var], var))
+        del self._trail[start:]
+        del self._limits[depth:]
+        self._head = start
+
+    def _decide(self) -> int:
+        heap = self._heap
+        value = self._value
+        while heap:
+            var = heapq.heappop(heap)[1]
+            if not value[2 * var]:
+                return 2 * var + self._phase[var]
+        return 0
+
+    def _reduce(self) -> None:
+        locked = {id(self._reason[lit >> 1]) for lit in self._trail}
+        self._learned.sort(key=lambda clause: self._lbd[id(clause)])
+        keep = len(self._learned) // 2
+        dropped = {id(c) for c in self._learned[keep:] if id(c) not in locked and self._lbd[id(c)] > 2}
+        if not dropped:
+            return
+        self._learned = [c for c in self._learned if id(c) not in dropped]
+        for key in dropped:
+            del self._lbd[key]
+        for watching in self._watches:
+            watching[:] = [c for c in watching if id(c) not in dropped]
+
+    def solve(self) -> Optional[List[int]]:
+        """
+        Search for an assignment that satisfies every clause
+
+        Returns:
+            Optional[List[int]]: The satisfying assignment as the list of true literals in DIMACS form, one for every
+                variable, or None if the clauses are unsatisfiable
+        """
+        if not self._ok or self._propagate() is not None:
+            return None
+
+        heapq.heapify(self._heap)
+        restarts = 1
+        budget = self.RESTART_BASE * _luby(restarts)
+        limit = max(1000, self.variables // 2)
+        while True:
+            conflict = self._propagate()
+            if conflict is not None:
+                self.conflicts += 1
+                if not self._limits:
+                    return None
+                learned = self._analyse(conflict)
+                if len(learned) == 1:
+                    self._backtrack(0)
+                else:
+                    # Watch the literal of the deepest remaining level second, where the backjump lands
+                    k = max(range(1, len(learned)), key=lambda k: self._level[learned[k] >> 1])
+                    learned[1], learned[k] = learned[k], learned[1]
+                    self._backtrack(self._level[learned[1] >> 1])
+                    self._watches[learned[0]].append(learned)
+                    self._watches[learned[1]].append(learned)
+                    self._learned.append(learned)
+                    self._lbd[id(learned)] = len({self._level[q >> 1] for q in learned})
+                self._enqueue(learned[0], learned if len(learned) > 1 else None)
+
+                budget -= 1
+                if budget <= 0:
+                    restarts += 1
+                    budget = self.RESTART_BASE * _luby(restarts)
+                    self._backtrack(0)
+                if len(self._learned) > limit:
+                    self._reduce()
+                    limit += limit // 10
+                continue
+
+            lit = self._decide()
+            if not lit:
+                return [v if self._value[2 * v] == 1 else -v for v in range(1, self.variables + 1)]
+            self.decisions += 1
+            self._limits.append(len(self._trail))
+            self._enqueue(lit, None)
+
+
+def write_dimacs(path: str, variables: int, clauses: Sequence[Clause]) -> None:
+    """
+    Write clauses to a file in the DIMACS CNF format
+
+    Args:
+        path (str): The path of the file
+        variables (int): The number of variables, numbered from 1
+        clauses (Sequence[Clause]): The clauses in DIMACS form
+    """
+    with open(path, "w") as f:
+        f.write(f"p cnf {variables} {len(clauses)}\n")
+        f.writelines(" ".join(map(str, clause)) + " 0\n" for clause in clauses)
+
+
+def solve_external(executable: str, variables: int, clauses: Sequence[Clause]) -> Optional[List[int]]:
+    """
+    Solve clauses with an external SAT solver that reads DIMACS and reports in the SAT competition format
+
+    Solvers such as kissat and cadical print an "s" line with the verdict and "v" lines with the model.
+
+    Args:
+        executable (str): The path or name of the solver's executable
+        variables (int): The number of variables, numbered from 1
+        clauses (Sequence[Clause]): The clauses in DIMACS form
+
+    Raises:
+        RuntimeError: If the solver does not report a verdict
+
+    Returns:
+        Optional[List[int]]: The satisfying assignment as true literals, or None if the clauses are unsatisfiable
+    """
+    import subprocess
+    import tempfile
+
+    fd, path = tempfile.mkstemp(suffix=".cnf")
+    os.close(fd)
+    try:
+        write_dimacs(path, variables, clauses)
+        result = subprocess.run([executable, path], capture_output=True, text=True)
+    finally:
+        os.remove(path)
+
+    verdict = None
+    model = [0] * (variables + 1)
+    for line in result.stdout.splitlines():
+        if line.startswith("s "):
+            verdict = line[2:].strip()
+        elif line.startswith("v "):
+            for lit in map(int, line[2:].split()):
+                if lit:
+                    model[abs(lit)] = lit
+    if verdict == "UNSATISFIABLE":
+        return None
+    if verdict != "SATISFIABLE":
+        raise RuntimeError(f"{executable} did not report a verdict: {result.stderr.strip() or result.stdout[-200:]}")
+    return [model[v] or -v for v in range(1, variables + 1)]
+
+
+__all__ = ("CDCL", "Clause", "write_dimacs", "solve_external")
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+from typing import FrozenSet, Generic, List, Optional, Set
+
+from .bitset import digits
+from .puzzle import Puzzle, T
+from .solvers.backtracking_solver import search
+
+
+class Session(Generic[T]):
+    """
+    An editable game around a puzzle, which keeps the candidates of every cell, the conflicts and a solution up to
+    date as single values are placed and erased.
+
+    Each edit only touches the peers of the edited cell. The values placed in every unit are kept as bitmasks, and
+    the puzzle's per-unit counts decide whether a value is still present after an erase, so that candidates are
+    restored correctly even when the erased value was a duplicate. A solution is found once and kept for as long as
+    the placed values agree with it, so most solvability checks do not search at all.
+
+    ```python
+    session = Session(puzzle)
+    session.place(10, 4)
+    if session.has_conflicts() or not session.is_solvable():
+        session.erase(10)
+    ```
+
+    Attributes:
+        puzzle (Puzzle[T]): The values of the game, whose blank cells keep all of their candidates
+        clues (FrozenSet[int]): The indices of the cells given by the puzzle, which cannot be edited
+    """
+
+    __slots__ = "puzzle", "clues", "_present", "_candidates", "_solution", "_wrong", "_solvable"
+
+    puzzle: Puzzle[T]
+    clues: FrozenSet[int]
+
+    def __init__(self, puzzle: Puzzle[T]):
+        """
+        Args:
+            puzzle (Puzzle[T]): The puzzle to play, which is copied. Its values are taken as the clues.
+        """
+        self.puzzle = puzzle.copy()
+        values = self.puzzle._values
+        full = self.puzzle._full
+        self.clues = frozenset(i for i, v in enumerate(values) if v)
+        for i, v in enumerate(values):
+            if not v:
+                self.puzzle._set_mask(i, full)
+
+        self._present = [0] * len(self.puzzle.topology.units)
+        for u, unit in enumerate(self.puzzle.topology.units):
+            for i in unit:
+                if values[i]:
+                    self._present[u] |= 1 << (values[i] - 1)
+        self._candidates = [1 << (v - 1) if v else self._allowed(i) for i, v in enumerate(values)]
+        self._solution: Optional[List[int]] = None
+        self._wrong: Set[int] = set()
+        self._solvable: Optional[bool] = None
+
+    def _allowed(self, index: int) -> int:
+        present = 0
+        for u in self.puzzle.topology.cell_units[index]:
+            present |= self._present[u]
+        return self.puzzle._full & ~present
+
+    def mask(self, index: int) -> int:
+        """
+        The bitmask of the candidates of a cell, in which bit `d - 1` stands for the integer alias `d`
+
+        Args:
+            index (int): The position of the cell
+
+        Returns:
+            int: The candidates of a blank cell, or the bit of the value of a filled cell
+        """
+        return self._candidates[index]
+
+    def candidates(self, index: int) -> Set[int]:
+        """
+        The integer aliases of the tokens that can be placed in a cell without repeating a value of its peers
+
+        Args:
+            index (int): The position of the cell
+
+        Returns:
+            Set[int]: The candidates of the cell
+        """
+        return set(digits(self._candidates[index]))
+
+    def place(self, index: int, value: int) -> None:
+        """
+        Place a value in a cell, replacing its previous value
+
+        Args:
+            index (int): The position of the cell
+            value (int): The integer alias of the token to place, or 0 to erase the cell
+
+        Raises:
+            ValueError: If the cell is a clue or the value is not an alias of the puzzle
+        """
+        if index in self.clues:
+            raise ValueError(f"Cell {index} is a clue and cannot be edited")
+        if not 0 <= value <= self.puzzle.order:
+            raise ValueError(f"A puzzle of order {self.puzzle.order} has no value {value}")
+        if value == self.puzzle._values[index]:
+            return
+        self.erase(index)
+        if not value:
+            return
+
+        b = 1 << (value - 1)
+        topology = self.puzzle.topology
+        values = self.puzzle._values
+        self.puzzle._set_mask(index, b)
+        for u in topology.cell_units[index]:
+            self._present[u] |= b
+        for p in topology.peers[index]:
+            if not values[p]:
+                self._candidates[p] &= ~b
+        self._candidates[index] = b
+
+        if self._solution is not None and self._solution[index] != value:
+            self._wrong.add(index)
+        self._solvable = None
+
+    def erase(self, index: int) -> None:
+        """
+        Erase the value of a cell and restore the candidates it had removed
+
+        Args:
+            index (int): The position of the cell
+
+        Raises:
+            ValueError: If the cell is a clue
+        """
+        if index in self.clues:
+            raise ValueError(f"Cell {index} is a clue and cannot be edited")
+        value = self.puzzle._values[index]
+        if not value:
+            return
+
+        b = 1 << (value - 1)
+        topology = self.puzzle.topology
+        values = self.puzzle._values
+        counts = self.puzzle._counts
+        width = self.puzzle.order + 1
+        self.puzzle._set_mask(index, self.puzzle._full)
+        for u in topology.cell_units[index]:
+            if not counts[u * width + value]:
+                self._present[u] &= ~b
+        self._candidates[index] = self._allowed(index)
+        for p in topology.peers[index]:
+            if not values[p] and not self._candidates[p] & b and self._allowed(p) & b:
+                self._candidates[p] |= b
+
+        self._wrong.discard(index)
+        self._solvable = None
+
+    def has_conflicts(self) -> bool:
+        """
+        A method to determine if the board has any conflicting cells
+
+        Returns:
+            bool: True if the board has conflicts, False otherwise
+        """
+        return self.puzzle.has_conflicts()
+
+    def conflicts(self) -> List[int]:
+        """
+        A method to list the cells that share a value with one of their peers
+
+        Returns:
+            List[int]: The sorted indices of the conflicting cells
+        """
+        return self.puzzle.conflicts()
+
+    def is_solved(self) -> bool:
+        """
+        Check whether every cell holds a value and no values conflict
+
+        Returns:
+            bool: A boolean value indicating whether the game is solved
+        """
+        return self.puzzle.is_solved()
+
+    def is_solvable(self) -> bool:
+        """
+        Check whether the placed values can still be completed to a solution
+
+        The kept solution answers immediately while every placed value agrees with it. Otherwise the board is
+        searched once, and the result is kept until the next edit.
+
+        Returns:
+            bool: A boolean value indicating whether the game can still be solved
+        """
+        if self.puzzle.has_conflicts():
+            return False
+        if self._solution is not None and not self._wrong:
+            return True
+        if self._solvable is None:
+            self._solvable = self._search()
+        return self._solvable
+
+    def solution(self) -> Optional[List[int]]:
+        """
+        A solution that agrees with the placed values
+
+        Returns:
+            Optional[List[int]]: The integer alias of every cell of the solution, or None if there is none
+        """
+        return self._solution[:] if self.is_solvable() and self._solution is not None else None
+
+    def _search(self) -> bool:
+        full = self.puzzle._full
+        found = next(search([1 << (v - 1) if v else full for v in self.puzzle._values], self.puzzle.topology), None)
+        if found is None:
+            return False
+        self._solution = [m.bit_length() for m in found]
+        self._wrong = set()
+        return True
+
+
+__all__ = ("Session",)
@@ -1,4 +1,8 @@
+from .auto_solver import AutoSolver
+from .backtracking_solver import BacktrackingSolver
+from .parallel_solver import ParallelSolver
+from .sat_solver import SATSolver
 from .solver import Solver
 from .strategy_solver import StrategySolver
 
-__all__ = ("Solver", "StrategySolver")
+__all__ = ("Solver", "AutoSolver", "BacktrackingSolver", "ParallelSolver", "SATSolver", "StrategySolver")
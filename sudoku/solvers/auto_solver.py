@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import os
+import threading
+from collections import Counter
+from time import perf_counter
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from ..bitset import popcount
+from .backtracking_solver import propagate, search
+from .parallel_solver import parallel_search
+from .solver import Solver
+
+if TYPE_CHECKING:
+    from ..puzzle import Puzzle, T
+
+
+class AutoSolver(Solver):
+    """
+    A solver that analyses each puzzle cheaply and routes it to the cheapest engine likely to solve it
+
+    The analysis places naked and hidden singles with `propagate`, which settles contradictions and easy puzzles on
+    its own. The remaining puzzles are searched from the propagated candidates, in a process pool when the order is
+    large and enough of the candidates remain open for the search to outweigh starting the pool. Every decision is
+    counted in `stats`, along with the time spent on each route in `seconds`. One instance can serve many threads,
+    as the counters are updated under a lock.
+
+    ```python
+    solver = AutoSolver()
+    for puzzle in puzzles:
+        puzzle.solve(solver)
+    print(solver.stats)
+    ```
+
+    Attributes:
+        workers (int): The number of worker processes of the parallel route
+        parallel_order (int): The smallest order searched in parallel
+        parallel_density (float): The smallest fraction of candidates left open after propagation for a puzzle
+            to be searched in parallel
+        stats (Counter[str]): The number of puzzles sent down each route
+        seconds (Dict[str, float]): The time spent on each route, including the analysis
+    """
+
+    ROUTES = ("conflict", "contradiction", "singles", "backtracking", "parallel")
+    """The routes a puzzle can take, in order of cost"""
+
+    workers: int
+    parallel_order: int
+    parallel_density: float
+    stats: Counter[str]
+    seconds: Dict[str, float]
+
+    def __init__(self, workers: Optional[int] = None, parallel_order: int = 25, parallel_density: float = 0.3):
+        """
+        Args:
+            workers (Optional[int], optional): The number of worker processes of the parallel route.
+                Defaults to the number of CPUs, and a single worker disables the route.
+            parallel_order (int, optional): The smallest order searched in parallel. Defaults to 25.
+            parallel_density (float, optional): The smallest fraction of candidates left open after propagation
+                for a puzzle to be searched in parallel. Defaults to 0.3.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.parallel_order = parallel_order
+        self.parallel_density = parallel_density
+        self.stats = Counter()
+        self.seconds = dict.fromkeys(self.ROUTES, 0.0)
+        self._lock = threading.Lock()
+
+    def analyse(self, puzzle: Puzzle[T]) -> Tuple[str, List[int]]:
+        """
+        Choose the route of a puzzle without changing it
+
+        Args:
+            puzzle (Puzzle[T]): The puzzle to analyse
+
+        Returns:
+            Tuple[str, List[int]]: The route and the candidate masks after propagation
+        """
+        masks = puzzle._masks[:]
+        if puzzle.has_conflicts() or 0 in masks:
+            return "conflict", masks
+
+        topology = puzzle.topology
+        assigned = [i for i, m in enumerate(masks) if not m & (m - 1)]
+        if not propagate(masks, topology, assigned, set(range(len(topology.units)))):
+            return "contradiction", masks
+
+        open_cells = [m for m in masks if m & (m - 1)]
+        if not open_cells:
+            return "singles", masks
+
+        density = sum(map(popcount, open_cells)) / (puzzle.order * len(masks))
+        if self.workers > 1 and puzzle.order >= self.parallel_order and density >= self.parallel_density:
+            return "parallel", masks
+        return "backtracking", masks
+
+    def solve(self, puzzle: Puzzle[T]) -> bool:
+        """
+        Solve the puzzle along the route chosen by `analyse`
+
+        Returns:
+            bool: A boolean value indicating whether the puzzle could be solved
+        """
+        start = perf_counter()
+        route, masks = self.analyse(puzzle)
+
+        solution: Optional[List[int]] = None
+        if route == "singles":
+            solution = masks
+        elif route == "backtracking":
+            solution = next(search(masks, puzzle.topology), None)
+        elif route == "parallel":
+            solutions = parallel_search(masks, puzzle.topology, 1, self.workers)
+            solution = solutions[0] if solutions else None
+
+        if solution is not None:
+            for i, mask in enumerate(solution):
+                puzzle._set_mask(i, mask)
+
+        elapsed = perf_counter() - start
+        with self._lock:
+            self.stats[route] += 1
+            self.seconds[route] += elapsed
+        return solution is not None
+
+
+__all__ = ("AutoSolver",)
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional, Sequence, Set
+
+from ..bitset import popcount
+from ..topology import Topology
+from .solver import Solver
+
+if TYPE_CHECKING:
+    from ..puzzle import Puzzle, T
+
+
+def propagate(masks: List[int], topology: Topology, assigned: List[int], dirty: Optional[Set[int]] = None) -> bool:
+    """
+    Remove the values of assigned cells from their peers and place hidden singles until nothing changes
+
+    Only the units containing a changed cell are rescanned for hidden singles.
+
+    Args:
+        masks (List[int]): The candidate masks of every cell, updated in place
+        topology (Topology): The units of the puzzle
+        assigned (List[int]): The indices of cells that were just reduced to a single candidate
+        dirty (Set[int], optional): The indices of units to scan for hidden singles in addition to those
+            touched by the propagation. Defaults to the units of the assigned cells.
+
+    Returns:
+        bool: False if a contradiction was found, True otherwise
+    """
+    units = topology.units
+    cell_units = topology.cell_units
+    peers = topology.peers
+    full = (1 << topology.order) - 1
+    if dirty is None:
+        dirty = set()
+    for i in assigned:
+        dirty.update(cell_units[i])
+
+    while True:
+        while assigned:
+            i = assigned.pop()
+            m = masks[i]
+            for p in peers[i]:
+                pm = masks[p]
+                if pm & m:
+                    pm &= ~m
+                    if not pm:
+                        return False
+                    masks[p] = pm
+                    dirty.update(cell_units[p])
+                    if not pm & (pm - 1):
+                        assigned.append(p)
+
+        while dirty:
+            unit = units[dirty.pop()]
+            once = twice = 0
+            for i in unit:
+                m = masks[i]
+                twice |= once & m
+                once |= m
+            if once != full:
+                return False
+            singles = once & ~twice
+            if singles:
+                for i in unit:
+                    m = masks[i]
+                    s = m & singles
+                    if s and s != m:
+                        if s & (s - 1):
+                            return False
+                        masks[i] = s
+                        assigned.append(i)
+            if assigned:
+                break
+
+        if not assigned:
+            return True
+        for i in assigned:
+            dirty.update(cell_units[i])
+
+
+def _most_constrained(masks: List[int]) -> int:
+    best = -1
+    fewest = 0
+    for i, m in enumerate(masks):
+        if m & (m - 1):
+            count = popcount(m)
+            if best < 0 or count < fewest:
+                best, fewest = i, count
+                if count == 2:
+                    break
+    return best
+
+
+def search(
+    masks: Sequence[int], topology: Topology, should_stop: Optional[Callable[[], bool]] = None
+) -> Iterator[List[int]]:
+    """
+    Enumerate the solutions of a grid of candidate masks by depth-first search
+
+    Every branch picks the cell with the fewest candidates and is pruned by `propagate`, and the search keeps an
+    explicit stack so that its depth is not limited by the recursion limit at large orders.
+
+    Args:
+        masks (Sequence[int]): The candidate masks of every cell
+        topology (Topology): The units of the puzzle
+        should_stop (Optional[Callable[[], bool]], optional): Polled every few thousand branches, ending the
+            search early once it returns True. Defaults to searching until the tree is exhausted.
+
+    Yields:
+        List[int]: The masks of a solution, each with a single candidate
+    """
+    root = list(masks)
+    assigned = [i for i, m in enumerate(root) if not m & (m - 1)]
+    if 0 in root or not propagate(root, topology, assigned, set(range(len(topology.units)))):
+        return
+
+    i = _most_constrained(root)
+    if i < 0:
+        yield root
+        return
+
+    stack = [(root, i, root[i])]
+    branches = 0
+    while stack:
+        branches += 1
+        if should_stop is not None and not branches & 4095 and should_stop():
+            return
+
+        state, i, remaining = stack.pop()
+        low = remaining & -remaining
+        if remaining != low:
+            stack.append((state, i, remaining ^ low))
+
+        child = state[:]
+        child[i] = low
+        if not propagate(child, topology, [i]):
+            continue
+
+        j = _most_constrained(child)
+        if j < 0:
+            yield child
+        else:
+            stack.append((child, j, child[j]))
+
+
+class BacktrackingSolver(Solver):
+    """
+    A depth-first search over candidate bitmasks with constraint propagation, which scales to large orders
+    where the logical strategies stall
+    """
+
+    def solve(self, puzzle: Puzzle[T]) -> bool:
+        """
+        Solve the puzzle using backtracking search
+
+        Returns:
+            bool: A boolean value indicating whether the puzzle could be solved
+        """
+        if puzzle.has_conflicts():
+            return False
+
+        solution = next(search(puzzle._masks, puzzle.topology), None)
+        if solution is None:
+            return False
+
+        for i, mask in enumerate(solution):
+            puzzle._set_mask(i, mask)
+        return True
+
+
+__all__ = ("BacktrackingSolver", "propagate", "search")
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import os
+from collections import deque
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Tuple
+
+from ..topology import Topology
+from .backtracking_solver import _most_constrained, propagate, search
+from .solver import Solver
+
+if TYPE_CHECKING:
+    from ..puzzle import Puzzle, T
+
+
+def split(masks: Sequence[int], topology: Topology, count: int) -> Tuple[List[List[int]], List[List[int]]]:
+    """
+    Divide the search tree of a grid breadth-first into independent subproblems
+
+    Branches are expanded at the shallowest level first, on the cell with the fewest candidates, until there are at
+    least `count` open subproblems or the tree is exhausted. Every subproblem has been propagated, and together
+    they hold exactly the solutions of the grid.
+
+    Args:
+        masks (Sequence[int]): The candidate masks of every cell
+        topology (Topology): The units of the puzzle
+        count (int): The number of subproblems to aim for
+
+    Returns:
+        Tuple[List[List[int]], List[List[int]]]: The solutions found while splitting and the open subproblems
+    """
+    root = list(masks)
+    assigned = [i for i, m in enumerate(root) if not m & (m - 1)]
+    if 0 in root or not propagate(root, topology, assigned, set(range(len(topology.units)))):
+        return [], []
+
+    solutions = []
+    frontier = deque([root])
+    while frontier and len(frontier) < count:
+        state = frontier.popleft()
+        i = _most_constrained(state)
+        if i < 0:
+            solutions.append(state)
+            continue
+
+        remaining = state[i]
+        while remaining:
+            low = remaining & -remaining
+            remaining ^= low
+            child = state[:]
+            child[i] = low
+            if propagate(child, topology, [i]):
+                frontier.append(child)
+
+    return solutions, list(frontier)
+
+
+_stop: Any = None
+
+
+def _start_worker(stop: Any) -> None:
+    global _stop
+    _stop = stop
+
+
+def _search_part(masks: List[int], topology: Topology, limit: int) -> List[List[int]]:
+    solutions = []
+    for solution in search(masks, topology, _stop.is_set if _stop is not None else None):
+        solutions.append(solution)
+        if len(solutions) >= limit:
+            break
+    return solutions
+
+
+def parallel_search(
+    masks: Sequence[int], topology: Topology, solutions: int = 1, workers: Optional[int] = None, split_factor: int = 4
+) -> List[List[int]]:
+    """
+    Find solutions of a grid of candidate masks by searching independent subtrees in a process pool
+
+    The tree is split into `split_factor` subproblems per worker, and idle workers take the next subproblem from the
+    queue so that uneven subtrees balance out. Once enough solutions are found, queued subproblems are cancelled
+    and running ones are told to stop.
+
+    Args:
+        masks (Sequence[int]): The candidate masks of every cell
+        topology (Topology): The units of the puzzle
+        solutions (int, optional): The number of solutions to look for. Defaults to 1.
+        workers (Optional[int], optional): The number of worker processes. Defaults to the number of CPUs.
+        split_factor (int, optional): The number of subproblems per worker. Defaults to 4.
+
+    Returns:
+        List[List[int]]: Up to `solutions` solutions, in the order they were found
+    """
+    workers = workers or os.cpu_count() or 1
+    found, parts = split(masks, topology, workers * split_factor)
+    if len(found) >= solutions or not parts:
+        return found[:solutions]
+
+    # The pool is only imported when a search is split, which keeps it off the import path of the package
+    import multiprocessing
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    context = multiprocessing.get_context()
+    stop = context.Event()
+    with ProcessPoolExecutor(workers, context, _start_worker, (stop,)) as executor:
+        pending = {executor.submit(_search_part, part, topology, solutions - len(found)) for part in parts}
+        try:
+            while pending and len(found) < solutions:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    found.extend(future.result())
+        finally:
+            stop.set()
+            for future in pending:
+                future.cancel()
+
+    return found[:solutions]
+
+
+class ParallelSolver(Solver):
+    """
+    A backtracking search that splits the tree at shallow branches and searches the parts in a process pool,
+    which brings down the wall-clock time of the hardest large puzzles
+
+    Starting the pool costs far more than solving an ordinary puzzle, so puzzles that propagation alone solves never
+    start one, and the solver is best kept for orders of 25 and above.
+
+    ```python
+    puzzle.solve(ParallelSolver(workers=8))
+    unique = len(ParallelSolver(solutions=2).find(puzzle)) == 1
+    ```
+
+    Attributes:
+        workers (Optional[int]): The number of worker processes, or None for the number of CPUs
+        solutions (int): The number of solutions `find` looks for before cancelling the remaining work
+        split_factor (int): The number of subproblems per worker
+    """
+
+    workers: Optional[int]
+    solutions: int
+    split_factor: int
+
+    def __init__(self, workers: Optional[int] = None, solutions: int = 1, split_factor: int = 4):
+        """
+        Args:
+            workers (Optional[int], optional): The number of worker processes. Defaults to the number of CPUs.
+            solutions (int, optional): The number of solutions `find` looks for. Defaults to 1.
+            split_factor (int, optional): The number of subproblems per worker. Defaults to 4.
+        """
+        self.workers = workers
+        self.solutions = solutions
+        self.split_factor = split_factor
+
+    def find(self, puzzle: Puzzle[T]) -> List[Puzzle[T]]:
+        """
+        Find up to `solutions` solutions of the puzzle without changing it
+
+        Args:
+            puzzle (Puzzle[T]): The puzzle to search
+
+        Returns:
+            List[Puzzle[T]]: A solved copy of the puzzle for every solution found
+        """
+        if puzzle.has_conflicts():
+            return []
+
+        copies = []
+        for solution in parallel_search(
+            puzzle._masks, puzzle.topology, self.solutions, self.workers, self.split_factor
+        ):
+            copy = puzzle.copy()
+            for i, mask in enumerate(solution):
+                copy._set_mask(i, mask)
+            copies.append(copy)
+        return copies
+
+    def solve(self, puzzle: Puzzle[T]) -> bool:
+        """
+        Solve the puzzle using a parallel backtracking search
+
+        Returns:
+            bool: A boolean value indicating whether the puzzle could be solved
+        """
+        if puzzle.has_conflicts():
+            return False
+
+        solution = parallel_search(puzzle._masks, puzzle.topology, 1, self.workers, self.split_factor)
+        if not solution:
+            return False
+
+        for i, mask in enumerate(solution[0]):
+            puzzle._set_mask(i, mask)
+        return True
+
+
+__all__ = ("ParallelSolver", "parallel_search", "split")
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import shutil
+from itertools import combinations
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
+
+from ..bitset import digits
+from ..sat import CDCL, solve_external
+from ..topology import Topology
+from .backtracking_solver import propagate
+from .solver import Solver
+
+if TYPE_CHECKING:
+    from ..puzzle import Puzzle, T
+
+EXECUTABLES = ("kissat", "cadical")
+"""The external SAT solvers looked for by `find_executable`, in order of preference"""
+
+
+def find_executable() -> Optional[str]:
+    """
+    Find an external SAT solver installed locally
+
+    Returns:
+        Optional[str]: The path of the first of `EXECUTABLES` on the PATH, or None if there is none
+    """
+    for name in EXECUTABLES:
+        path = shutil.which(name)
+        if path is not None:
+            return path
+    return None
+
+
+def encode_cnf(masks: Sequence[int], topology: Topology) -> Tuple[List[Tuple[int, int]], List[List[int]]]:
+    """
+    Encode the open candidates of a puzzle as clauses in conjunctive normal form
+
+    Only the candidates of cells with more than one are given variables, so the clauses shrink with every candidate
+    eliminated beforehand. Every open cell takes exactly one of its candidates, and every value missing from a unit
+    takes exactly one of the open cells of the unit that have it as a candidate.
+
+    Args:
+        masks (Sequence[int]): The candidate masks of every cell, with the values of solved cells already removed
+            from their peers
+        topology (Topology): The units of the puzzle
+
+    Returns:
+        Tuple[List[Tuple[int, int]], List[List[int]]]: The cell and candidate bit of every variable, the variable
+            numbered `k + 1` at position `k`, and the clauses in DIMACS form
+    """
+    variables: List[Tuple[int, int]] = []
+    index = {}
+    clauses: List[List[int]] = []
+    for i, m in enumerate(masks):
+        if m & (m - 1):
+            cell = []
+            for d in digits(m):
+                b = 1 << (d - 1)
+                variables.append((i, b))
+                index[i, b] = len(variables)
+                cell.append(len(variables))
+            clauses.append(cell)
+            clauses.extend([-x, -y] for x, y in combinations(cell, 2))
+
+    for unit in topology.units:
+        placed = 0
+        for i in unit:
+            m = masks[i]
+            if not m & (m - 1):
+                placed |= m
+        for d in digits(((1 << topology.order) - 1) & ~placed):
+            b = 1 << (d - 1)
+            cells = [index[i, b] for i in unit if (i, b) in index]
+            clauses.append(cells)
+            clauses.extend([-x, -y] for x, y in combinations(cells, 2))
+
+    return variables, clauses
+
+
+class SATSolver(Solver):
+    """
+    A solver that encodes the puzzle as a boolean satisfiability problem and hands it to a SAT solver
+
+    Naked and hidden singles are placed first, and only the candidates left open are encoded. The clauses are solved
+    by the pure-Python `CDCL` engine, or by an external solver that reads DIMACS and reports in the SAT competition
+    format when an executable is given. Clause learning cuts through the hardest and largest puzzles, where a plain
+    backtracking search revisits the same dead ends.
+
+    ```python
+    puzzle.solve(SATSolver())
+    puzzle.solve(SATSolver(find_executable()))
+    ```
+
+    Attributes:
+        executable (Optional[str]): The path of the external solver, or None to use the built-in engine
+    """
+
+    executable: Optional[str]
+
+    def __init__(self, executable: Optional[str] = None):
+        """
+        Args:
+            executable (Optional[str], optional): The path or name of an external solver, such as one found by
+                `find_executable`. Defaults to None, which uses the built-in engine.
+
+        Raises:
+            ValueError: If the executable cannot be found
+        """
+        if executable is not None:
+            path = shutil.which(executable)
+            if path is None:
+                raise ValueError(f"The SAT solver {executable} cannot be found")
+            executable = path
+        self.executable = executable
+
+    def solve(self, puzzle: Puzzle[T]) -> bool:
+        """
+        Solve the puzzle using a SAT solver
+
+        Returns:
+            bool: A boolean value indicating whether the puzzle could be solved
+        """
+        if puzzle.has_conflicts():
+            return False
+
+        masks = puzzle._masks[:]
+        topology = puzzle.topology
+        assigned = [i for i, m in enumerate(masks) if not m & (m - 1)]
+        if 0 in masks or not propagate(masks, topology, assigned, set(range(len(topology.units)))):
+            return False
+
+        variables, clauses = encode_cnf(masks, topology)
+        if clauses:
+            if self.executable is None:
+                model = CDCL(len(variables), clauses).solve()
+            else:
+                model = solve_external(self.executable, len(variables), clauses)
+            if model is None:
+                return False
+            for lit in model:
+                if lit > 0:
+                    i, b = variables[lit - 1]
+                    masks[i] = b
+
+        for i, mask in enumerate(masks):
+            puzzle._set_mask(i, mask)
+        return True
+
+
+__all__ = ("SATSolver", "encode_cnf", "find_executable")
@@ -8,6 +8,13 @@ if TYPE_CHECKING:
 
 
 class Solver(ABC):
+    """
+    The interface of every solver
+
+    Solvers are reentrant: `solve` keeps its working state local to the call, so one instance may serve many
+    threads at once, as long as no two threads solve the same puzzle at the same time.
+    """
+
     @abstractmethod
     def solve(self, puzzle: Puzzle[T]) -> bool:
         """Solve the puzzle in place.
@@ -1,22 +1,45 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Generator
+from functools import lru_cache
+from typing import TYPE_CHECKING, Tuple
 
-from ..strategies import HiddenSubset, NakedSubset, RefreshCandidates, Strategy
+from ..strategies import (
+    AlternatingInferenceChain,
+    Contradiction,
+    HiddenSubset,
+    NakedSubset,
+    PatternOverlay,
+    RefreshCandidates,
+    Strategy,
+    XChain,
+    XYChain,
+)
 from .solver import Solver
 
 if TYPE_CHECKING:
     from ..puzzle import Puzzle, T
 
 
-def essential_strategies(order: int) -> Generator[Strategy, None, None]:
+MAX_SUBSET_SIZE = 4
+"""The largest naked or hidden subset searched for, which bounds the cost of a pass at large orders"""
+
+
+@lru_cache(maxsize=None)
+def essential_strategies(order: int) -> Tuple[Strategy, ...]:
     """
-    Generator for strategies from simple to complex with a given order
+    The strategies from simple to complex with a given order
+
+    The instances are built once per order and shared by every solve, as strategies keep no state between calls.
     """
-    yield RefreshCandidates()
-    for s in range(1, order // 2):
-        yield NakedSubset(s)
-        yield HiddenSubset(s)
+    subsets = [(NakedSubset(s), HiddenSubset(s)) for s in range(1, min(order // 2, MAX_SUBSET_SIZE + 1))]
+    return (
+        RefreshCandidates(),
+        *(strategy for pair in subsets for strategy in pair),
+        XChain(),
+        XYChain(),
+        AlternatingInferenceChain(),
+        PatternOverlay(),
+    )
 
 
 class StrategySolver(Solver):
@@ -24,23 +47,29 @@ class StrategySolver(Solver):
         """
         Solve the puzzle using strategies
 
+        The solver gives up as soon as a strategy meets a contradiction, which `Puzzle.contradiction` then describes.
+
         Returns:
             bool: A boolean value indicating whether the puzzle could be solved
         """
-        if puzzle.has_conflicts():
+        if puzzle.contradiction() is not None:
             return False
 
-        while not puzzle.is_solved():
-            changed = False
+        try:
+            while not puzzle.is_solved():
+                changed = False
 
-            for strategy in essential_strategies(puzzle.order):
-                if strategy(puzzle) > 0:
-                    changed = True
-                    break
-            if not changed:
-                return False
+                for strategy in essential_strategies(puzzle.order):
+                    if strategy(puzzle) > 0:
+                        changed = True
+                        break
+                if not changed:
+                    return False
+        except Contradiction as e:
+            puzzle._fail(e)
+            return False
 
         return True
 
 
-__all__ = ("StrategySolver", "essential_strategies")
+__all__ = ("StrategySolver", "essential_strategies", "MAX_SUBSET_SIZE")
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import json
+import struct
+from typing import Any, Dict, List, Sequence, Tuple
+
+from .puzzle import Puzzle, T
+from .topology import Topology
+
+MAGIC = b"SDK"
+"""The first bytes of every encoded state"""
+
+VERSION = 1
+"""The version of the encoding written by `encode` and `encode_many`"""
+
+_HEADER = struct.Struct("<3sBB")
+_COUNT = struct.Struct("<I")
+_TOPOLOGY = struct.Struct("<BHHH")
+_SINGLE, _BATCH = 0, 1
+_STANDARD, _DIAGONAL, _UNITS = 0, 1, 2
+
+
+def _mask_format(order: int) -> str:
+    for code, bits in (("B", 8), ("H", 16), ("I", 32), ("Q", 64)):
+        if order <= bits:
+            return code
+    return ""
+
+
+def _encode_context(puzzle: Puzzle[T]) -> bytes:
+    # The topology and tokens of a puzzle, which a batch shares between all puzzles that have them in common
+    topology = puzzle.topology
+    kind = {"standard": _STANDARD, "diagonal": _DIAGONAL}.get(topology._key[0], _UNITS)
+    if topology.box_shape is None:
+        kind = _UNITS
+    rows, cols = topology.box_shape if topology.box_shape is not None else (0, 0)
+    parts = [_TOPOLOGY.pack(kind, puzzle.order, rows, cols)]
+    if kind == _UNITS:
+        parts.append(_COUNT.pack(len(topology.units)))
+        parts.append(struct.pack(f"<{len(topology.units) * puzzle.order}H", *(i for u in topology.units for i in u)))
+
+    tokens = list(puzzle.tokens)
+    alphabet = json.dumps(tokens, separators=(",", ":")).encode()
+    if json.loads(alphabet) != tokens:
+        raise ValueError(f"The tokens {tokens} cannot be encoded, only str, int, float, bool and None can")
+    parts.append(_COUNT.pack(len(alphabet)))
+    parts.append(alphabet)
+    return b"".join(parts)
+
+
+def _require(data: memoryview, end: int) -> None:
+    if end > len(data):
+        raise ValueError("The encoded puzzle state is truncated")
+
+
+def _decode_context(data: memoryview, offset: int) -> Tuple[Topology, List[Any], int]:
+    kind, order, rows, cols = _TOPOLOGY.unpack_from(data, offset)
+    offset += _TOPOLOGY.size
+    if kind == _STANDARD:
+        topology = Topology.standard(order, (rows, cols))
+    elif kind == _DIAGONAL:
+        topology = Topology.diagonal(order, (rows, cols))
+    else:
+        (count,) = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+        cells = struct.unpack_from(f"<{count * order}H", data, offset)
+        offset += 2 * count * order
+        units = [cells[u * order : (u + 1) * order] for u in range(count)]
+        topology = Topology(order, units, (rows, cols) if rows else None)
+
+    (length,) = _COUNT.unpack_from(data, offset)
+    offset += _COUNT.size
+    _require(data, offset + length)
+    tokens = json.loads(bytes(data[offset : offset + length]))
+    return topology, tokens, offset + length
+
+
+def _encode_cells(puzzle: Puzzle[T]) -> bytes:
+    # The values of the cells, a bitmap of the blank cells whose candidates were narrowed, and the masks of those
+    values = puzzle._values
+    size = len(values)
+    if puzzle.order < 16:
+        padded = values + [0] * (size % 2)
+        cells = bytes(padded[i] | padded[i + 1] << 4 for i in range(0, size, 2))
+    elif puzzle.order < 256:
+        cells = bytes(values)
+    else:
+        cells = struct.pack(f"<{size}H", *values)
+
+    full = puzzle._full
+    narrowed = [i for i, (v, m) in enumerate(zip(values, puzzle._masks)) if not v and m != full]
+    bitmap = sum(1 << i for i in narrowed).to_bytes((size + 7) // 8, "little")
+    masks = [puzzle._masks[i] for i in narrowed]
+    code = _mask_format(puzzle.order)
+    if code:
+        return cells + bitmap + struct.pack(f"<{len(masks)}{code}", *masks)
+    width = (puzzle.order + 7) // 8
+    return cells + bitmap + b"".join(m.to_bytes(width, "little") for m in masks)
+
+
+def _decode_cells(data: memoryview, offset: int, topology: Topology, tokens: List[Any]) -> Tuple[Puzzle, int]:
+    order = topology.order
+    size = order * order
+    if order < 16:
+        packed = data[offset : offset + (size + 1) // 2]
+        values = [v for byte in packed for v in (byte & 15, byte >> 4)][:size]
+        offset += (size + 1) // 2
+    elif order < 256:
+        values = list(data[offset : offset + size])
+        offset += size
+    else:
+        values = list(struct.unpack_from(f"<{size}H", data, offset))
+        offset += 2 * size
+
+    length = (size + 7) // 8
+    bitmap = int.from_bytes(data[offset : offset + length], "little")
+    offset += length
+    narrowed = [i for i in range(size) if bitmap >> i & 1]
+    code = _mask_format(order)
+    masks: Sequence[int]
+    if code:
+        masks = struct.unpack_from(f"<{len(narrowed)}{code}", data, offset)
+        offset += struct.calcsize(f"<{len(narrowed)}{code}")
+    else:
+        width = (order + 7) // 8
+        masks = [
+            int.from_bytes(data[offset + k * width : offset + (k + 1) * width], "little") for k in range(len(narrowed))
+        ]
+        offset += width * len(narrowed)
+
+    _require(data, offset)
+    puzzle = Puzzle._from_values(values, tokens, topology)
+    for i, mask in zip(narrowed, masks):
+        puzzle._set_mask(i, mask)
+    return puzzle, offset
+
+
+def _check_header(data: memoryview, kind: int) -> int:
+    magic, version, actual = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError("The data is not an encoded puzzle state")
+    if version != VERSION:
+        raise ValueError(f"Version {version} of the puzzle state encoding is not supported")
+    if actual != kind:
+        raise ValueError("The data holds a batch of puzzles" if actual == _BATCH else "The data holds a single puzzle")
+    return _HEADER.size
+
+
+def encode(puzzle: Puzzle[T]) -> bytes:
+    """
+    Encode the full state of a puzzle, including its candidates, tokens and topology, in a compact binary form
+
+    The values of the cells take half a byte each below order 16 and a byte each below order 256. Only the blank
+    cells whose candidates were narrowed store them, flagged in a bitmap and packed as bitmasks of the smallest
+    integer width that fits the order. The tokens must be str, int, float, bool or None.
+
+    Args:
+        puzzle (Puzzle[T]): The puzzle to encode
+
+    Raises:
+        ValueError: If the tokens of the puzzle cannot be encoded
+
+    Returns:
+        bytes: The versioned encoding of the puzzle
+    """
+    return _HEADER.pack(MAGIC, VERSION, _SINGLE) + _encode_context(puzzle) + _encode_cells(puzzle)
+
+
+def decode(data: bytes) -> Puzzle[Any]:
+    """
+    Restore a puzzle from the encoding written by `encode`
+
+    Args:
+        data (bytes): The encoded state
+
+    Raises:
+        ValueError: If the data is not an encoded puzzle of a supported version, or is truncated
+
+    Returns:
+        Puzzle[Any]: A puzzle with the same values, candidates, tokens and topology as the one encoded
+    """
+    view = memoryview(data)
+    try:
+        offset = _check_header(view, _SINGLE)
+        topology, tokens, offset = _decode_context(view, offset)
+        return _decode_cells(view, offset, topology, tokens)[0]
+    except struct.error as e:
+        raise ValueError("The encoded puzzle state is truncated") from e
+
+
+def encode_many(puzzles: Sequence[Puzzle[T]]) -> bytes:
+    """
+    Encode the full state of many puzzles together, storing each distinct combination of tokens and topology once
+
+    Args:
+        puzzles (Sequence[Puzzle[T]]): The puzzles to encode
+
+    Raises:
+        ValueError: If the tokens of a puzzle cannot be encoded
+
+    Returns:
+        bytes: The versioned encoding of the puzzles
+    """
+    contexts: Dict[Tuple[Any, ...], int] = {}
+    table: List[bytes] = []
+    records = []
+    for puzzle in puzzles:
+        key = (puzzle.topology, tuple(map(repr, puzzle.tokens)))
+        if key not in contexts:
+            contexts[key] = len(table)
+            table.append(_encode_context(puzzle))
+        records.append(_COUNT.pack(contexts[key]) + _encode_cells(puzzle))
+
+    parts = [_HEADER.pack(MAGIC, VERSION, _BATCH), _COUNT.pack(len(table)), *table, _COUNT.pack(len(records))]
+    return b"".join(parts + records)
+
+
+def decode_many(data: bytes) -> List[Puzzle[Any]]:
+    """
+    Restore the puzzles of the encoding written by `encode_many`
+
+    Args:
+        data (bytes): The encoded states
+
+    Raises:
+        ValueError: If the data is not an encoded batch of a supported version, or is truncated
+
+    Returns:
+        List[Puzzle[Any]]: The puzzles in the order they were encoded
+    """
+    view = memoryview(data)
+    try:
+        offset = _check_header(view, _BATCH)
+        (count,) = _COUNT.unpack_from(view, offset)
+        offset += _COUNT.size
+        table: List[Tuple[Topology, List[Any]]] = []
+        for _ in range(count):
+            topology, tokens, offset = _decode_context(view, offset)
+            table.append((topology, tokens))
+
+        (count,) = _COUNT.unpack_from(view, offset)
+        offset += _COUNT.size
+        puzzles = []
+        for _ in range(count):
+            (index,) = _COUNT.unpack_from(view, offset)
+            if index >= len(table):
+                raise ValueError(f"The encoded batch has no context {index}")
+            topology, tokens = table[index]
+            puzzle, offset = _decode_cells(view, offset + _COUNT.size, topology, tokens)
+            puzzles.append(puzzle)
+        return puzzles
+    except struct.error as e:
+        raise ValueError("The encoded batch of puzzle states is truncated") from e
+
+
+__all__ = ("MAGIC", "VERSION", "encode", "decode", "encode_many", "decode_many")
@@ -1,11 +1,19 @@
+from .chains import AlternatingInferenceChain, XChain, XYChain
 from .hidden_subset import HiddenSingle, HiddenSubset, PinnedDigit
 from .naked_subset import ForcedDigit, NakedDouble, NakedQuad, NakedSingle, NakedSubset, NakedTriple
+from .pattern_overlay import PatternOverlay
 from .refresh_candidates import RefreshCandidates
-from .strategy import Strategy
+from .strategy import Contradiction, Step, Strategy
 
 __all__ = (
     "Strategy",
+    "Step",
+    "Contradiction",
     "RefreshCandidates",
+    "PatternOverlay",
+    "XChain",
+    "XYChain",
+    "AlternatingInferenceChain",
     "HiddenSubset",
     "HiddenSingle",
     "PinnedDigit",
@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Iterator, List, Tuple
+
+from ..bitset import bit, digits
+from ..topology import Topology
+from .strategy import Step, Strategy
+
+if TYPE_CHECKING:
+    from ..puzzle import Puzzle, T
+
+MAX_CHAIN_LINKS = 6
+"""The default number of strong links in the longest chain searched for, which bounds the cost of a pass"""
+
+
+@lru_cache(maxsize=16)
+def _spread(topology: Topology) -> Tuple[int, ...]:
+    # The peers of every cell as a mask over the nodes of digit 1, which a shift moves to any other digit
+    order = topology.order
+    return tuple(sum(1 << (p * order) for p in peers) for peers in topology.peers)
+
+
+class LinkGraph:
+    """
+    The strong links between the candidates of a puzzle, kept up to date as candidates are eliminated
+
+    Candidate `d` of cell `i` is the node `i * order + d - 1`, and every set of nodes is a bitmask. Two candidates
+    are strongly linked when one of them must be true: the only two positions of a digit in a unit, or the only two
+    candidates of a cell. They are weakly linked when they cannot both be true: the same digit in two peers, or two
+    digits of the same cell. The weak links follow from the topology alone and are computed when needed.
+
+    Attributes:
+        puzzle (Puzzle): The puzzle whose candidates are linked
+        open (int): The candidates of the blank cells
+        units (List[int]): The nodes strongly linked to every node through a unit
+        cells (List[int]): The nodes strongly linked to every node through a cell
+    """
+
+    __slots__ = "puzzle", "open", "units", "cells", "_pairs", "_counts", "_spread"
+
+    puzzle: Puzzle
+    open: int
+    units: List[int]
+    cells: List[int]
+
+    def __init__(self, puzzle: Puzzle[T]):
+        order = puzzle.order
+        self.puzzle = puzzle
+        self.open = 0
+        self.units = [0] * (order * order * order)
+        self.cells = [0] * (order * order * order)
+        self._pairs: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        self._counts: Dict[Tuple[int, int], int] = {}
+        self._spread = _spread(puzzle.topology)
+
+        for i, (m, v) in enumerate(zip(puzzle._masks, puzzle._values)):
+            if not v:
+                self.open |= m << (i * order)
+                self._refresh_cell(i)
+        for u in range(len(puzzle.topology.units)):
+            for d in range(1, order + 1):
+                self._refresh_unit(u, d)
+
+    def _link(self, links: List[int], pair: Tuple[int, int], change: int) -> None:
+        count = self._counts.get(pair, 0) + change
+        self._counts[pair] = count
+        x, y = pair
+        if count == 0:
+            links[x] &= ~(1 << y)
+            links[y] &= ~(1 << x)
+        elif count == 1 and change > 0:
+            links[x] |= 1 << y
+            links[y] |= 1 << x
+
+    def _replace(self, links: List[int], key: Tuple[int, int], nodes: List[int]) -> None:
+        pair = (nodes[0], nodes[1]) if len(nodes) == 2 else None
+        old = self._pairs.get(key)
+        if old == pair:
+            return
+        if old is not None:
+            self._link(links, old, -1)
+            del self._pairs[key]
+        if pair is not None:
+            self._link(links, pair, 1)
+            self._pairs[key] = pair
+
+    def _refresh_cell(self, i: int) -> None:
+        order = self.puzzle.order
+        nodes = [] if self.puzzle._values[i] else [i * order + d - 1 for d in digits(self.puzzle._masks[i])]
+        self._replace(self.cells, (-1, i), nodes)
+
+    def _refresh_unit(self, u: int, d: int) -> None:
+        puzzle = self.puzzle
+        order = puzzle.order
+        b = bit(d)
+        nodes: List[int] = []
+        for i in puzzle.topology.units[u]:
+            if puzzle._values[i] == d:
+                nodes = []
+                break
+            if not puzzle._values[i] and puzzle._masks[i] & b:
+                nodes.append(i * order + d - 1)
+        self._replace(self.units, (u, d), nodes)
+
+    def remove(self, index: int, digit: int) -> None:
+        """
+        Update the links after a candidate was eliminated from a cell
+
+        Args:
+            index (int): The index of the cell
+            digit (int): The integer alias of the eliminated candidate
+        """
+        self.open &= ~(1 << (index * self.puzzle.order + digit - 1))
+        self._refresh_cell(index)
+        for u in self.puzzle.topology.cell_units[index]:
+            self._refresh_unit(u, digit)
+
+    def peers(self, node: int) -> int:
+        """
+        The nodes weakly linked to a node through the same digit in a peer
+
+        Args:
+            node (int): The node
+
+        Returns:
+            int: The weakly linked nodes
+        """
+        i, d = divmod(node, self.puzzle.order)
+        return self._spread[i] << d
+
+    def weak(self, node: int) -> int:
+        """
+        The nodes weakly linked to a node
+
+        Args:
+            node (int): The node
+
+        Returns:
+            int: The weakly linked nodes, through a peer or through the same cell
+        """
+        order = self.puzzle.order
+        i, d = divmod(node, order)
+        return (self._spread[i] << d) | (((1 << order) - 1) << (i * order) & ~(1 << node))
+
+
+class Chain(Strategy):
+    """
+    Eliminate candidates with chains that alternate between strong and weak links
+
+    A chain starts and ends with a strong link, so if its first candidate is false its last one is true, and any
+    candidate weakly linked to both ends can be eliminated. The chains are searched breadth first from every
+    candidate, up to a bounded number of strong links. Subclasses choose which links a chain may use.
+
+    Attributes:
+        max_links (int): The number of strong links in the longest chain searched for
+    """
+
+    __slots__ = ("max_links",)
+
+    UNIT_LINKS = True
+    """Whether a chain may use strong links between the positions of a digit in a unit"""
+
+    CELL_LINKS = True
+    """Whether a chain may use strong links between the candidates of a cell"""
+
+    CELL_WEAK_LINKS = True
+    """Whether a chain may use weak links between the candidates of a cell, besides those between peers"""
+
+    max_links: int
+
+    def __init__(self, difficulty: float, max_links: int = MAX_CHAIN_LINKS):
+        super().__init__(difficulty=difficulty)
+        self.max_links = max_links
+
+    def _strong(self, graph: LinkGraph, node: int) -> int:
+        links = 0
+        if self.UNIT_LINKS:
+            links |= graph.units[node]
+        if self.CELL_LINKS:
+            links |= graph.cells[node]
+        return links
+
+    def _search(self, graph: LinkGraph, start: int) -> Iterator[int]:
+        # The candidates eliminated by every chain from the start, each level ending one strong link further on
+        weak_start = graph.weak(start) & graph.open
+        frontier = self._strong(graph, start) & graph.open
+        seen = frontier | 1 << start
+        for level in range(self.max_links):
+            nxt = 0
+            for n in digits(frontier):
+                node = n - 1
+                targets = weak_start & graph.weak(node) & graph.open
+                if targets:
+                    yield targets
+                    return
+                if level + 1 < self.max_links:
+                    links = graph.weak(node) if self.CELL_WEAK_LINKS else graph.peers(node)
+                    for z in digits(links & graph.open):
+                        nxt |= self._strong(graph, z - 1)
+            frontier = nxt & graph.open & ~seen
+            if not frontier:
+                return
+            seen |= frontier
+
+    def steps(self, puzzle: Puzzle[T]) -> Iterator[Step]:
+        if self.max_links <= 0:
+            return
+
+        order = puzzle.order
+        graph = LinkGraph(puzzle)
+        for start in range(order * order * order):
+            if not graph.open >> start & 1 or not self._strong(graph, start):
+                continue
+            for targets in self._search(graph, start):
+                step = Step(self.name)
+                for n in digits(targets):
+                    i, d = divmod(n - 1, order)
+                    step.eliminate(puzzle, i, ~bit(d + 1))
+                for i, d in step.eliminations:
+                    graph.remove(i, d)
+                if step:
+                    yield step
+
+
+class XChain(Chain):
+    """
+    Apply the [X-Chain](http://sudopedia.enjoysudoku.com/X-Chain.html) strategy, a chain of a single digit
+    """
+
+    CELL_LINKS = False
+    CELL_WEAK_LINKS = False
+
+    def __init__(self, max_links: int = MAX_CHAIN_LINKS):
+        super().__init__(0.9, max_links)
+
+
+class XYChain(Chain):
+    """
+    Apply the [XY-Chain](http://sudopedia.enjoysudoku.com/XY-Chain.html) strategy, a chain of bivalue cells
+    """
+
+    UNIT_LINKS = False
+    CELL_WEAK_LINKS = False
+
+    def __init__(self, max_links: int = MAX_CHAIN_LINKS):
+        super().__init__(1.0, max_links)
+
+
+class AlternatingInferenceChain(Chain):
+    """
+    Apply the [Alternating Inference Chain](http://sudopedia.enjoysudoku.com/Alternating_Inference_Chain.html)
+    strategy, which may use every kind of link
+    """
+
+    def __init__(self, max_links: int = MAX_CHAIN_LINKS):
+        super().__init__(1.2, max_links)
+
+
+__all__ = ("Chain", "XChain", "XYChain", "AlternatingInferenceChain", "LinkGraph", "MAX_CHAIN_LINKS")
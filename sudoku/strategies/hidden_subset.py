@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import itertools
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator
 
-from .strategy import Strategy
+from ..bitset import bit, digits, popcount, subsets
+from .strategy import Contradiction, Step, Strategy
 
 if TYPE_CHECKING:
     from ..puzzle import Puzzle, T
@@ -23,34 +23,49 @@ class HiddenSubset(Strategy):
         self.name += f" - {size}"
         self.size = size
 
-    def __call__(self, puzzle: Puzzle[T]) -> int:
+    def steps(self, puzzle: Puzzle[T]) -> Iterator[Step]:
         if self.size <= 0 or self.size >= puzzle.order:
-            return 0
+            return
 
         complement_size = puzzle.order - self.size
         if complement_size < self.size:
             from .naked_subset import NakedSubset
 
-            return NakedSubset(complement_size)(puzzle)
-
-        candidate_eliminations = 0
-        for b, blank in puzzle._blank():
-            if len(blank.candidates) >= self.size:
-                for house in [puzzle._row, puzzle._col, puzzle._box]:
-                    for hidden_candidates in itertools.combinations(blank.candidates, self.size):
-                        subset = set(
-                            p for p, peer in house(b) if (any((hc in peer.candidates) for hc in hidden_candidates))
-                        )
-                        subset.add(b)
-
-                        if len(subset) == self.size:
-                            for s in subset:
-                                before_size = len(puzzle.cells[s].candidates)
-                                puzzle.cells[s].candidates = set(hidden_candidates)
-                                after_size = len(puzzle.cells[s].candidates)
-                                candidate_eliminations += before_size - after_size
-
-        return candidate_eliminations
+            yield from NakedSubset(complement_size).steps(puzzle)
+            return
+
+        masks = puzzle._masks
+        values = puzzle._values
+        for u, unit in enumerate(puzzle.topology.units):
+            blanks = [i for i in unit if values[i] == 0]
+            if len(blanks) <= self.size:
+                continue
+            placed = 0
+            for i in unit:
+                if values[i]:
+                    placed |= masks[i]
+            hidden_digits = []
+            positions = []
+            for d in digits(puzzle._full & ~placed):
+                b = bit(d)
+                position = 0
+                for k, i in enumerate(blanks):
+                    if masks[i] & b:
+                        position |= 1 << k
+                if not position:
+                    raise Contradiction(Contradiction.MISSING, u, d)
+                if popcount(position) <= self.size:
+                    hidden_digits.append(b)
+                    positions.append(position)
+            for chosen, union in subsets(positions, self.size):
+                hidden_candidates = 0
+                for k in chosen:
+                    hidden_candidates |= hidden_digits[k]
+                step = Step(self.name, u)
+                for k in digits(union):
+                    step.eliminate(puzzle, blanks[k - 1], hidden_candidates)
+                if step:
+                    yield step
 
 
 class HiddenSingle(HiddenSubset):
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator
 
-from .strategy import Strategy
+from ..bitset import popcount, subsets
+from .strategy import Step, Strategy
 
 if TYPE_CHECKING:
     from ..puzzle import Puzzle, T
@@ -20,36 +21,32 @@ class NakedSubset(Strategy):
         self.name += f" - {size}"
         self.size = size
 
-    def __call__(self, puzzle: Puzzle[T]) -> int:
+    def steps(self, puzzle: Puzzle[T]) -> Iterator[Step]:
         if self.size <= 0 or self.size >= puzzle.order:
-            return 0
+            return
 
         complement_size = puzzle.order - self.size
         if complement_size < self.size:
             from .hidden_subset import HiddenSubset
 
-            return HiddenSubset(complement_size)(puzzle)
-
-        candidate_eliminations = 0
-        for b, blank in puzzle._blank():
-            if len(blank.candidates) == self.size:
-                for house in [puzzle._row, puzzle._col, puzzle._box]:
-                    complement = set(
-                        p
-                        for p, peer in house(b)
-                        if (
-                            len(peer.candidates) > self.size
-                            or any((pc not in blank.candidates) for pc in peer.candidates)
-                        )
-                    )
-                    if len(complement) == complement_size:
-                        for p in complement:
-                            for c in blank.candidates:
-                                if c in puzzle.cells[p].candidates:
-                                    puzzle.cells[p].candidates.remove(c)
-                                    candidate_eliminations += 1
-
-        return candidate_eliminations
+            yield from HiddenSubset(complement_size).steps(puzzle)
+            return
+
+        masks = puzzle._masks
+        values = puzzle._values
+        for u, unit in enumerate(puzzle.topology.units):
+            blanks = [i for i in unit if values[i] == 0]
+            if len(blanks) <= self.size:
+                continue
+            small = [i for i in blanks if popcount(masks[i]) <= self.size]
+            for chosen, union in subsets([masks[i] for i in small], self.size):
+                members = {small[k] for k in chosen}
+                step = Step(self.name, u)
+                for i in blanks:
+                    if i not in members:
+                        step.eliminate(puzzle, i, ~union)
+                if step:
+                    yield step
 
 
 class NakedSingle(NakedSubset):
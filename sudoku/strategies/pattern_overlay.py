@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from ..bitset import bit, digits, popcount
+from ..topology import Topology
+from .strategy import Contradiction, Step, Strategy
+
+if TYPE_CHECKING:
+    from ..puzzle import Puzzle, T
+
+TEMPLATE_ORDER = 9
+"""The largest order whose templates are enumerated in full and cached, as there are 46656 of them at order 9"""
+
+CHUNK_SIZE = 1 << 21
+"""The number of template words compared at once by the NumPy kernel, which bounds its memory"""
+
+Row = Tuple[int, int]
+"""The cells holding a digit as a candidate and the cells it is placed in, both as bitmasks over cells"""
+
+
+def _numpy() -> Any:
+    # NumPy is optional, and only imported once templates are first filtered
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+@lru_cache(maxsize=16)
+def _geometry(topology: Topology) -> Tuple[Tuple[int, ...], Tuple[int, ...], Tuple[int, ...]]:
+    # The cells of every unit, the cells each cell rules out when chosen, and the units each cell covers, as bitmasks
+    units = tuple(sum(1 << i for i in unit) for unit in topology.units)
+    reach = tuple((1 << i) | sum(1 << p for p in peers) for i, peers in enumerate(topology.peers))
+    cover = tuple(sum(1 << u for u in us) for us in topology.cell_units)
+    return units, reach, cover
+
+
+def _enumerate(topology: Topology, allowed: int, required: int, budget: Optional[int]) -> Optional[List[int]]:
+    # Every template within the allowed cells that includes the required ones, branching on the unit with the
+    # fewest options, or None if the search visits more nodes than the budget
+    units, reach, cover = _geometry(topology)
+    everything = (1 << len(units)) - 1
+    chosen = covered = 0
+    for d in digits(required):
+        i = d - 1
+        if not allowed >> i & 1:
+            return []
+        chosen |= 1 << i
+        covered |= cover[i]
+        allowed &= ~reach[i]
+
+    templates = []
+    nodes = 0
+    stack = [(chosen, allowed, covered)]
+    while stack:
+        chosen, allowed, covered = stack.pop()
+        nodes += 1
+        if budget is not None and nodes > budget:
+            return None
+        if covered == everything:
+            templates.append(chosen)
+            continue
+        best, fewest = 0, -1
+        rest = everything & ~covered
+        while rest:
+            low = rest & -rest
+            rest ^= low
+            options = units[low.bit_length() - 1] & allowed
+            count = popcount(options)
+            if fewest < 0 or count < fewest:
+                best, fewest = options, count
+                if count <= 1:
+                    break
+        for d in digits(best):
+            i = d - 1
+            stack.append((chosen | 1 << i, allowed & ~reach[i], covered | cover[i]))
+    return templates
+
+
+@lru_cache(maxsize=8)
+def templates(topology: Topology) -> Optional[Tuple[int, ...]]:
+    """
+    The placements of a single digit that fill every unit of a topology exactly once
+
+    The templates are enumerated once per topology and shared between all puzzles and strategies.
+
+    Args:
+        topology (Topology): The units of the puzzle
+
+    Returns:
+        Optional[Tuple[int, ...]]: Every template as a bitmask over cells, or None if the order is above
+            `TEMPLATE_ORDER`
+    """
+    if topology.order > TEMPLATE_ORDER:
+        return None
+    size = topology.order * topology.order
+    return tuple(_enumerate(topology, (1 << size) - 1, 0, None) or ())
+
+
+@lru_cache(maxsize=8)
+def _template_words(topology: Topology) -> Any:
+    # The cached templates as 64-bit words, one row per word position so that every row is contiguous
+    np = _numpy()
+    width = (topology.order * topology.order + 63) // 64
+    shared = templates(topology) or ()
+    return np.array([[t >> (64 * w) & 0xFFFFFFFFFFFFFFFF for t in shared] for w in range(width)], dtype=np.uint64)
+
+
+def _filter_numpy(topology: Topology, rows: Sequence[Row]) -> List[Optional[Row]]:
+    np = _numpy()
+    words = _template_words(topology)
+    width, count = words.shape
+    zero, ones = np.uint64(0), np.uint64(0xFFFFFFFFFFFFFFFF)
+
+    def split(masks: List[int]) -> Any:
+        return np.array([[m >> (64 * w) & 0xFFFFFFFFFFFFFFFF for w in range(width)] for m in masks], dtype=np.uint64)
+
+    candidates = split([row[0] for row in rows])
+    placed = split([row[1] for row in rows])
+    step = max(1, CHUNK_SIZE // max(1, count * width))
+    results: List[Optional[Row]] = []
+    for start in range(0, len(rows), step):
+        c = candidates[start : start + step]
+        p = placed[start : start + step]
+        valid = np.ones((len(c), count), dtype=bool)
+        for w in range(width):
+            t = words[w]
+            valid &= (t & ~c[:, w, None]) == 0
+            valid &= (t & p[:, w, None]) == p[:, w, None]
+        union = [np.bitwise_or.reduce(np.where(valid, words[w], zero), axis=1) for w in range(width)]
+        common = [np.bitwise_and.reduce(np.where(valid, words[w], ones), axis=1) for w in range(width)]
+        for k, matches in enumerate(valid.any(axis=1).tolist()):
+            if not matches:
+                results.append(None)
+                continue
+            u = sum(int(union[w][k]) << (64 * w) for w in range(width))
+            i = sum(int(common[w][k]) << (64 * w) for w in range(width))
+            results.append((u, i))
+    return results
+
+
+def _filter_python(shared: Sequence[int], rows: Sequence[Row]) -> List[Optional[Row]]:
+    results: List[Optional[Row]] = []
+    for candidates, placed in rows:
+        union, common, matches = 0, -1, False
+        excluded = ~candidates
+        for t in shared:
+            if not t & excluded and t & placed == placed:
+                union |= t
+                common &= t
+                matches = True
+        results.append((union, common) if matches else None)
+    return results
+
+
+def overlay(topology: Topology, rows: Sequence[Row], budget: int) -> List[Optional[Row]]:
+    """
+    Overlay the templates of a topology on the positions of digits
+
+    Up to `TEMPLATE_ORDER` the cached templates are filtered with NumPy when it is installed and in pure Python
+    otherwise. Above it, the templates of every digit are enumerated within its candidates, and a digit whose search
+    outgrows the budget is left as it is.
+
+    Args:
+        topology (Topology): The units of the puzzles
+        rows (Sequence[Row]): The candidate cells and placed cells of every digit to overlay
+        budget (int): The number of search nodes allowed per digit above `TEMPLATE_ORDER`
+
+    Returns:
+        List[Optional[Row]]: The union and the intersection of the templates that fit every row, or None if no
+            template fits
+    """
+    shared = templates(topology)
+    if shared is not None:
+        if not rows:
+            return []
+        if _numpy() is not None:
+            return _filter_numpy(topology, rows)
+        return _filter_python(shared, rows)
+
+    results: List[Optional[Row]] = []
+    for candidates, placed in rows:
+        found = _enumerate(topology, candidates, placed, budget)
+        if found is None:
+            results.append((candidates, placed))
+            continue
+        union, common = 0, -1
+        for t in found:
+            union |= t
+            common &= t
+        results.append((union, common) if found else None)
+    return results
+
+
+class PatternOverlay(Strategy):
+    """
+    Apply the [Pattern Overlay](http://sudopedia.enjoysudoku.com/Pattern_Overlay_Method.html) method
+
+    A template places a digit once in every unit. A digit can only be placed in the cells of the templates that fit
+    its candidates and placed values, and must be placed in the cells they all share.
+
+    Attributes:
+        budget (int): The number of search nodes allowed per digit for orders whose templates are not cached
+    """
+
+    __slots__ = ("budget",)
+
+    budget: int
+
+    def __init__(self, budget: int = 5000):
+        super().__init__(difficulty=1.5)
+        self.budget = budget
+
+    @staticmethod
+    def _rows(puzzle: Puzzle[T]) -> Dict[int, Row]:
+        order = puzzle.order
+        candidates = [0] * (order + 1)
+        placed = [0] * (order + 1)
+        for i, (m, v) in enumerate(zip(puzzle._masks, puzzle._values)):
+            if v:
+                placed[v] |= 1 << i
+                candidates[v] |= 1 << i
+            else:
+                for d in digits(m):
+                    candidates[d] |= 1 << i
+        return {d: (candidates[d], placed[d]) for d in range(1, order + 1) if popcount(placed[d]) < order}
+
+    def _apply(self, puzzle: Puzzle[T], rows: Dict[int, Row], results: Sequence[Optional[Row]]) -> Iterator[Step]:
+        for (d, (candidates, placed)), result in zip(rows.items(), results):
+            if result is None:
+                raise Contradiction(Contradiction.UNPLACEABLE, -1, d)
+            union, common = result
+            b = bit(d)
+            step = Step(self.name)
+            for k in digits(candidates & ~union):
+                step.eliminate(puzzle, k - 1, ~b)
+            for k in digits(common & ~placed):
+                step.eliminate(puzzle, k - 1, b)
+            if step:
+                yield step
+
+    def steps(self, puzzle: Puzzle[T]) -> Iterator[Step]:
+        rows = self._rows(puzzle)
+        yield from self._apply(puzzle, rows, overlay(puzzle.topology, list(rows.values()), self.budget))
+
+    def apply_many(self, puzzles: Sequence[Puzzle[T]]) -> List[Optional[int]]:
+        """
+        Apply the strategy to many puzzles at once, filtering the templates for all puzzles of a topology together
+
+        Args:
+            puzzles (Sequence[Puzzle[T]]): The sudoku puzzles
+
+        Returns:
+            List[Optional[int]]: The number of candidates eliminated from every puzzle, or None for the puzzles
+                found to have no solution
+        """
+        groups: Dict[Topology, List[int]] = {}
+        for k, puzzle in enumerate(puzzles):
+            groups.setdefault(puzzle.topology, []).append(k)
+
+        counts: List[Optional[int]] = [0] * len(puzzles)
+        for topology, members in groups.items():
+            rows = [self._rows(puzzles[k]) for k in members]
+            results = overlay(topology, [row for r in rows for row in r.values()], self.budget)
+            start = 0
+            for k, r in zip(members, rows):
+                try:
+                    steps = self._apply(puzzles[k], r, results[start : start + len(r)])
+                    counts[k] = sum(len(step.eliminations) for step in steps)
+                except Contradiction:
+                    counts[k] = None
+                start += len(r)
+        return counts
+
+
+__all__ = ("PatternOverlay", "templates", "overlay", "TEMPLATE_ORDER")
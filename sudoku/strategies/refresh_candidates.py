@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator
 
-from .strategy import Strategy
+from .strategy import Step, Strategy
 
 if TYPE_CHECKING:
     from ..puzzle import Puzzle, T
@@ -16,15 +16,17 @@ class RefreshCandidates(Strategy):
     def __init__(self):
         super().__init__(difficulty=0.769)
 
-    def __call__(self, puzzle: Puzzle[T]) -> int:
-        candidate_eliminations = 0
-        for i, cell in enumerate(puzzle.cells):
-            for _, peer in puzzle._peers(i):
-                if cell.is_blank() and not peer.is_blank():
-                    if peer.value in cell.candidates:
-                        cell.candidates.remove(peer.value)
-                        candidate_eliminations += 1
-        return candidate_eliminations
+    def steps(self, puzzle: Puzzle[T]) -> Iterator[Step]:
+        values = puzzle._values
+        for i, peers in enumerate(puzzle.topology.peers):
+            if values[i]:
+                step = Step(self.name)
+                keep = ~puzzle._masks[i]
+                for p in peers:
+                    if values[p] == 0:
+                        step.eliminate(puzzle, p, keep)
+                if step:
+                    yield step
 
 
 __all__ = "RefreshCandidates"
@@ -1,15 +1,125 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
+
+from ..bitset import digits
 
 if TYPE_CHECKING:
     from ..puzzle import Puzzle, T
 
 
-class Strategy:
+class Contradiction(Exception):
+    """
+    Raised as soon as the candidates of a puzzle show that it has no solution
+
+    Attributes:
+        reason (str): One of `EMPTY`, `MISSING`, `DUPLICATE` or `UNPLACEABLE`
+        index (int): The index of the cell left without candidates, or of the unit missing or duplicating a digit,
+            or -1 when no single unit is at fault
+        digit (int): The integer alias of the missing or duplicated digit, or 0 for a cell without candidates
+    """
+
+    EMPTY = "empty"
+    """A cell has no candidates left"""
+
+    MISSING = "missing"
+    """A digit has no possible position in a unit"""
+
+    DUPLICATE = "duplicate"
+    """A digit is placed twice in a unit"""
+
+    UNPLACEABLE = "unplaceable"
+    """A digit has positions in every unit, but no way to fill all of them at once"""
+
+    reason: str
+    index: int
+    digit: int
+
+    def __init__(self, reason: str, index: int, digit: int = 0):
+        messages = {
+            self.EMPTY: f"Cell {index} has no candidates",
+            self.MISSING: f"Digit {digit} has no possible position in unit {index}",
+            self.DUPLICATE: f"Digit {digit} is placed more than once in unit {index}",
+            self.UNPLACEABLE: f"Digit {digit} cannot be placed once in every unit",
+        }
+        super().__init__(messages[reason])
+        self.reason = reason
+        self.index = index
+        self.digit = digit
+
+
+class Step:
+    """
+    A single productive application of a strategy, such as one naked pair in one unit
+
+    Attributes:
+        strategy (str): The name of the strategy
+        unit (Optional[int]): The index of the unit in the puzzle's topology that the step applies to, or None if
+            the step is not confined to a single unit
+        eliminations (List[Tuple[int, int]]): The cell index and integer alias of every eliminated candidate
+        placements (List[Tuple[int, int]]): The cell index and integer alias of every value placed by the step
+    """
+
+    __slots__ = "strategy", "unit", "eliminations", "placements"
+
+    strategy: str
+    unit: Optional[int]
+    eliminations: List[Tuple[int, int]]
+    placements: List[Tuple[int, int]]
+
+    def __init__(self, strategy: str, unit: Optional[int] = None):
+        self.strategy = strategy
+        self.unit = unit
+        self.eliminations = []
+        self.placements = []
+
+    def eliminate(self, puzzle: Puzzle[T], index: int, keep: int) -> None:
+        """
+        Restrict the candidates of a cell and record the eliminations and any resulting placement
+
+        The change is applied before a contradiction is raised, so the puzzle is left in the state that caused it.
+
+        Args:
+            puzzle (Puzzle[T]): The sudoku puzzle
+            index (int): The index of the cell
+            keep (int): The mask of the candidates that may remain
+
+        Raises:
+            Contradiction: If the cell is left without candidates, or its value is already placed in one of its units
+        """
+        mask = puzzle._masks[index]
+        removed = mask & ~keep
+        if removed:
+            puzzle._set_mask(index, mask & keep)
+            self.eliminations.extend((index, d) for d in digits(removed))
+            if not mask & keep:
+                raise Contradiction(Contradiction.EMPTY, index)
+            value = puzzle._values[index]
+            if value:
+                self.placements.append((index, value))
+                width = puzzle.order + 1
+                for u in puzzle.topology.cell_units[index]:
+                    if puzzle._counts[u * width + value] > 1:
+                        raise Contradiction(Contradiction.DUPLICATE, u, value)
+
+    def __bool__(self) -> bool:
+        return bool(self.eliminations)
+
+    def __repr__(self) -> str:
+        return (
+            f"Step({self.strategy!r}, unit={self.unit}, eliminations={self.eliminations}, "
+            f"placements={self.placements})"
+        )
+
+
+class Strategy(ABC):
     """
     Also known as a [Solving Technique](http://sudopedia.enjoysudoku.com/Solving_Technique.html)
 
+    Subclasses implement `steps`. Strategies written before steps existed, which only override `__call__`, keep
+    working: their pass is run as a whole and reported as a single step.
+
     Attributes:
         name (str): The name of the strategy
         difficulty (float): The difficulty rating of the strategy defined with
@@ -25,6 +135,25 @@ class Strategy:
         self.name = name if name is not None else self.__class__.__name__
         self.difficulty = difficulty
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # ABCMeta collects the abstract methods after this hook, so a legacy strategy is no longer abstract
+        if cls.steps is Strategy.steps and cls.__call__ is not Strategy.__call__:
+            cls.steps = Strategy._legacy_steps  # type: ignore[assignment]
+
+    def _legacy_steps(self, puzzle: Puzzle[T]) -> Iterator[Step]:
+        # The changes made by an overridden __call__, recorded as one step once the pass is over
+        masks = puzzle._masks[:]
+        values = puzzle._values[:]
+        self(puzzle)
+        step = Step(self.name)
+        for i, (before, after) in enumerate(zip(masks, puzzle._masks)):
+            step.eliminations.extend((i, d) for d in digits(before & ~after))
+            if puzzle._values[i] and not values[i]:
+                step.placements.append((i, puzzle._values[i]))
+        if step:
+            yield step
+
     def __call__(self, puzzle: Puzzle[T]) -> int:
         """
         Apply the strategy to a given sudoku puzzle
@@ -32,10 +161,34 @@ class Strategy:
         Args:
             puzzle (Puzzle[T]): The sudoku puzzle
 
+        Raises:
+            Contradiction: As soon as the pass finds that the puzzle has no solution, so callers that may apply
+                strategies to unsolvable puzzles must catch it
+
         Returns:
             int: The number of candidates eliminated by the strategy with a
                 single pass over the sudoku puzzle
         """
+        return sum(len(step.eliminations) for step in self.steps(puzzle))
+
+    @abstractmethod
+    def steps(self, puzzle: Puzzle[T]) -> Iterator[Step]:
+        """
+        Apply the strategy to a given sudoku puzzle one step at a time
+
+        Each step is applied to the puzzle before it is yielded, so stopping early leaves the rest of the pass
+        undone.
+
+        Args:
+            puzzle (Puzzle[T]): The sudoku puzzle
+
+        Raises:
+            Contradiction: As soon as the pass finds that the puzzle has no solution
+
+        Yields:
+            Step: Every productive step of a single pass over the sudoku puzzle
+        """
+        ...
 
 
-__all__ = ("Strategy",)
+__all__ = ("Strategy", "Step", "Contradiction")
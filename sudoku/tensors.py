@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from itertools import chain
+from typing import TYPE_CHECKING, Sequence
+
+import numpy as np
+
+from .bitset import single
+
+if TYPE_CHECKING:
+    from .puzzle import Puzzle, T
+
+
+def _unpack(masks: np.ndarray, order: int) -> np.ndarray:
+    # Expand the last axis of packed masks into one boolean per candidate
+    if masks.dtype == np.uint64:
+        return ((masks[..., None] >> np.arange(order, dtype=np.uint64)) & np.uint64(1)).astype(bool)
+    width = (order + 7) // 8
+    raw = np.frombuffer(b"".join(m.to_bytes(width, "little") for m in masks.ravel().tolist()), dtype=np.uint8)
+    bits = np.unpackbits(raw.reshape(-1, width), axis=1, count=order, bitorder="little")
+    return bits.reshape(masks.shape + (order,)).astype(bool)
+
+
+def _pack(candidates: np.ndarray) -> np.ndarray:
+    # Collapse the last axis of booleans into masks, as uint64 when they fit and Python ints otherwise
+    order = candidates.shape[-1]
+    if order <= 64:
+        weights = np.left_shift(np.uint64(1), np.arange(order, dtype=np.uint64))
+        return np.bitwise_or.reduce(candidates.astype(np.uint64) * weights, axis=-1)
+    raw = np.packbits(candidates.astype(bool), axis=-1, bitorder="little")
+    flat = [int.from_bytes(row.tobytes(), "little") for row in raw.reshape(-1, raw.shape[-1])]
+    return np.array(flat, dtype=object).reshape(candidates.shape[:-1])
+
+
+def to_candidates(puzzles: Sequence[Puzzle[T]], packed: bool = False) -> np.ndarray:
+    """
+    Export the candidates of a batch of puzzles of the same order as a tensor
+
+    Candidate `d` of a cell, the token with integer alias `d`, is found at position `d - 1` of the last axis, and a
+    filled cell has its value as its only candidate.
+
+    Args:
+        puzzles (Sequence[Puzzle[T]]): The puzzles to export
+        packed (bool, optional): Whether to export the bitmask of every cell instead of one boolean per candidate.
+            Defaults to False.
+
+    Raises:
+        ValueError: If the puzzles differ in order, or packed masks are requested for an order above 64
+
+    Returns:
+        np.ndarray: A boolean tensor of shape (K, order, order, order), or an array of uint64 masks of shape
+            (K, order, order) when packed
+    """
+    if not puzzles:
+        return np.zeros((0, 0, 0) if packed else (0, 0, 0, 0), dtype=np.uint64 if packed else bool)
+    order = puzzles[0].order
+    if any(puzzle.order != order for puzzle in puzzles):
+        raise ValueError("Only puzzles of the same order can be exported together")
+    if packed and order > 64:
+        raise ValueError(f"The candidates of a puzzle of order {order} do not fit in 64 bits")
+
+    cells = chain.from_iterable(puzzle._masks for puzzle in puzzles)
+    if order <= 64:
+        masks = np.fromiter(cells, dtype=np.uint64, count=len(puzzles) * order * order)
+    else:
+        masks = np.array(list(cells), dtype=object)
+    masks = masks.reshape(len(puzzles), order, order)
+    return masks if packed else _unpack(masks, order)
+
+
+def load_candidates(puzzles: Sequence[Puzzle[T]], candidates: np.ndarray) -> None:
+    """
+    Replace the candidates of a batch of puzzles with those of a tensor
+
+    Cells left with a single candidate take it as their value, and the tokens of the puzzles are kept.
+
+    Args:
+        puzzles (Sequence[Puzzle[T]]): The puzzles to update
+        candidates (np.ndarray): A boolean tensor of shape (K, order, order, order), or an array of masks of shape
+            (K, order, order)
+
+    Raises:
+        ValueError: If the tensor does not match the puzzles
+    """
+    shape = candidates.shape
+    if candidates.ndim == 4:
+        candidates = _pack(candidates)
+    if len(candidates) != len(puzzles):
+        raise ValueError(f"Candidates of shape {shape} do not fit {len(puzzles)} puzzles")
+    for k, puzzle in enumerate(puzzles):
+        if shape[1:] != (puzzle.order,) * (len(shape) - 1):
+            raise ValueError(f"Candidates of shape {shape} do not fit a puzzle of order {puzzle.order}")
+        masks = candidates[k].ravel().tolist()
+        if any(m >> puzzle.order for m in masks):
+            raise ValueError(f"A puzzle of order {puzzle.order} has no more than {puzzle.order} candidates")
+        puzzle._masks = masks
+        puzzle._values = [single(m) for m in masks]
+        puzzle._exports.clear()
+        puzzle._track()
+
+
+__all__ = ("to_candidates", "load_candidates")
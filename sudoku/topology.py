@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from math import isqrt
+from typing import Any, List, Optional, Sequence, Tuple
+
+
+class Topology:
+    """
+    The units of a sudoku puzzle along with the relations derived from them, which are computed once and shared by
+    every puzzle, strategy and solver using the same layout.
+
+    A unit is a group of `order` cells that must hold every token exactly once. Rows and columns are always units,
+    boxes are units for standard puzzles, and variants add units of their own, such as the diagonals of an
+    X-sudoku or the irregular regions of a jigsaw sudoku.
+
+    Attributes:
+        order (int): The number of cells in every unit
+        units (Tuple[Tuple[int, ...], ...]): The cell indices of every unit, starting with the rows and columns
+        cell_units (Tuple[Tuple[int, ...], ...]): The unit indices of every cell in increasing order
+        peers (Tuple[Tuple[int, ...], ...]): The indices of the cells sharing a unit with every cell
+        box_shape (Optional[Tuple[int, int]]): The number of rows and columns in each box, or None if the
+            puzzle does not have rectangular boxes
+        kinds (Tuple[str, ...]): The kind of every unit, told from its cells: `ROW`, `COLUMN`, `BOX` or `OTHER`
+    """
+
+    ROW = "row"
+    COLUMN = "column"
+    BOX = "box"
+    OTHER = "other"
+
+    __slots__ = "order", "units", "cell_units", "peers", "box_shape", "kinds", "_key", "_hash"
+
+    order: int
+    units: Tuple[Tuple[int, ...], ...]
+    cell_units: Tuple[Tuple[int, ...], ...]
+    peers: Tuple[Tuple[int, ...], ...]
+    box_shape: Optional[Tuple[int, int]]
+    kinds: Tuple[str, ...]
+    _key: Tuple[Any, ...]
+
+    def __init__(
+        self,
+        order: int,
+        units: Sequence[Sequence[int]],
+        box_shape: Optional[Tuple[int, int]] = None,
+        key: Optional[Tuple[Any, ...]] = None,
+    ):
+        """
+        Args:
+            order (int): The number of cells in every unit
+            units (Sequence[Sequence[int]]): The cell indices of every unit
+            box_shape (Optional[Tuple[int, int]], optional): The number of rows and columns in each box.
+                Defaults to None.
+            key (Optional[Tuple[Any, ...]], optional): A description of how the topology was built, used to compare and
+                transform topologies cheaply. Defaults to a custom topology.
+
+        Raises:
+            ValueError: If a unit does not contain `order` distinct cells of the grid
+        """
+        size = order * order
+        self.order = order
+        self.units = tuple(tuple(unit) for unit in units)
+        for unit in self.units:
+            if len(unit) != order or len(set(unit)) != order or not all(0 <= i < size for i in unit):
+                raise ValueError(f"A unit of order {order} must contain {order} distinct cells: {unit}")
+
+        cell_units: List[List[int]] = [[] for _ in range(size)]
+        for u, unit in enumerate(self.units):
+            for i in unit:
+                cell_units[i].append(u)
+        self.cell_units = tuple(tuple(us) for us in cell_units)
+        self.peers = tuple(
+            tuple(sorted({p for u in us for p in self.units[u]} - {i})) for i, us in enumerate(self.cell_units)
+        )
+        self.box_shape = box_shape
+        self.kinds = tuple(self._kind(unit) for unit in self.units)
+        self._key = key if key is not None else ("units",)
+        self._hash = hash(self.units)
+
+    def _kind(self, unit: Tuple[int, ...]) -> str:
+        rows = {i // self.order for i in unit}
+        cols = {i % self.order for i in unit}
+        if len(rows) == 1:
+            return Topology.ROW
+        if len(cols) == 1:
+            return Topology.COLUMN
+        if self.box_shape is not None:
+            # A unit of `order` distinct cells spanning as many rows and columns as a box is a rectangle
+            height, width = self.box_shape
+            if (len(rows), len(cols)) == (height, width) and min(rows) % height == 0 and min(cols) % width == 0:
+                return Topology.BOX
+        return Topology.OTHER
+
+    def unit(self, index: int, kind: str) -> Optional[int]:
+        """
+        The unit of a given kind that contains a cell
+
+        Args:
+            index (int): The index of the cell
+            kind (str): The kind of unit, one of `ROW`, `COLUMN` or `BOX`
+
+        Returns:
+            Optional[int]: The index of the unit, or None if no unit of that kind contains the cell
+        """
+        return next((u for u in self.cell_units[index] if self.kinds[u] == kind), None)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Topology):
+            return NotImplemented
+        return self is other or (self._hash == other._hash and self.units == other.units)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self):
+        kind = self._key[0]
+        if kind == "standard":
+            return Topology.standard, (self.order, self.box_shape)
+        if kind == "diagonal":
+            return Topology.diagonal, (self.order, self.box_shape)
+        return Topology, (self.order, self.units, self.box_shape)
+
+    def __repr__(self) -> str:
+        return f"Topology({self._key[0]}, order={self.order}, box_shape={self.box_shape})"
+
+    @staticmethod
+    def default_box_shape(order: int) -> Tuple[int, int]:
+        """
+        The most square box shape for a given order, with no more rows than columns
+
+        Args:
+            order (int): The number of cells in every unit
+
+        Raises:
+            ValueError: If the order cannot be split into boxes
+
+        Returns:
+            Tuple[int, int]: The number of rows and columns in each box
+        """
+        rows = next(r for r in range(isqrt(order), 0, -1) if order % r == 0)
+        if rows == 1 and order > 1:
+            raise ValueError(f"A puzzle of order {order} cannot be split into boxes")
+        return rows, order // rows
+
+    @staticmethod
+    def standard(order: int, box_shape: Optional[Tuple[int, int]] = None) -> Topology:
+        """
+        The topology of a puzzle with rows, columns and rectangular boxes
+
+        Args:
+            order (int): The number of cells in every unit
+            box_shape (Optional[Tuple[int, int]], optional): The number of rows and columns in each box.
+                Defaults to the most square shape.
+
+        Returns:
+            Topology: A shared topology
+        """
+        rows, cols = box_shape if box_shape is not None else Topology.default_box_shape(order)
+        return _standard(order, rows, cols)
+
+    @staticmethod
+    def diagonal(order: int, box_shape: Optional[Tuple[int, int]] = None) -> Topology:
+        """
+        The topology of an X-sudoku, where both main diagonals are units as well
+
+        Args:
+            order (int): The number of cells in every unit
+            box_shape (Optional[Tuple[int, int]], optional): The number of rows and columns in each box.
+                Defaults to the most square shape.
+
+        Returns:
+            Topology: A shared topology
+        """
+        rows, cols = box_shape if box_shape is not None else Topology.default_box_shape(order)
+        return _diagonal(order, rows, cols)
+
+    @staticmethod
+    def jigsaw(regions: Sequence[int]) -> Topology:
+        """
+        The topology of a jigsaw sudoku, where irregular regions replace the boxes
+
+        Args:
+            regions (Sequence[int]): The region of every cell, numbered from 0 to the order of the puzzle
+
+        Returns:
+            Topology: A new topology
+        """
+        order = isqrt(len(regions))
+        units = _lines(order) + [[i for i, r in enumerate(regions) if r == region] for region in range(order)]
+        return Topology(order, units)
+
+    def _transformed(self, indices: Sequence[int], swap_axes: bool) -> Topology:
+        kind = self._key[0]
+        if kind in ("standard", "diagonal") and self.box_shape is not None:
+            rows, cols = self.box_shape
+            box_shape = (cols, rows) if swap_axes else (rows, cols)
+            if kind == "standard":
+                return Topology.standard(self.order, box_shape)
+            return Topology.diagonal(self.order, box_shape)
+
+        moved = [0] * len(indices)
+        for new, old in enumerate(indices):
+            moved[old] = new
+        shape = self.box_shape[::-1] if swap_axes and self.box_shape is not None else self.box_shape
+        return Topology(self.order, [sorted(moved[i] for i in unit) for unit in self.units], shape)
+
+
+def _lines(order: int):
+    rows = [[order * r + c for c in range(order)] for r in range(order)]
+    cols = [[order * r + c for r in range(order)] for c in range(order)]
+    return rows + cols
+
+
+def _boxes(order: int, rows: int, cols: int):
+    if rows * cols != order:
+        raise ValueError(f"Boxes of {rows}x{cols} cells do not fit a puzzle of order {order}")
+    return [
+        [order * (rows * (b // rows) + i // cols) + cols * (b % rows) + i % cols for i in range(order)]
+        for b in range(order)
+    ]
+
+
+@lru_cache(maxsize=None)
+def _standard(order: int, rows: int, cols: int) -> Topology:
+    return Topology(order, _lines(order) + _boxes(order, rows, cols), (rows, cols), ("standard", order, rows, cols))
+
+
+@lru_cache(maxsize=None)
+def _diagonal(order: int, rows: int, cols: int) -> Topology:
+    diagonals = [[order * i + i for i in range(order)], [order * i + (order - 1 - i) for i in range(order)]]
+    return Topology(
+        order, _lines(order) + _boxes(order, rows, cols) + diagonals, (rows, cols), ("diagonal", order, rows, cols)
+    )
+
+
+__all__ = ("Topology",)
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from math import isqrt
+from typing import List, NamedTuple, Optional, Sequence, Tuple, Union, cast
+
+import numpy as np
+
+from .topology import Topology
+
+Boards = Union[np.ndarray, Sequence[str], Sequence[bytes]]
+
+CHUNK_SIZE = 4096
+"""The number of submissions checked by each call of the kernel, which bounds the size of its temporary arrays"""
+
+
+def as_array(boards: Boards, tokens: Optional[str] = None, blank: str = ".") -> np.ndarray:
+    """
+    Convert a batch of boards to an array of integer aliases
+
+    Args:
+        boards (Boards): An array of aliases of shape (K, order, order) or (K, order ** 2), a sequence of bytes
+            holding one alias per cell, or a sequence of strings of tokens
+        tokens (Optional[str], optional): The tokens of string boards, where the alias of `tokens[i]` is `i + 1`.
+            Required for string boards.
+        blank (str, optional): The token of blank cells in string boards. Defaults to ".".
+
+    Raises:
+        ValueError: If string boards are given without their tokens
+
+    Returns:
+        np.ndarray: An array of shape (K, order ** 2) in which unknown tokens have an alias greater than the order
+    """
+    if isinstance(boards, np.ndarray):
+        return boards.reshape(len(boards), -1)
+    if len(boards) == 0:
+        return np.zeros((0, 0), dtype=np.int16)
+    if isinstance(boards[0], (bytes, bytearray, memoryview)):
+        return np.frombuffer(b"".join(cast(Sequence[bytes], boards)), dtype=np.uint8).reshape(len(boards), -1)
+    if isinstance(boards[0], str):
+        if tokens is None:
+            raise ValueError("The tokens of string boards are required")
+        codes = np.frombuffer("".join(cast(Sequence[str], boards)).encode("utf-32-le"), dtype=np.uint32).reshape(
+            len(boards), -1
+        )
+        lookup = np.full(max(map(ord, tokens + blank)) + 2, len(tokens) + 1, dtype=np.int16)
+        lookup[[ord(t) for t in tokens]] = np.arange(1, len(tokens) + 1)
+        lookup[ord(blank)] = 0
+        return lookup[np.minimum(codes, len(lookup) - 1)]
+    return np.asarray(boards).reshape(len(boards), -1)
+
+
+class Validation(NamedTuple):
+    """
+    The verdicts of a batch of submissions, with a row of cell flags for every submission
+
+    Attributes:
+        valid (np.ndarray): Whether each submission is a solution of its puzzle, of shape (K,)
+        missing (np.ndarray): The cells that are blank or hold an unknown token, of shape (K, order ** 2)
+        mismatched (np.ndarray): The cells that contradict a clue of the puzzle, of shape (K, order ** 2)
+        duplicated (np.ndarray): The cells whose value appears more than once in one of their units,
+            of shape (K, order ** 2)
+    """
+
+    valid: np.ndarray
+    missing: np.ndarray
+    mismatched: np.ndarray
+    duplicated: np.ndarray
+
+    def offending(self, k: int) -> List[int]:
+        """
+        The cells of a submission that keep it from being a solution
+
+        Args:
+            k (int): The position of the submission in the batch
+
+        Returns:
+            List[int]: The sorted indices of the offending cells
+        """
+        return np.flatnonzero(self.missing[k] | self.mismatched[k] | self.duplicated[k]).tolist()
+
+
+@lru_cache(maxsize=None)
+def _unit_positions(topology: Topology) -> np.ndarray:
+    # Every cell's positions in the flattened units, padded with the position one past the end
+    size = len(topology.units) * topology.order
+    positions: List[List[int]] = [[] for _ in range(topology.order ** 2)]
+    for u, unit in enumerate(topology.units):
+        for j, i in enumerate(unit):
+            positions[i].append(u * topology.order + j)
+    width = max(map(len, positions))
+    return np.array([p + [size] * (width - len(p)) for p in positions], dtype=np.intp)
+
+
+def _duplicates(values: np.ndarray, units: np.ndarray, topology: Topology) -> np.ndarray:
+    count = len(values)
+    width = topology.order + 1
+    grouped = values[:, units]
+    offsets = np.arange(count * len(units), dtype=np.intp).reshape(count, len(units), 1) * width
+    counts = np.bincount((grouped + offsets).ravel(), minlength=count * len(units) * width)
+    repeated = (counts[grouped + offsets] > 1) & (grouped != 0)
+    repeated = np.concatenate([repeated.reshape(count, -1), np.zeros((count, 1), dtype=bool)], axis=1)
+    return np.logical_or.reduce(repeated[:, _unit_positions(topology)], axis=2)
+
+
+def _check(
+    puzzles: np.ndarray, submissions: np.ndarray, topology: Topology
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # The missing, mismatched and duplicated cells of a chunk. Only the elementwise comparisons release the GIL;
+    # the fancy indexing, bincount and reductions hold it
+    order = topology.order
+    missing = (submissions < 1) | (submissions > order)
+    mismatched = (puzzles != 0) & (puzzles != submissions) & ~missing
+
+    values = np.where(missing, 0, submissions)
+    units = np.array(topology.units, dtype=np.intp)
+    suspect = missing.any(axis=1)
+    if order < 64:
+        # A complete unit holds every value exactly once if and only if the union of its values is full
+        dtype = np.uint16 if order < 16 else np.uint32 if order < 32 else np.uint64
+        bits = np.left_shift(dtype(1), values.astype(dtype))
+        seen = bits[:, units[:, 0]]
+        for j in range(1, order):
+            seen |= bits[:, units[:, j]]
+        suspect |= (seen != dtype(((1 << order) - 1) << 1)).any(axis=1)
+        rows = np.flatnonzero(suspect)
+    else:
+        rows = np.arange(len(submissions))
+
+    duplicated = np.zeros_like(missing)
+    if len(rows):
+        duplicated[rows] = _duplicates(values[rows], units, topology)
+
+    return missing, mismatched, duplicated
+
+
+def validate(
+    puzzles: Boards,
+    submissions: Boards,
+    topology: Optional[Topology] = None,
+    tokens: Optional[str] = None,
+    blank: str = ".",
+    workers: Optional[int] = None,
+) -> Validation:
+    """
+    Check a batch of submitted grids against their puzzles at once
+
+    A submission is valid when every cell holds a token, every clue of its puzzle is kept and no value repeats
+    within a unit. Every check is an array operation over a chunk of the batch, so no `Puzzle` is built, and the
+    duplicated cells are only located for submissions whose units are not all complete. The chunks of a large
+    batch can be checked on several threads at once, but NumPy only releases the GIL for the elementwise
+    comparisons, so the indexing and counting steps still run one thread at a time.
+
+    ```python
+    result = validate(puzzles, submissions, tokens="123456789")
+    for k in np.flatnonzero(~result.valid):
+        print(k, result.offending(k))
+    ```
+
+    Args:
+        puzzles (Boards): The puzzles, in any of the forms accepted by `as_array`
+        submissions (Boards): The submitted grids, one per puzzle, in any of the forms accepted by `as_array`
+        topology (Optional[Topology], optional): The units shared by every puzzle. Defaults to the standard layout.
+        tokens (Optional[str], optional): The tokens of string boards. Required for string boards.
+        blank (str, optional): The token of blank cells in string boards. Defaults to ".".
+        workers (Optional[int], optional): The number of threads checking chunks of `CHUNK_SIZE` submissions.
+            Defaults to None, which checks them on the calling thread.
+
+    Raises:
+        ValueError: If the batches differ in shape or do not fit the topology
+
+    Returns:
+        Validation: The verdicts of the submissions
+    """
+    puzzles = as_array(puzzles, tokens, blank).astype(np.int16, copy=False)
+    submissions = as_array(submissions, tokens, blank).astype(np.int16, copy=False)
+    if puzzles.shape != submissions.shape:
+        raise ValueError(f"Puzzles of shape {puzzles.shape} do not match submissions of shape {submissions.shape}")
+    count, size = submissions.shape
+    order = isqrt(size)
+    if topology is None:
+        topology = Topology.standard(order)
+    if topology.order ** 2 != size:
+        raise ValueError(f"Boards of {size} cells do not fit {topology}")
+
+    chunks = [slice(k, k + CHUNK_SIZE) for k in range(0, count, CHUNK_SIZE)] or [slice(0, 0)]
+    if workers is not None and workers > 1 and len(chunks) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(workers) as executor:
+            parts = list(executor.map(lambda c: _check(puzzles[c], submissions[c], topology), chunks))
+    else:
+        parts = [_check(puzzles[c], submissions[c], topology) for c in chunks]
+    missing, mismatched, duplicated = (np.concatenate(arrays) for arrays in zip(*parts))
+
+    valid = ~(missing | mismatched | duplicated).any(axis=1)
+    return Validation(valid, missing, mismatched, duplicated)
+
+
+__all__ = ("Validation", "as_array", "validate", "CHUNK_SIZE")
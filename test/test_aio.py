@@ -0,0 +1,57 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from sudoku.aio import SolveService, _services, solve_async, solve_stream
+
+from .test_solve import prompts
+
+
+def test_solve_async():
+    async def main():
+        result = await solve_async(prompts["boards"][2])
+        assert result.solved
+        assert "".join(result.solution) == prompts["solutions"][2]
+
+        results = [result async for result in solve_stream(prompts["boards"] + prompts["unsolvable"])]
+        assert [r.solved for r in results] == [True] * len(prompts["boards"]) + [False] * len(prompts["unsolvable"])
+        assert ["".join(r.solution) for r in results if r.solved] == prompts["solutions"]
+
+    asyncio.run(main())
+    service = next(iter(_services.values()))
+    assert service._executor is not None
+
+    asyncio.run(main())
+    assert service._executor is None and service not in _services.values()
+
+
+def test_backpressure():
+    async def main():
+        with ThreadPoolExecutor(2) as executor:
+            async with SolveService(executor, max_in_flight=3, batch_size=2) as service:
+                peak = 0
+
+                async def boards():
+                    nonlocal peak
+                    for board in prompts["boards"] * 4:
+                        peak = max(peak, service.in_flight)
+                        yield board
+
+                results = [result async for result in service.stream(boards())]
+                assert len(results) == len(prompts["boards"]) * 4
+                assert all(result.solved for result in results)
+                assert peak <= 3
+                assert service.in_flight == 0
+
+                good, bad = await asyncio.gather(
+                    service.solve(prompts["boards"][0]), service.solve("1.34.41..3.14.2"), return_exceptions=True
+                )
+                assert good.solved and isinstance(bad, ValueError)
+
+                with pytest.raises(asyncio.TimeoutError):
+                    await service.solve(prompts["boards"][4], timeout=0)
+                await asyncio.sleep(0.05)
+                assert service.in_flight == 0
+
+    asyncio.run(main())
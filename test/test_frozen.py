@@ -0,0 +1,51 @@
+import pickle
+
+from sudoku import FrozenPuzzle, Puzzle, Topology
+
+board = ".234.6789.567.9123.891.3456.345.7891.678.1234.912.4567.456.8912.789.2345.123.5678"
+
+
+def test_value_semantics():
+    frozen = Puzzle(board, ".").freeze()
+    assert frozen == Puzzle(board, ".").freeze()
+    assert hash(frozen) == hash(Puzzle(board, ".").freeze())
+    assert len({frozen, Puzzle(board, ".").freeze()}) == 1
+    assert frozen.tokens is Puzzle(board, ".").freeze().tokens
+
+    puzzle = Puzzle(board, ".")
+    puzzle.solve()
+    assert puzzle.freeze() != frozen
+    assert puzzle.freeze() not in {frozen}
+
+    diagonal = Puzzle("1.34.41..3.14.23", ".", Topology.diagonal(4)).freeze()
+    assert diagonal != Puzzle("1.34.41..3.14.23", ".").freeze()
+
+    a, b = Puzzle("1234341223414123", "."), Puzzle(".234341223414123", ".")
+    b.solve()
+    assert a.to_string() == b.to_string()
+    assert a.freeze() == b.freeze() and len({a.freeze(), b.freeze()}) == 1
+    assert a.freeze().tokens is b.freeze().tokens and b.freeze().thaw().to_string() == a.to_string()
+
+
+def test_round_trip():
+    frozen = Puzzle(board, ".").freeze()
+    assert len(frozen) == 81
+    assert "".join(frozen) == board == frozen.to_string()
+    assert frozen[0] == "." and frozen[1] == "2"
+
+    puzzle = frozen.thaw()
+    assert puzzle.to_string() == board
+    assert puzzle.topology is Topology.standard(9)
+    assert puzzle.solve()
+    assert Puzzle(board, ".").freeze() == frozen
+
+    jigsaw = Topology.jigsaw([0, 0, 0, 1, 2, 0, 1, 1, 2, 2, 3, 1, 2, 3, 3, 3])
+    frozen = Puzzle("1.34.41..3.14.23", ".", jigsaw).freeze()
+    assert frozen.thaw().topology == jigsaw
+
+
+def test_pickle():
+    frozen = FrozenPuzzle.from_puzzle(Puzzle(board, "."))
+    restored = pickle.loads(pickle.dumps(frozen))
+    assert restored == frozen
+    assert restored.thaw().to_string() == board
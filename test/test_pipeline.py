@@ -0,0 +1,48 @@
+import json
+import os
+
+from sudoku.pipeline import Pipeline, process_shard
+from sudoku.solvers import Solver
+
+from .test_solve import prompts
+
+
+def read(pipeline, index):
+    with open(pipeline.shard_path(index)) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_pipeline(tmp_path):
+    boards = prompts["boards"] + prompts["unsolvable"] + ["1234"]
+    source = tmp_path / "boards.txt"
+    source.write_text("\n".join(boards) + "\n")
+    pipeline = Pipeline(str(source), str(tmp_path / "out"), shard_size=2, workers=2, rate=True)
+
+    shards = (len(boards) + 1) // 2
+    assert pipeline.run() == shards
+    assert pipeline.completed() == set(range(shards))
+    records = [record for index in range(shards) for record in read(pipeline, index)]
+    assert [record["board"] for record in records] == boards
+    assert [record["solution"] for record in records[: len(prompts["solutions"])]] == prompts["solutions"]
+    assert all(record["solution"] is None for record in records[len(prompts["solutions"]) : -1])
+    assert all(0 <= record["rating"] <= 1 for record in records[:-1])
+    assert "error" in records[-1]
+
+    assert pipeline.run() == 0
+    os.remove(pipeline.shard_path(1))
+    assert pipeline.completed() == set(range(shards)) - {1}
+    assert pipeline.run() == 1
+    assert not any(name.endswith(".tmp") for name in os.listdir(pipeline.output))
+
+
+class Failing(Solver):
+    def solve(self, puzzle):
+        if puzzle.cells[0].is_blank():
+            raise RuntimeError("no luck")
+        return True
+
+
+def test_failing_board():
+    records = process_shard(["1.34.41..3.14.23", ".234341223414123"], ".", Failing, rate=False)
+    assert records[0] == {"board": "1.34.41..3.14.23", "solution": "1.34.41..3.14.23"}
+    assert records[1] == {"board": ".234341223414123", "error": "RuntimeError: no luck"}
@@ -1,4 +1,11 @@
+import random
+import subprocess
+import sys
+
+import pytest
+
 from sudoku import Puzzle
+from sudoku.examples.benchmark import IMPORT_BUDGET, import_time
 
 prompts = {
     "string": {
@@ -172,3 +179,61 @@ def test_shuffle():
         puzzle = Puzzle(prompts["string"][order], ".")
         puzzle.shuffle()
         assert puzzle.has_solution()
+
+        seeded = [Puzzle(prompts["string"][order], ".") for _ in range(3)]
+        seeded[0].shuffle(7)
+        seeded[1].shuffle(random.Random(7))
+        seeded[2].shuffle(7)
+        assert seeded[0]._values == seeded[1]._values == seeded[2]._values
+
+
+def test_conflicts():
+    puzzle = Puzzle("12341...2341....", ".")
+    assert puzzle.has_conflicts()
+    assert puzzle.conflicts() == [0, 4]
+    puzzle.cells[4].value = 0
+    assert not puzzle.has_conflicts()
+    assert puzzle.conflicts() == []
+    puzzle.cells[5].value = 2
+    assert puzzle.conflicts() == [1, 5]
+    puzzle.transpose()
+    assert puzzle.conflicts() == [4, 5]
+
+
+def test_candidates():
+    cell = Puzzle("1.34.41..3.14.23", ".").cells[1]
+    assert cell.candidates == {1, 2, 3, 4}
+    with pytest.raises(AttributeError):
+        cell.candidates.discard(2)
+    assert cell.remove_candidate(2) and not cell.remove_candidate(2)
+    cell.candidates = cell.candidates - {3}
+    assert cell.candidates == {1, 4} and cell.mask == 0b1001
+
+
+def test_cached_exports():
+    puzzle = Puzzle(prompts["string"]["4"], ".")
+    formatted = puzzle.to_formatted_string()
+    assert puzzle.to_formatted_string() is formatted
+    assert str(puzzle) == prompts["string"]["4"]
+    assert bytes(puzzle) == prompts["string"]["4"].encode()
+
+    puzzle.cells[1].value = 3
+    assert str(puzzle) == "1434" + prompts["string"]["4"][4:]
+    assert puzzle.to_formatted_string() != formatted
+    puzzle.tokens.swap(1, 3)
+    assert str(puzzle) == "4131" + prompts["string"]["4"][4:].translate(str.maketrans("14", "41"))
+    puzzle.rotate(2)
+    assert puzzle.to_1D() == list(str(puzzle))
+
+
+def test_array_exports():
+    pytest.importorskip("numpy")
+    puzzle = Puzzle(prompts["string"]["4"], ".")
+    assert puzzle.to_array().tolist() == prompts["2D"]["4"]
+    assert puzzle.to_array(aliases=True)[0].tolist() == [1, 0, 2, 3]
+
+
+def test_lazy_numpy():
+    script = "import sys, sudoku, sudoku.aio, sudoku.solvers; print('numpy' in sys.modules)"
+    assert subprocess.check_output([sys.executable, "-c", script]).strip() == b"False"
+    assert import_time() < IMPORT_BUDGET
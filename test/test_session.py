@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from sudoku import Puzzle
+from sudoku.session import Session
+from sudoku.solvers import BacktrackingSolver
+
+board = "...1.5...14....67..8...24...63.7..1.9.......3.1..9.52...72...8..26....35...4.9..."
+solution = "672145398145983672389762451263574819958621743714398526597236184426817935831459267"
+
+
+def rebuilt(session):
+    puzzle = session.puzzle
+    masks = []
+    for i, cell in enumerate(puzzle.cells):
+        if cell.value:
+            masks.append(1 << (cell.value - 1))
+        else:
+            seen = {puzzle.cells[p].value for p in puzzle.topology.peers[i]}
+            masks.append(sum(1 << (d - 1) for d in range(1, 10) if d not in seen))
+    return masks
+
+
+def test_edits():
+    session = Session(Puzzle(board, "."))
+    tokens = session.puzzle.tokens
+    blanks = [i for i, t in enumerate(board) if t == "."]
+    assert session.is_solvable() and not session.is_solved()
+    assert {tokens[d] for d in session.candidates(blanks[0])} == {"2", "3", "6", "7"}
+
+    with pytest.raises(ValueError):
+        session.place(3, 2)
+
+    rng = random.Random(0)
+    for _ in range(300):
+        i = rng.choice(blanks)
+        session.place(i, rng.randrange(10))
+        assert [session.mask(j) for j in range(81)] == rebuilt(session)
+        assert session.has_conflicts() == bool(session.conflicts())
+        assert session.is_solvable() == Puzzle(session.puzzle.to_1D(), ".").solve(BacktrackingSolver)
+
+    for i in blanks:
+        session.erase(i)
+    assert [session.mask(j) for j in range(81)] == rebuilt(session)
+    for i in blanks:
+        session.place(i, tokens.index(solution[i]))
+        assert session.is_solvable()
+    assert session.is_solved()
+    assert session.solution() == [tokens.index(t) for t in solution]
@@ -1,4 +1,24 @@
-from sudoku import Puzzle
+import itertools
+import random
+
+import pytest
+
+from sudoku import Puzzle, Topology
+from sudoku.sat import CDCL, solve_external
+from sudoku.solvers import AutoSolver, BacktrackingSolver, ParallelSolver, SATSolver, StrategySolver, strategy_solver
+from sudoku.solvers.parallel_solver import split
+from sudoku.solvers.strategy_solver import essential_strategies
+from sudoku.strategies import (
+    AlternatingInferenceChain,
+    Contradiction,
+    HiddenSingle,
+    PatternOverlay,
+    RefreshCandidates,
+    Strategy,
+    XChain,
+    XYChain,
+    pattern_overlay,
+)
 
 prompts = {
     "boards": [
@@ -38,3 +58,277 @@ def test_unsolvable():
         assert not puzzle.is_solved()
         assert not puzzle.has_solution()
         assert not bool(puzzle.solve())
+
+
+def test_contradiction():
+    assert Puzzle(prompts["boards"][0], ".").contradiction() is None
+    assert Puzzle(prompts["unsolvable"][0], ".").contradiction().reason == Contradiction.DUPLICATE
+
+    puzzle = Puzzle("123....4........", ".")
+    assert puzzle.contradiction() is None
+    with pytest.raises(Contradiction):
+        RefreshCandidates()(puzzle.copy())
+    assert not puzzle.solve()
+    assert puzzle.contradiction().reason == Contradiction.DUPLICATE
+    assert puzzle.rate() == 1.0
+
+    puzzle = Puzzle("1...............", ".")
+    for i in (1, 2, 3):
+        puzzle.cells[i].remove_candidate(2)
+    contradiction = puzzle.contradiction()
+    assert (contradiction.reason, contradiction.digit) == (Contradiction.MISSING, 2)
+    with pytest.raises(Contradiction, match="no possible position"):
+        HiddenSingle()(puzzle)
+
+    puzzle = Puzzle("1...............", ".")
+    puzzle.cells[5].candidates = []
+    assert puzzle.contradiction().reason == Contradiction.EMPTY
+    assert not puzzle.solve()
+    assert list(puzzle.steps()) == []
+
+
+def test_unplaceable(monkeypatch):
+    # Every unit keeps a candidate for digit 1, but no template fits them, which only the overlay can tell
+    monkeypatch.setattr(strategy_solver, "essential_strategies", lambda order: (PatternOverlay(),))
+    allowed = 0x8004012104410E400C90
+    puzzle = Puzzle("." * 81, ".")
+    for i in range(81):
+        if not allowed >> i & 1:
+            puzzle.cells[i].remove_candidate(1)
+    assert puzzle.contradiction() is None
+
+    assert not puzzle.solve()
+    assert (puzzle.contradiction().reason, puzzle.contradiction().digit) == (Contradiction.UNPLACEABLE, 1)
+    assert puzzle.copy().contradiction().reason == Contradiction.UNPLACEABLE
+    puzzle.cells[0].value = 2
+    assert puzzle.contradiction() is None
+
+
+def large_board(order, blanks, seed=0):
+    width = int(order ** 0.5)
+    tokens = [str(t) for t in range(1, order + 1)]
+    board = [tokens[(width * (r % width) + r // width + c) % order] for r in range(order) for c in range(order)]
+    for i in random.Random(seed).sample(range(order ** 2), int(blanks * order ** 2)):
+        board[i] = "."
+    return board
+
+
+def test_backtracking():
+    for i in range(len(prompts["boards"])):
+        puzzle = Puzzle(prompts["boards"][i], ".")
+        assert puzzle.solve(BacktrackingSolver)
+        assert puzzle.to_string() == prompts["solutions"][i]
+    for i in range(len(prompts["unsolvable"])):
+        puzzle = Puzzle(prompts["unsolvable"][i], ".")
+        assert not puzzle.solve(BacktrackingSolver)
+
+
+def test_large_orders():
+    for order in (16, 25):
+        board = large_board(order, 0.6)
+        puzzle = Puzzle(board, ".")
+        assert puzzle.order == order
+        assert puzzle.solve(BacktrackingSolver)
+        assert puzzle.is_solved()
+        assert all(t == "." or t == s for t, s in zip(board, puzzle.to_1D()))
+
+
+def test_parallel():
+    for i in range(len(prompts["boards"])):
+        puzzle = Puzzle(prompts["boards"][i], ".")
+        assert puzzle.solve(ParallelSolver(workers=2))
+        assert puzzle.to_string() == prompts["solutions"][i]
+    for i in range(len(prompts["unsolvable"])):
+        assert not Puzzle(prompts["unsolvable"][i], ".").solve(ParallelSolver(workers=2))
+
+    board = large_board(16, 0.75)
+    puzzle = Puzzle(board, ".")
+    assert split(puzzle._masks, puzzle.topology, 8)[1]
+    assert puzzle.solve(ParallelSolver(workers=2))
+    assert puzzle.is_solved()
+    assert all(t == "." or t == s for t, s in zip(board, puzzle.to_1D()))
+
+    puzzle = Puzzle("1234............", ".")
+    solutions = ParallelSolver(workers=2, solutions=3).find(puzzle)
+    assert len({s.to_string() for s in solutions}) == 3
+    assert all(s.is_solved() and s.to_string().startswith("1234") for s in solutions)
+    assert not puzzle.is_solved()
+
+
+def test_sat(tmp_path):
+    for i in range(len(prompts["boards"])):
+        puzzle = Puzzle(prompts["boards"][i], ".")
+        assert puzzle.solve(SATSolver())
+        assert puzzle.to_string() == prompts["solutions"][i]
+    for i in range(len(prompts["unsolvable"])):
+        assert not Puzzle(prompts["unsolvable"][i], ".").solve(SATSolver())
+
+    board = large_board(36, 0.45)
+    puzzle = Puzzle(board, ".")
+    assert puzzle.solve(SATSolver())
+    assert puzzle.is_solved()
+    assert all(t == "." or t == s for t, s in zip(board, puzzle.to_1D()))
+
+    pigeons = [[3 * p + h + 1 for h in range(3)] for p in range(4)]
+    holes = [[-a[h], -b[h]] for h in range(3) for a, b in itertools.combinations(pigeons, 2)]
+    assert CDCL(12, pigeons + holes).solve() is None
+    assert CDCL(12, pigeons[:3] + holes).solve() is not None
+
+    script = tmp_path / "fake-sat"
+    script.write_text("#!/bin/sh\necho 's SATISFIABLE'\necho 'v -1 2'\necho 'v 0'\n")
+    script.chmod(0o755)
+    assert solve_external(str(script), 3, [[1, 2]]) == [-1, 2, -3]
+    with pytest.raises(ValueError):
+        SATSolver("no-such-sat-solver")
+
+
+def test_auto():
+    solver = AutoSolver(workers=1)
+    for i in range(len(prompts["boards"])):
+        puzzle = Puzzle(prompts["boards"][i], ".")
+        assert puzzle.solve(solver)
+        assert puzzle.to_string() == prompts["solutions"][i]
+    for board in prompts["unsolvable"]:
+        assert not Puzzle(board, ".").solve(solver)
+    assert Puzzle(large_board(16, 0.6), ".").solve(solver)
+
+    assert sum(solver.stats.values()) == len(prompts["boards"]) + len(prompts["unsolvable"]) + 1
+    assert solver.stats["singles"] and solver.stats["backtracking"]
+    assert solver.stats["conflict"] + solver.stats["contradiction"] == len(prompts["unsolvable"])
+    assert AutoSolver(workers=2).analyse(Puzzle(large_board(25, 0.8), "."))[0] == "parallel"
+    assert AutoSolver(workers=1).analyse(Puzzle(large_board(25, 0.8), "."))[0] == "backtracking"
+
+
+def test_minimal():
+    for board in prompts["boards"][1:]:
+        puzzle = Puzzle(board, ".")
+        clues = sum(t != "." for t in board)
+        removed = puzzle.minimize()
+        assert removed > 0 and not Puzzle(board, ".").is_minimal()
+        assert puzzle.is_minimal()
+        assert puzzle.is_minimal(workers=2)
+        assert sum(t != "." for t in puzzle.to_1D()) == clues - removed
+        assert all(t == "." or t == b for t, b in zip(puzzle.to_1D(), board))
+        assert puzzle.minimize() == 0
+
+    puzzle = Puzzle(prompts["boards"][3], ".")
+    assert not puzzle.is_minimal(workers=2)
+    minimized = puzzle.copy()
+    minimized.minimize()
+    puzzle.minimize(workers=2)
+    assert puzzle.to_string() == minimized.to_string()
+
+    assert not Puzzle("1234............", ".").is_minimal()
+    with pytest.raises(ValueError):
+        Puzzle("1234............", ".").minimize()
+
+
+def test_invalid_sizes():
+    for board in ("1.34.41..3.14.2", "123456"):
+        with pytest.raises(ValueError):
+            Puzzle(board, ".")
+    with pytest.raises(ValueError):
+        Puzzle("12345...........", ".")
+
+
+def test_steps():
+    puzzle = Puzzle(prompts["boards"][2], ".")
+    hint = puzzle.next_hint()
+    assert hint.strategy == "RefreshCandidates"
+    assert hint.eliminations
+    assert not puzzle.is_solved()
+    assert puzzle.to_string() == prompts["boards"][2]
+
+    for step in puzzle.steps():
+        assert step.eliminations
+        for i, value in step.placements:
+            assert puzzle.cells[i].value == value
+    assert puzzle.to_string() == prompts["solutions"][2]
+    assert puzzle.next_hint() is None
+
+
+def test_legacy_strategy():
+    class Peers(Strategy):
+        # Written against the interface of earlier releases, which only had __call__
+        def __call__(self, puzzle):
+            removed = 0
+            for cell in puzzle.cells:
+                if cell.is_blank():
+                    for _, peer in puzzle._peers(cell.index):
+                        removed += cell.remove_candidate(peer.value) if peer.value else 0
+            return removed
+
+    class Incomplete(Strategy):
+        pass
+
+    puzzle = Puzzle(prompts["boards"][0], ".")
+    (step,) = Peers().steps(puzzle)
+    assert step.strategy == "Peers" and len(step.eliminations) > 0 and step.placements
+    assert list(Peers().steps(puzzle)) == []
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_pattern_overlay(monkeypatch):
+    assert len(pattern_overlay.templates(Topology.standard(4))) == 16
+    assert len(pattern_overlay.templates(Topology.standard(9))) == 46656
+    assert pattern_overlay.templates(Topology.standard(16)) is None
+
+    board = "6..3.2....5.....1..........7.26............543.........8.15........4.2........7.."
+    solution = Puzzle(board, ".")
+    assert solution.solve(BacktrackingSolver)
+    puzzle = Puzzle(board, ".")
+    assert any(step.strategy == "PatternOverlay" for step in puzzle.steps())
+    assert all(v in (0, s) for v, s in zip(puzzle._values, solution._values))
+
+    puzzles = [Puzzle(b, ".") for b in prompts["boards"] + [board]]
+    counts = [PatternOverlay()(p.copy()) for p in puzzles]
+    assert PatternOverlay().apply_many([p.copy() for p in puzzles]) == counts
+    monkeypatch.setattr(pattern_overlay, "_numpy", lambda: None)
+    assert [PatternOverlay()(p.copy()) for p in puzzles] == counts
+
+    board = large_board(16, 0.7)
+    puzzle = Puzzle(board, ".")
+    assert PatternOverlay()(puzzle) > 0
+    assert puzzle.solve(BacktrackingSolver)
+    assert all(t == "." or t == s for t, s in zip(board, puzzle.to_1D()))
+
+
+def test_chains():
+    board = "....14....3....2...7..........9...3.6.1.............8.2.....1.4....5.6.....7.8..."
+    solution = Puzzle(board, ".")
+    assert solution.solve(BacktrackingSolver)
+    puzzle = Puzzle(board, ".")
+    assert puzzle.solve()
+    assert puzzle.to_string() == solution.to_string()
+    assert 0 < Puzzle(board, ".").rate() < 1
+    assert any(step.strategy == "XChain" for step in Puzzle(board, ".").steps())
+
+    board = "...1.2....6.....7...8...9..4.......3.5...7...2...8...1..9...8.5.7.....6....3.4..."
+    solution = Puzzle(board, ".")
+    assert solution.solve(BacktrackingSolver)
+    for strategy in (XChain(), XYChain(), AlternatingInferenceChain(), AlternatingInferenceChain(2)):
+        puzzle = Puzzle(board, ".")
+        RefreshCandidates()(puzzle)
+        for step in strategy.steps(puzzle):
+            assert all(solution._values[i] != d for i, d in step.eliminations)
+    assert XChain(0)(Puzzle(board, ".")) == 0
+
+
+def test_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    boards = prompts["boards"] * 4
+    strategies = StrategySolver()
+    auto = AutoSolver(workers=1)
+    assert essential_strategies(9) is essential_strategies(9)
+
+    def solve(board, solver):
+        puzzle = Puzzle(board, ".")
+        return puzzle.to_string() if puzzle.solve(solver) else None
+
+    serial = [solve(board, strategies) for board in boards]
+    with ThreadPoolExecutor(4) as executor:
+        assert list(executor.map(solve, boards, [strategies] * len(boards))) == serial
+        assert list(executor.map(solve, boards, [auto] * len(boards))) == prompts["solutions"] * 4
+    assert sum(auto.stats.values()) == len(boards)
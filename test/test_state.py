@@ -0,0 +1,64 @@
+from contextlib import suppress
+
+import pytest
+
+from sudoku import Puzzle, Topology
+from sudoku.state import decode, decode_many, encode, encode_many
+from sudoku.strategies import Contradiction, RefreshCandidates
+
+from .test_solve import large_board, prompts
+
+
+def assert_same(puzzle, other):
+    assert other._values == puzzle._values
+    assert other._masks == puzzle._masks
+    assert list(other.tokens) == list(puzzle.tokens)
+    assert other.topology == puzzle.topology
+    assert other.topology.box_shape == puzzle.topology.box_shape
+    assert other.conflicts() == puzzle.conflicts() and other.is_solved() == puzzle.is_solved()
+
+
+def test_round_trip():
+    puzzles = [Puzzle(board, ".") for board in prompts["boards"] + prompts["unsolvable"]]
+    for puzzle in puzzles[::2]:
+        with suppress(Contradiction):
+            RefreshCandidates()(puzzle)
+    puzzles.append(Puzzle([1, 0, 3, 4, 0, 4, 1, 0, 0, 3, 0, 1, 4, 0, 2, 3], 0, Topology.diagonal(4)))
+    puzzles.append(Puzzle("1.34.41..3.14.23", ".", Topology.jigsaw([0, 0, 0, 1, 2, 0, 1, 1, 2, 2, 3, 1, 2, 3, 3, 3])))
+    transposed = Puzzle("123456" + "." * 30, ".", Topology.standard(6, (2, 3)))
+    transposed.transpose()
+    puzzles.append(transposed)
+
+    for puzzle in puzzles:
+        data = encode(puzzle)
+        assert_same(puzzle, decode(data))
+    for puzzle, other in zip(puzzles, decode_many(encode_many(puzzles))):
+        assert_same(puzzle, other)
+    assert len(encode(puzzles[1])) < 120
+    copies = [puzzles[1].copy() for _ in range(5)]
+    assert len(encode_many(copies)) < sum(len(encode(p)) for p in copies) - 4 * 40
+
+
+def test_large_order_state():
+    puzzle = Puzzle(large_board(25, 0.5), ".")
+    RefreshCandidates()(puzzle)
+    assert_same(puzzle, decode(encode(puzzle)))
+
+
+def test_invalid_state():
+    data = encode(Puzzle(prompts["boards"][0], "."))
+    with pytest.raises(ValueError):
+        decode(b"XYZ" + data[3:])
+    with pytest.raises(ValueError):
+        decode(data[:3] + bytes([99]) + data[4:])
+    with pytest.raises(ValueError):
+        decode_many(data)
+    with pytest.raises(ValueError):
+        encode(Puzzle([(1,), (0,), (0,), (0,)], (0,)))
+    batch = encode_many([Puzzle(board, ".") for board in prompts["boards"][:2]])
+    for k in (4, 12, len(data) - 1):
+        with pytest.raises(ValueError):
+            decode(data[:k])
+    for k in (8, 20, len(batch) - 1):
+        with pytest.raises(ValueError):
+            decode_many(batch[:k])
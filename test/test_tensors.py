@@ -0,0 +1,55 @@
+import pytest
+
+from sudoku import Puzzle
+from sudoku.strategies import RefreshCandidates
+
+np = pytest.importorskip("numpy")
+
+from sudoku.tensors import load_candidates, to_candidates  # noqa: E402
+
+boards = [
+    "...1.5...14....67..8...24...63.7..1.9.......3.1..9.52...72...8..26....35...4.9...",
+    ".....4.284.6.....51...3.6.....3.1....87...14....7.9.....2.1...39.....5.767.4.....",
+]
+
+
+def test_candidates():
+    puzzles = [Puzzle(board, ".") for board in boards]
+    for puzzle in puzzles:
+        RefreshCandidates()(puzzle)
+
+    tensor = to_candidates(puzzles)
+    assert tensor.shape == (2, 9, 9, 9) and tensor.dtype == bool
+    for k, puzzle in enumerate(puzzles):
+        for i, cell in enumerate(puzzle.cells):
+            assert set(np.flatnonzero(tensor[k, i // 9, i % 9]) + 1) == cell.candidates
+
+    packed = to_candidates(puzzles, packed=True)
+    assert packed.shape == (2, 9, 9) and packed.dtype == np.uint64
+    assert packed[1].ravel().tolist() == [cell.mask for cell in puzzles[1].cells]
+    assert (puzzles[0].to_candidates() == tensor[0]).all()
+
+    fresh = [Puzzle(board, ".") for board in boards]
+    load_candidates(fresh, tensor)
+    assert [p._masks for p in fresh] == [p._masks for p in puzzles]
+    fresh[0].load_candidates(packed[1])
+    assert fresh[0]._masks == puzzles[1]._masks and fresh[0].is_solved() == puzzles[1].is_solved()
+
+    with pytest.raises(ValueError):
+        load_candidates(fresh[:1], tensor)
+    with pytest.raises(ValueError):
+        fresh[0].load_candidates(np.ones((9, 9, 8), dtype=bool))
+    assert fresh[0]._masks == puzzles[1]._masks
+
+
+def test_large_order_candidates():
+    puzzle = Puzzle([str(t) for t in range(1, 82)] * 81, ".")
+    tensor = puzzle.to_candidates()
+    assert tensor.shape == (81, 81, 81)
+    assert np.flatnonzero(tensor[0, 5]).tolist() == [5]
+    copy = Puzzle([str(t) for t in range(1, 82)] * 81, ".")
+    copy.cells[0].mask = (1 << 81) - 1
+    copy.load_candidates(tensor)
+    assert copy._masks == puzzle._masks
+    with pytest.raises(ValueError):
+        puzzle.to_candidates(packed=True)
@@ -0,0 +1,76 @@
+import pickle
+
+import pytest
+
+from sudoku import Puzzle, Topology
+from sudoku.solvers import BacktrackingSolver
+
+jigsaw_regions = [0, 0, 0, 1, 2, 0, 1, 1, 2, 2, 3, 1, 2, 3, 3, 3]
+
+
+def assert_units_valid(puzzle):
+    for unit in puzzle.topology.units:
+        assert sorted(puzzle.cells[i].value for i in unit) == list(range(1, puzzle.order + 1))
+
+
+def test_box_shapes():
+    assert Topology.default_box_shape(6) == (2, 3)
+    assert Topology.default_box_shape(12) == (3, 4)
+    with pytest.raises(ValueError):
+        Topology.default_box_shape(7)
+    with pytest.raises(ValueError):
+        Puzzle("1" + "." * 48, ".")
+
+    puzzle = Puzzle("123456" + "." * 30, ".")
+    assert puzzle.topology.box_shape == (2, 3)
+    assert puzzle.solve(BacktrackingSolver)
+    assert_units_valid(puzzle)
+    puzzle.transpose()
+    assert puzzle.topology.box_shape == (3, 2)
+    assert puzzle.is_solved()
+    puzzle.rotate()
+    assert puzzle.topology == Topology.standard(6)
+    assert puzzle.is_solved()
+
+
+def test_variants():
+    puzzle = Puzzle("123456789" + "." * 72, ".", Topology.diagonal(9))
+    assert puzzle.solve(BacktrackingSolver)
+    assert_units_valid(puzzle)
+    puzzle.reflect("vertical")
+    assert puzzle.is_solved()
+
+    puzzle = Puzzle("1234" + "." * 12, ".", Topology.jigsaw(jigsaw_regions))
+    assert puzzle.topology.box_shape is None
+    assert puzzle.solve(BacktrackingSolver)
+    assert_units_valid(puzzle)
+    puzzle.transpose()
+    assert puzzle.is_solved()
+    assert puzzle.to_formatted_string()
+
+
+def test_shared_topology():
+    assert Topology.standard(9) is Topology.standard(9)
+    assert Puzzle("." * 81, ".").topology is Puzzle("." * 81, ".").topology
+    assert pickle.loads(pickle.dumps(Topology.standard(9))) is Topology.standard(9)
+    jigsaw = Topology.jigsaw(jigsaw_regions)
+    assert pickle.loads(pickle.dumps(jigsaw)) == jigsaw
+    assert Topology.jigsaw(jigsaw_regions) != Topology.standard(4)
+
+
+def test_unit_kinds():
+    standard = Topology.standard(6, (2, 3))
+    assert standard.kinds == ("row",) * 6 + ("column",) * 6 + ("box",) * 6
+    assert standard.unit(7, Topology.BOX) == 12 and standard.unit(7, Topology.COLUMN) == 7
+    assert Topology.diagonal(4).kinds[-2:] == ("other", "other")
+
+    # Units given boxes first and without boxes are still told apart by their cells
+    units = Topology.standard(4).units
+    reordered = Topology(4, units[8:] + units[:8], (2, 2))
+    lines = Topology(4, units[:8])
+    for index in range(16):
+        assert sorted(p for p, _ in Puzzle("." * 16, ".", reordered)._box(index)) == sorted(
+            p for p, _ in Puzzle("." * 16, ".")._box(index)
+        )
+        assert list(Puzzle("." * 16, ".", lines)._box(index)) == []
+        assert len(list(Puzzle("." * 16, ".", lines)._row(index))) == 3
@@ -0,0 +1,55 @@
+import pytest
+
+from sudoku import Puzzle, Topology
+
+np = pytest.importorskip("numpy")
+
+import sudoku.validation  # noqa: E402
+from sudoku.validation import as_array, validate  # noqa: E402
+
+puzzle = "...1.5...14....67..8...24...63.7..1.9.......3.1..9.52...72...8..26....35...4.9..."
+solution = "672145398145983672389762451263574819958621743714398526597236184426817935831459267"
+
+
+def test_validate():
+    wrong_clue = "7" + solution[1:]
+    duplicate = solution[:8] + "7" + solution[9:]
+    blank = solution[:40] + "." + solution[41:]
+    swapped = solution[9:18] + solution[:9] + solution[18:]
+    result = validate([puzzle] * 5, [solution, wrong_clue, duplicate, blank, swapped], tokens="123456789")
+
+    assert result.valid.tolist() == [True, False, False, False, False]
+    assert result.offending(0) == []
+    assert result.offending(1) == [0, 1, 45]
+    assert not result.mismatched[1].any() and result.duplicated[1, 0]
+    assert result.offending(2) == [1, 8, 16, 80]
+    assert result.offending(3) == [40]
+    assert result.missing[3, 40]
+    assert result.offending(4) == [3, 5, 9, 10, 15, 16]
+    assert not result.duplicated[4].any()
+
+    aliases = Puzzle(puzzle, ".").to_array(aliases=True)
+    solved = Puzzle(puzzle, ".")
+    solved.solve()
+    batch = validate(aliases[None], solved.to_array(aliases=True)[None])
+    assert batch.valid.tolist() == [True]
+    assert validate([bytes(aliases.ravel())], [bytes(solved.to_array(aliases=True).ravel())]).valid.tolist() == [True]
+
+
+def test_variants():
+    board = "1234341221434321"
+    assert validate(["................"], [board], tokens="1234").valid.tolist() == [True]
+    assert validate(["................"], [board], Topology.diagonal(4), tokens="1234").valid.tolist() == [False]
+    assert as_array(["12x."], tokens="1234").tolist() == [[1, 2, 5, 0]]
+    assert as_array(np.zeros((3, 4, 4), dtype=np.uint8)).shape == (3, 16)
+
+
+def test_threaded(monkeypatch):
+    monkeypatch.setattr(sudoku.validation, "CHUNK_SIZE", 3)
+    duplicate = solution[:8] + "7" + solution[9:]
+    submissions = [solution, duplicate, "." * 81] * 4
+    serial = validate([puzzle] * 12, submissions, tokens="123456789")
+    threaded = validate([puzzle] * 12, submissions, tokens="123456789", workers=3)
+    assert serial.valid.tolist() == [True, False, False] * 4
+    for a, b in zip(serial, threaded):
+        assert np.array_equal(a, b)